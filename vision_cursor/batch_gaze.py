@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Toplu Bakış İşleme
+
+Kayıtlı oturum videolarından kamera ve ekran olmadan bakış izi çıkarır.
+Videolar bölümlere ayrılıp tüm çekirdeklerde paralel işlenir; her video
+için tek bir iz dosyası yazılır. FaceMesh çıktısı içerik özetine göre
+önbelleğe alınır; aynı kayıt farklı --smooth-factor veya --screen ile
+yeniden işlenirken FaceMesh çalıştırılmaz.
+
+Kullanım:
+    python batch_gaze.py kayitlar/*.mp4 --output-dir izler --workers 8
+    python batch_gaze.py kayitlar/*.mp4 --output-dir izler --smooth-factor 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modules.landmark_cache import DEFAULT_CACHE_DIR, LandmarkCache
+from modules.offline_gaze import process_files, write_trace_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kayıtlı videolardan toplu bakış izi")
+    parser.add_argument('videos', nargs='+', help="Video dosyaları")
+    parser.add_argument('--output-dir', default='.', help="İz dosyalarının klasörü")
+    parser.add_argument('--workers', type=int, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--chunk-frames', type=int, default=900, help="Bölüm başına kare")
+    parser.add_argument('--warmup', type=int, default=30,
+                        help="Bölüm başında işlenip atılan kare (yumuşatma ve FaceMesh takibi için)")
+    parser.add_argument('--screen', default="1920x1080", help="İmleç koordinatları için ekran boyutu")
+    parser.add_argument('--smooth-factor', type=int, default=8)
+    parser.add_argument('--no-flip', action='store_true', help="Kayıt zaten ayna görüntüsüyse")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Yüz noktası önbelleği klasörü")
+    parser.add_argument('--no-cache', action='store_true', help="Önbelleği kullanma")
+    args = parser.parse_args()
+
+    width, height = (int(value) for value in args.screen.lower().split('x'))
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    def progress(done, total):
+        print(f"\rBölüm {done}/{total}", end='', flush=True)
+
+    start = time.perf_counter()
+    traces = process_files(args.videos, workers=args.workers, chunk_frames=args.chunk_frames,
+                           warmup=args.warmup, screen_size=(width, height),
+                           smooth_factor=args.smooth_factor, flip=not args.no_flip,
+                           progress=progress,
+                           cache=None if args.no_cache else LandmarkCache(args.cache_dir))
+    elapsed = time.perf_counter() - start
+    print()
+
+    total_frames = 0
+    for path, trace in traces.items():
+        name = os.path.splitext(os.path.basename(path))[0]
+        output = os.path.join(args.output_dir, f"{name}.gaze.csv")
+        write_trace_csv(output, trace)
+        found = int((~np.isnan(trace['x'])).sum())
+        total_frames += len(trace['frame'])
+        source = " (önbellekten)" if trace['cached'] else ""
+        print(f"{path}: {len(trace['frame'])} kare, {found} bakış{source} -> {output}")
+
+    print(f"Toplam {total_frames} kare, {elapsed:.1f} s ({total_frames / elapsed:.0f} kare/s)")
+
+
+if __name__ == '__main__':
+    main()
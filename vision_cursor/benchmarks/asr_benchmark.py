@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Çevrimdışı Ses Tanıma Karşılaştırması
+
+Bir klasördeki ses dosyalarını (WAV/FLAC) SpeechRecognizer'ın tam işlem
+hattından (temizleme, Türkçe iyileştirmeler, komut algılama) geçirir ve her
+motor/model için şunları raporlar:
+- Kelime ve karakter hata oranı (WER/CER, düzenleme mesafesi ile)
+- Gerçek zaman faktörü (RTF = işlem süresi / ses süresi)
+- Cümle başına gecikme yüzdelikleri
+- Komut algılama doğruluğu
+- En yüksek bellek kullanımı (RSS)
+- Gürültü bastırma açıksa ses saniyesi başına CPU maliyeti
+
+Gürültü bastırmanın WER etkisini görmek için --noise-suppression both ile
+her yapılandırma açık ve kapalı çalıştırılır; --add-noise temiz kayıtlara
+belirtilen SNR'de beyaz gürültü ekler.
+
+Her ses dosyasının referans metni aynı adlı .txt dosyasındadır:
+    veri/merhaba.wav  veri/merhaba.txt
+
+Kullanım:
+    python benchmarks/asr_benchmark.py veri/ --engines openai faster-whisper \\
+        --models tiny base --output sonuclar.json
+    python benchmarks/asr_benchmark.py veri/ --noise-suppression both --add-noise 10
+"""
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+AUDIO_EXTENSIONS = ('.wav', '.flac', '.aiff', '.aif')
+
+
+def load_dataset(data_dir):
+    """(ses dosyası, referans metin) çiftlerini bul"""
+    dataset = []
+    for name in sorted(os.listdir(data_dir)):
+        base, ext = os.path.splitext(name)
+        if ext.lower() not in AUDIO_EXTENSIONS:
+            continue
+        transcript_path = os.path.join(data_dir, base + '.txt')
+        if not os.path.exists(transcript_path):
+            print(f"Referans metin yok, atlanıyor: {name}")
+            continue
+        with open(transcript_path, encoding='utf-8') as f:
+            reference = f.read().strip()
+        dataset.append((os.path.join(data_dir, name), reference))
+    return dataset
+
+
+def percentiles(values):
+    """Gecikme yüzdelikleri (ms)"""
+    import numpy as np
+    if not values:
+        return {}
+    array = np.asarray(values)
+    return {
+        'p50': round(float(np.percentile(array, 50)), 2),
+        'p90': round(float(np.percentile(array, 90)), 2),
+        'p99': round(float(np.percentile(array, 99)), 2),
+        'max': round(float(array.max()), 2)
+    }
+
+
+def peak_rss_mb():
+    """Bu sürecin en yüksek RSS değeri (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt döner
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def add_noise(audio, snr_db, seed=0):
+    """AudioData'ya belirtilen SNR'de beyaz gürültü ekle"""
+    import numpy as np
+    import speech_recognition as sr
+    samples = np.frombuffer(audio.get_raw_data(convert_width=2), dtype=np.int16).astype(np.float32)
+    signal_power = np.mean(samples ** 2) if samples.size else 0.0
+    noise_power = signal_power / (10 ** (snr_db / 10))
+    noise = np.random.default_rng(seed).normal(0, np.sqrt(noise_power), samples.shape)
+    noisy = np.clip(samples + noise, -32768, 32767).astype(np.int16)
+    return sr.AudioData(noisy.tobytes(), audio.sample_rate, 2)
+
+
+def run_config(engine, model, dataset, language, options):
+    """Tek bir motor/model yapılandırmasını değerlendir (ayrı süreçte çalışır)"""
+    import speech_recognition as sr
+    from modules.command_matcher import edit_distance, normalize_words
+    from modules.speech_recognizer import SpeechRecognizer
+
+    load_start = time.perf_counter()
+    recognizer = SpeechRecognizer(
+        language=language,
+        use_whisper=True,
+        whisper_engine=engine,
+        whisper_model=model,
+        command_fast_path=options.get('command_fast_path', True),
+        noise_suppression=options.get('noise_suppression', False),
+        noise_profile_file=None
+    )
+    load_seconds = time.perf_counter() - load_start
+
+    utterances = []
+    latencies = []
+    word_edits = word_total = char_edits = char_total = 0
+    command_total = command_correct = 0
+    audio_seconds = processing_seconds = 0.0
+
+    # Model ısınması: ilk çözümleme ölçüme katılmaz
+    if dataset and options.get('warmup', True):
+        with sr.AudioFile(dataset[0][0]) as source:
+            recognizer.recognize(recognizer.recognizer.record(source))
+        recognizer.denoise_cpu_seconds = 0.0
+
+    for path, reference in dataset:
+        with sr.AudioFile(path) as source:
+            audio = recognizer.recognizer.record(source)
+        if options.get('add_noise') is not None:
+            audio = add_noise(audio, options['add_noise'])
+        duration = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        # Dinleyicide olduğu gibi gürültü profili konuşma öncesi sesten öğrenilir
+        recognizer.learn_noise(audio, recognizer.recognizer.non_speaking_duration)
+
+        start = time.perf_counter()
+        result = recognizer.recognize(audio)
+        elapsed = time.perf_counter() - start
+
+        hypothesis = result['text']
+        reference_words = normalize_words(reference)
+        hypothesis_words = normalize_words(hypothesis)
+        reference_chars = ' '.join(reference_words)
+        hypothesis_chars = ' '.join(hypothesis_words)
+        w_edits = edit_distance(reference_words, hypothesis_words)
+        c_edits = edit_distance(reference_chars, hypothesis_chars)
+
+        # Referans bir komutsa doğru eylemin algılanması beklenir
+        expected = recognizer.command_matcher.match(reference)
+        detected = result['command']
+        if expected is not None:
+            command_total += 1
+            if detected is not None and detected.actions == expected.actions:
+                command_correct += 1
+
+        word_edits += w_edits
+        word_total += len(reference_words)
+        char_edits += c_edits
+        char_total += len(reference_chars)
+        audio_seconds += duration
+        processing_seconds += elapsed
+        latencies.append(elapsed * 1000)
+
+        utterances.append({
+            'file': os.path.basename(path),
+            'duration_s': round(duration, 3),
+            'latency_ms': round(elapsed * 1000, 2),
+            'reference': reference,
+            'hypothesis': hypothesis,
+            'raw_text': result['raw_text'],
+            'wer': round(w_edits / len(reference_words), 4) if reference_words else None,
+            'command': list(detected.actions) if detected else None,
+            'fast_path': result['fast_path']
+        })
+
+    return {
+        'engine': recognizer.engine.name,
+        'model': recognizer.engine.model_name,
+        'noise_suppression': recognizer.noise_suppressor is not None,
+        'denoise_cpu_ms_per_audio_s': round(recognizer.denoise_cpu_seconds * 1000 / audio_seconds, 3)
+            if recognizer.noise_suppressor is not None and audio_seconds else None,
+        'utterances_count': len(utterances),
+        'audio_seconds': round(audio_seconds, 2),
+        'load_seconds': round(load_seconds, 2),
+        'wer': round(word_edits / word_total, 4) if word_total else None,
+        'cer': round(char_edits / char_total, 4) if char_total else None,
+        'rtf': round(processing_seconds / audio_seconds, 4) if audio_seconds else None,
+        'latency_ms': percentiles(latencies),
+        'command_accuracy': round(command_correct / command_total, 4) if command_total else None,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'utterances': utterances
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çevrimdışı ses tanıma karşılaştırması")
+    parser.add_argument('data_dir', help="Ses dosyaları ve .txt referansları içeren klasör")
+    parser.add_argument('--engines', nargs='+', default=['openai'],
+                        help="openai, faster-whisper, whisper.cpp")
+    parser.add_argument('--models', nargs='+', default=['base'])
+    parser.add_argument('--language', default='tr')
+    parser.add_argument('--no-command-fast-path', action='store_true',
+                        help="Hızlı komut yolunu kapat")
+    parser.add_argument('--no-warmup', action='store_true')
+    parser.add_argument('--noise-suppression', choices=['off', 'on', 'both'], default='off',
+                        help="Whisper öncesi gürültü bastırma")
+    parser.add_argument('--add-noise', type=float, metavar='SNR_DB',
+                        help="Kayıtlara bu SNR'de beyaz gürültü ekle")
+    parser.add_argument('--output', help="JSON sonuç dosyası (varsayılan: ekrana yaz)")
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.data_dir)
+    if not dataset:
+        print("Değerlendirilecek ses dosyası bulunamadı")
+        return 1
+
+    options = {
+        'command_fast_path': not args.no_command_fast_path,
+        'warmup': not args.no_warmup,
+        'add_noise': args.add_noise
+    }
+    denoise_modes = {'off': [False], 'on': [True], 'both': [False, True]}[args.noise_suppression]
+
+    # Her yapılandırma ayrı süreçte çalışır; böylece RSS ölçümleri birbirini etkilemez
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for engine in args.engines:
+        for model in args.models:
+            for denoise in denoise_modes:
+                label = f"{engine} / {model}" + (" / gürültü bastırma" if denoise else "")
+                print(f"Değerlendiriliyor: {label} ({len(dataset)} dosya)")
+                config_options = dict(options, noise_suppression=denoise)
+                try:
+                    with context.Pool(1) as pool:
+                        result = pool.apply(run_config, (engine, model, dataset, args.language,
+                                                         config_options))
+                except Exception as e:
+                    print(f"  hata: {e}")
+                    results.append({'engine': engine, 'model': model,
+                                    'noise_suppression': denoise, 'error': str(e)})
+                    continue
+                results.append(result)
+                print(f"  WER {result['wer']}  CER {result['cer']}  RTF {result['rtf']}  "
+                      f"p50 {result['latency_ms'].get('p50')} ms  RSS {result['peak_rss_mb']} MB")
+                if denoise:
+                    print(f"  gürültü bastırma: {result['denoise_cpu_ms_per_audio_s']} ms CPU / ses saniyesi")
+
+    report = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'data_dir': os.path.abspath(args.data_dir),
+        'options': options,
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.output}")
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
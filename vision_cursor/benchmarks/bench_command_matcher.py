@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Komut Eşleştirici Karşılaştırması
+
+Binlerce sentetik komut ile derlenmiş eşleştiriciyi (Aho-Corasick + silme indeksi)
+eski sözlük döngüsü ile karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_command_matcher.py --commands 1000 5000 --queries 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.command_matcher import CommandMatcher
+
+SYLLABLES = ['ba', 'la', 'ta', 'ke', 'me', 'di', 'şi', 'ğa', 'ço', 'ne', 'rü', 'öz',
+             'kı', 'sa', 'ye', 'ul', 'mi', 'pa', 'tö', 'gü', 'ar', 'ız', 'el', 'on']
+
+
+def make_word(rng):
+    return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def make_commands(count, rng):
+    """Birbirinden farklı 1-3 kelimelik sentetik komutlar üret"""
+    commands = {}
+    while len(commands) < count:
+        phrase = ' '.join(make_word(rng) for _ in range(rng.randint(1, 3)))
+        commands[phrase] = f"action_{len(commands)}"
+    return commands
+
+
+def make_queries(commands, count, rng):
+    """Tam, hatalı ve komut içermeyen sorgu karışımı üret"""
+    phrases = list(commands.keys())
+    queries = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            # Dikte cümlesi içinde tam komut
+            queries.append(f"{make_word(rng)} {rng.choice(phrases)} {make_word(rng)}")
+        elif kind == 1:
+            # Tek harfi bozulmuş kısa komut
+            phrase = list(rng.choice(phrases))
+            position = rng.randrange(len(phrase))
+            if phrase[position] != ' ':
+                phrase[position] = rng.choice('aeıioöuü')
+            queries.append(''.join(phrase))
+        else:
+            # Komut içermeyen dikte
+            queries.append(' '.join(make_word(rng) for _ in range(8)))
+    return queries
+
+
+def naive_match(commands, text):
+    """Eski _process_commands davranışı: sırayla alt dizi araması"""
+    text_lower = text.lower()
+    for command_text, command_action in commands.items():
+        if command_text in text_lower:
+            return command_action
+    return None
+
+
+def run(command_count, query_count, seed):
+    rng = random.Random(seed)
+    commands = make_commands(command_count, rng)
+    queries = make_queries(commands, query_count, rng)
+
+    start = time.perf_counter()
+    matcher = CommandMatcher(commands)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    hits = sum(1 for q in queries if matcher.match(q) is not None)
+    compiled_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    start = time.perf_counter()
+    naive_hits = sum(1 for q in queries if naive_match(commands, q) is not None)
+    naive_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    return {
+        'commands': command_count,
+        'queries': query_count,
+        'build_ms': round(build_ms, 2),
+        'compiled_us_per_query': round(compiled_us, 2),
+        'naive_us_per_query': round(naive_us, 2),
+        'compiled_hits': hits,
+        'naive_hits': naive_hits
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Komut eşleştirici karşılaştırması")
+    parser.add_argument('--commands', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help="Sonuçları JSON olarak bu dosyaya yaz")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'komut':>7} {'derleme ms':>11} {'derlenmiş µs':>13} {'döngü µs':>10} {'isabet':>14}")
+    for count in args.commands:
+        result = run(count, args.queries, args.seed)
+        results.append(result)
+        print(f"{result['commands']:>7} {result['build_ms']:>11.1f} "
+              f"{result['compiled_us_per_query']:>13.1f} {result['naive_us_per_query']:>10.1f} "
+              f"{result['compiled_hits']:>6}/{result['naive_hits']:<7}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
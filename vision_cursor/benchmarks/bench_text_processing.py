@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Metin Son İşleme Karşılaştırması
+
+Derlenmiş TextPostProcessor'ı (tek metin ve toplu) her çağrıda düzenli
+ifade ve sözlük kuran eski _clean_text + improve_turkish_recognition
+davranışı ile karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_text_processing.py --texts 20000 --batch 64
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.text_processing import TextPostProcessor, DEFAULT_FILTER_WORDS
+
+WORDS = ['merhaba', 'göz', 'takibini', 'başlat', 'durdur', 'temizle', 'bugün', 'hava',
+         'çok', 'güzel', 'evet', 'hayır', 'tamam', 'bir', 've', 'ile', 'ne', 'hmm', 'ah']
+PUNCTUATION = ['', '', '', ',', '.', '!', '?']
+
+
+def make_texts(count, rng):
+    """Noktalama, dolgu kelimeleri ve tekrarlar içeren sentetik Whisper çıktıları"""
+    texts = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) + rng.choice(PUNCTUATION) for _ in range(rng.randint(2, 14))]
+        if rng.random() < 0.1:
+            words.append('a' * rng.randint(12, 30))
+        if rng.random() < 0.3:
+            words[0] = words[0].capitalize()
+        texts.append(' '.join(words))
+    return texts
+
+
+def legacy_clean_text(text, filter_words=list(DEFAULT_FILTER_WORDS), min_word_length=2,
+                      min_sentence_length=3):
+    """Eski _clean_text: her çağrıda re içe aktarılır, liste içinde arama"""
+    if not text:
+        return ""
+    text = text.lower().strip()
+    import re
+    text = re.sub(r'[^\w\s]', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'(.)\1{10,}', r'\1\1\1', text)
+    filtered_words = []
+    for word in text.split():
+        if len(word) < min_word_length:
+            continue
+        if word in filter_words:
+            continue
+        if len(set(word)) == 1 and len(word) > 3:
+            continue
+        filtered_words.append(word)
+    result = ' '.join(filtered_words)
+    if len(result) < min_sentence_length:
+        return ""
+    return result
+
+
+def legacy_improve(text):
+    """Eski improve_turkish_recognition: her çağrıda iki sözlük kurulur"""
+    if not text:
+        return text
+    corrections = {
+        'i': 'ı', 'I': 'İ', 'g': 'ğ', 'G': 'Ğ', 'u': 'ü', 'U': 'Ü',
+        'o': 'ö', 'O': 'Ö', 's': 'ş', 'S': 'Ş', 'c': 'ç', 'C': 'Ç'
+    }
+    word_corrections = {word: word for word in (
+        'ben', 'sen', 'o', 'biz', 'siz', 'onlar', 've', 'ile', 'bir', 'bu', 'şu',
+        'merhaba', 'selam', 'tamam', 'evet', 'hayır', 'başlat', 'durdur', 'temizle')}
+    return ' '.join(word_corrections.get(word.lower(), word) for word in text.split())
+
+
+def timed(function, repeats):
+    """En iyi süreyi (saniye) döndür"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metin son işleme karşılaştırması")
+    parser.add_argument('--texts', type=int, default=20000)
+    parser.add_argument('--batch', type=int, default=64, help="Toplu işlemde grup boyutu")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help="Sonuçları JSON olarak bu dosyaya yaz")
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts, random.Random(args.seed))
+    processor = TextPostProcessor()
+    batches = [texts[i:i + args.batch] for i in range(0, len(texts), args.batch)]
+
+    legacy = timed(lambda: [legacy_improve(legacy_clean_text(t)) for t in texts], args.repeats)
+    single = timed(lambda: [processor.process(t) for t in texts], args.repeats)
+    batch = timed(lambda: [processor.process_batch(b) for b in batches], args.repeats)
+
+    # Toplu ve tek metin yolları aynı sonucu vermeli
+    batch_output = [text for b in batches for text in processor.process_batch(b)]
+    consistent = batch_output == [processor.process(t) for t in texts]
+
+    results = {
+        'texts': args.texts,
+        'batch_size': args.batch,
+        'legacy_us_per_text': round(legacy / len(texts) * 1e6, 2),
+        'compiled_us_per_text': round(single / len(texts) * 1e6, 2),
+        'batch_us_per_text': round(batch / len(texts) * 1e6, 2),
+        'batch_consistent': consistent
+    }
+
+    print(f"eski:       {results['legacy_us_per_text']:>7.2f} µs/metin")
+    print(f"derlenmiş:  {results['compiled_us_per_text']:>7.2f} µs/metin "
+          f"({legacy / single:.1f}x)")
+    print(f"toplu ({args.batch}): {results['batch_us_per_text']:>7.2f} µs/metin "
+          f"({legacy / batch:.1f}x)")
+    print(f"toplu/tek tutarlı: {consistent}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Uçtan Uca Bakış Gecikmesi Ölçümü
+
+Etiketli bir kaydı (ya da sentetik bakış senaryosunu) gerçek EyeTracker
+işlem hattından geçirir; imleç RecordingCursor ile kaydedilir, ekran
+gerekmez. Raporlanan değerler:
+- kare başına gecikme: kare işleme hattına verildiği andan imleç
+  hareketine kadar geçen süre
+- oturma süresi: bakış hedefi sıçradıktan (sakkad) sonra imlecin hedefe
+  tolerans içinde yerleşmesine kadar geçen kayıt süresi
+- sabit durum hatası: yerleştikten sonra imleç ile hedef arası piksel
+- elde edilen işlem hızı (kare/saniye)
+
+Etiket dosyası modules/gaze_metrics.py biçimindedir (frame,x,y[,t][,click]);
+t yoksa video FPS'inden hesaplanır. Etiketsiz kareler işlenir ama
+değerlendirmeye girmez.
+
+Kullanım:
+    # Kayıt ve etiketler (MediaPipe gerekir)
+    python benchmarks/gaze_latency.py --video kayit.mp4 --labels kayit.csv
+
+    # Sahte FaceMesh ile 60 saniyelik sentetik senaryo
+    python benchmarks/gaze_latency.py --synthetic 60 --frame-skip 1 --smooth-factor 4
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.gaze_metrics import analyze, load_labels, summarize
+
+
+def video_frames(video_path, labels):
+    """(zaman, kare, normalize hedef ya da None) üreteci"""
+    import cv2
+    capture = cv2.VideoCapture(video_path)
+    if not capture.isOpened():
+        raise ValueError(f"Video açılamadı: {video_path}")
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+    index = 0
+    try:
+        while True:
+            ret, frame = capture.read()
+            if not ret:
+                break
+            label = labels.get(index)
+            t = label[2] if label and label[2] is not None else index / fps
+            # Camera._capture_loop ile aynı: ayna görüntüsü
+            yield t, cv2.flip(frame, 1), (label[0], label[1]) if label else None
+            index += 1
+    finally:
+        capture.release()
+
+
+def synthetic_frames(duration, fps, face_mesh, seed=0, jitter=0.002):
+    """Rastgele sabit bakışlar ve aralarında sakkadlar; sahte FaceMesh hedefi izler"""
+    rng = random.Random(seed)
+    base = np.random.default_rng(seed).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    target = None
+    fixation_end = 0.0
+    for index in range(int(duration * fps)):
+        t = index / fps
+        if t >= fixation_end:
+            target = (rng.uniform(0.1, 0.9), rng.uniform(0.1, 0.9))
+            fixation_end = t + rng.uniform(0.5, 1.2)
+        face_mesh.gaze = (target[0] + rng.gauss(0, jitter), target[1] + rng.gauss(0, jitter))
+        yield t, base.copy(), target
+
+
+def run_pipeline(tracker, cursor, frames):
+    """Kareleri işle, kare başına kayıtları ve toplam süreyi döndür"""
+    records = []
+    tracker.tracking = True
+    start = time.perf_counter()
+    for t, frame, target in frames:
+        handoff = time.perf_counter()
+        tracker._process_frame(frame, timestamp=t)
+        moved = cursor.last_move_time is not None and cursor.last_move_time >= handoff
+        records.append({
+            't': t,
+            'target': target,
+            'cursor': cursor.position,
+            'latency_ms': (cursor.last_move_time - handoff) * 1000 if moved else None
+        })
+    return records, time.perf_counter() - start
+
+
+def write_frames_csv(path, records):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['t', 'target_x', 'target_y', 'cursor_x', 'cursor_y', 'error_px', 'latency_ms'])
+        for record in records:
+            target = record['target_px'] or (None, None)
+            position = record['cursor'] or (None, None)
+            writer.writerow([f"{record['t']:.4f}", *target, *position,
+                             record['error_px'], record['latency_ms']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uçtan uca bakış gecikmesi ölçümü")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--video', help="Kayıt dosyası (--labels ile)")
+    source_group.add_argument('--synthetic', type=float, help="Sentetik senaryo süresi (saniye)")
+    parser.add_argument('--labels', help="Kare başına hedef CSV (frame,x,y[,t])")
+    parser.add_argument('--fps', type=float, default=30.0, help="Sentetik kare hızı")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--screen', default="1920x1080", help="Kaydedici ekran boyutu")
+    parser.add_argument('--frame-skip', type=int, help="EyeTracker.frame_skip")
+    parser.add_argument('--smooth-factor', type=int, help="EyeTracker.smooth_factor")
+    parser.add_argument('--tolerance', type=float, default=50.0, help="Yerleşme toleransı (piksel)")
+    parser.add_argument('--hold', type=int, default=3, help="Yerleşme için tolerans içinde kalınacak kare")
+    parser.add_argument('--frames-csv', help="Kare başına sonuçların yazılacağı CSV")
+    parser.add_argument('--output', help="JSON sonuç dosyası")
+    args = parser.parse_args()
+
+    if args.video and not args.labels:
+        parser.error("--video ile --labels gerekli")
+
+    if args.synthetic:
+        from stubs import install_stubs
+        install_stubs()
+
+    from modules.cursor import RecordingCursor
+    from modules.eye_tracker import EyeTracker
+
+    width, height = (int(value) for value in args.screen.lower().split('x'))
+    cursor = RecordingCursor(width, height, max_events=1)
+    tracker = EyeTracker(cursor=cursor)
+    if args.frame_skip:
+        tracker.frame_skip = args.frame_skip
+    if args.smooth_factor:
+        tracker.smooth_factor = args.smooth_factor
+
+    if args.synthetic:
+        frames = synthetic_frames(args.synthetic, args.fps, tracker.face_mesh, seed=args.seed)
+    else:
+        frames = video_frames(args.video, load_labels(args.labels))
+
+    # Hat içi mesajlar (ör. "Göz tıklaması!") JSON çıktısına karışmasın
+    with contextlib.redirect_stdout(sys.stderr):
+        records, elapsed = run_pipeline(tracker, cursor, frames)
+    tracker.tracking = False
+
+    report = {
+        'source': args.video or f"synthetic:{args.synthetic}s@{args.fps}fps",
+        'frames': len(records),
+        'frames_processed': tracker.frames_processed,
+        'frame_skip': tracker.frame_skip,
+        'smooth_factor': tracker.smooth_factor,
+        'throughput_fps': len(records) / elapsed if elapsed else None,
+        'clicks': tracker.click_count,
+        'latency_ms': summarize([r['latency_ms'] for r in records if r['latency_ms'] is not None]),
+        **analyze(records, (width, height), args.tolerance, args.hold)
+    }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.frames_csv:
+        write_frames_csv(args.frames_csv, records)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Performans Gerileme Testi
+
+Kamera döngüsü, iris noktaları, yumuşatma, ekran eşleme, tıklama kontrolü,
+metin temizleme, komut eşleme ve arayüz kare dönüşümünü ayrı ayrı ölçer.
+FaceMesh, pyautogui ve Whisper yerine belirlenimci sahteler (stubs.py)
+kullanılır; kamera, ekran ve model gerekmez.
+
+Sonuçlar bir temel JSON dosyasıyla karşılaştırılır; herhangi bir ölçüm
+temelden --threshold oranından fazla yavaşsa çıkış kodu 1 olur. Temel
+makineye özgüdür, depoya eklenmez.
+
+Kullanım:
+    # Temeli oluştur
+    python benchmarks/regression_suite.py --save-baseline
+
+    # Değişiklikten sonra karşılaştır (%25'ten fazla yavaşlama hata)
+    python benchmarks/regression_suite.py --threshold 0.25
+
+    # Yalnızca göz takibi ölçümleri
+    python benchmarks/regression_suite.py --only eye.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCHMARK_DIR))
+
+from stubs import SyntheticCapture, StubWhisperEngine, install_stubs, gaze_point
+
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+PROJECT_DIR = os.path.dirname(BENCHMARK_DIR)
+
+# Ölçüm adı -> (gereken modüller, kurulum fonksiyonu)
+BENCHMARKS = {}
+
+
+def benchmark(name, requires=()):
+    """Kurulum fonksiyonu (run, işlem sayısı) döndürür; run() o kadar işlem yapar"""
+    def decorator(setup):
+        BENCHMARKS[name] = (requires, setup)
+        return setup
+    return decorator
+
+
+def make_tracker():
+    from modules.eye_tracker import EyeTracker
+    tracker = EyeTracker()
+    tracker.tracking = True
+    tracker.frame_skip = 1
+    return tracker
+
+
+def gaze_landmarks(count):
+    """count karelik sahte FaceMesh sonuçları (iris noktaları)"""
+    from stubs import StubFaceMesh
+    face_mesh = StubFaceMesh()
+    results = []
+    for _ in range(count):
+        landmarks = face_mesh.process(None).multi_face_landmarks[0]
+        results.append([(landmark.x, landmark.y) for landmark in landmarks.landmark])
+    return results
+
+
+# --- Kamera ---
+
+@benchmark("camera.capture_loop", requires=("cv2",))
+def bench_camera_capture():
+    from modules.camera import Camera
+    frames = 300
+    camera = Camera()
+
+    def stop():
+        camera.is_running = False
+
+    capture = SyntheticCapture(limit=frames, on_exhausted=stop)
+    camera.cap = capture
+
+    def run():
+        capture.reads = 0
+        camera.is_running = True
+        camera._capture_loop(None)
+    return run, frames
+
+
+# --- Göz takibi ---
+
+@benchmark("eye.process_frame", requires=("cv2",))
+def bench_process_frame():
+    tracker = make_tracker()
+    frames = SyntheticCapture(frames=8)._frames
+    count = 200
+
+    def run():
+        for i in range(count):
+            tracker._process_frame(frames[i % len(frames)].copy())
+    return run, count
+
+
+@benchmark("eye.landmarks", requires=("cv2",))
+def bench_landmarks():
+    from stubs import FaceLandmarks, Landmark
+    tracker = make_tracker()
+    faces = [FaceLandmarks([Landmark(x, y) for x, y in points]) for points in gaze_landmarks(64)]
+    count = 2000
+
+    def run():
+        for i in range(count):
+            face = faces[i % len(faces)]
+            tracker._get_iris_center(face, tracker.LEFT_IRIS)
+            tracker._get_iris_center(face, tracker.RIGHT_IRIS)
+    return run, count
+
+
+@benchmark("eye.smoothing", requires=("cv2",))
+def bench_smoothing():
+    tracker = make_tracker()
+    points = [(int(x * 640), int(y * 480)) for x, y in map(gaze_point, range(240))]
+    count = 5000
+
+    def run():
+        for i in range(count):
+            x, y = points[i % len(points)]
+            tracker._smooth_position(x, y)
+    return run, count
+
+
+@benchmark("eye.screen_mapping", requires=("cv2",))
+def bench_screen_mapping():
+    tracker = make_tracker()
+    points = [(x * 640, y * 480) for x, y in map(gaze_point, range(240))]
+    count = 5000
+
+    def run():
+        for i in range(count):
+            x, y = points[i % len(points)]
+            tracker._map_to_screen_x(x, 640)
+            tracker._map_to_screen_y(y, 480)
+    return run, count
+
+
+@benchmark("eye.click_check", requires=("cv2",))
+def bench_click_check():
+    tracker = make_tracker()
+    points = [(x * 640, y * 480) for x, y in map(gaze_point, range(240))]
+    count = 5000
+
+    def run():
+        for i in range(count):
+            x, y = points[i % len(points)]
+            tracker._check_for_click(x, y)
+    return run, count
+
+
+# --- Metin ve komutlar ---
+
+TEXTS = [
+    "hmm evet evet  Merhaba, bugün hava çok güzel!!",
+    "ee şey goz takibini baslat lütfen",
+    "Toplantı notlarını yarın sabah gönder ve kaydet.",
+    "a b c tamam tamam yani aslında temızle",
+] * 16
+
+
+@benchmark("text.process")
+def bench_text_process():
+    from modules.text_processing import TextPostProcessor, load_corrections
+    processor = TextPostProcessor(corrections=load_corrections(os.path.join(PROJECT_DIR, "corrections.ini")))
+
+    def run():
+        for text in TEXTS:
+            processor.process(text)
+    return run, len(TEXTS)
+
+
+@benchmark("text.process_batch")
+def bench_text_process_batch():
+    from modules.text_processing import TextPostProcessor, load_corrections
+    processor = TextPostProcessor(corrections=load_corrections(os.path.join(PROJECT_DIR, "corrections.ini")))
+
+    def run():
+        processor.process_batch(TEXTS)
+    return run, len(TEXTS)
+
+
+def load_matcher():
+    from modules.command_matcher import CommandMatcher
+    return CommandMatcher.from_file(os.path.join(PROJECT_DIR, "commands.ini"))
+
+
+@benchmark("command.match")
+def bench_command_match():
+    matcher = load_matcher()
+    # Komut sayılmaması gereken dikte; eşleşirse ölçüm anlamsızdır
+    dictation = ["bugün toplantıdan sonra markete uğrayıp ekmek alacağım", "bu dosyayı sil lütfen"]
+    fired = [query for query in dictation if matcher.match(query) is not None]
+    if fired:
+        raise RuntimeError(f"Dikte komut olarak eşleşti: {fired}")
+    queries = ["göz takibini başlat", "ses tanımayı durdr", "kaydet"] * 16 + dictation * 16
+
+    def run():
+        for query in queries:
+            matcher.match(query)
+    return run, len(queries)
+
+
+@benchmark("command.spot")
+def bench_command_spot():
+    from modules.command_spotter import CommandSpotter
+    spotter = CommandSpotter(load_matcher(), StubWhisperEngine())
+    # Sahte motor metni ses uzunluğuna göre seçer: komut ve dikte karışık
+    segments = [np.zeros(16000 + i, dtype=np.float32) for i in range(4)] * 16
+
+    def run():
+        for samples in segments:
+            spotter.spot(samples)
+    return run, len(segments)
+
+
+# --- Arayüz ---
+
+@benchmark("gui.frame_conversion", requires=("cv2", "PyQt5"))
+def bench_gui_frame_conversion():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from types import SimpleNamespace
+    from PyQt5.QtWidgets import QApplication, QLabel
+    from modules.gui import VisionCursorGUI
+    bench_gui_frame_conversion.app = QApplication.instance() or QApplication([])
+    frames = SyntheticCapture(frames=8)._frames
+    count = 100
+    # Ana pencere kurulmaz; gerçek _show_camera_frame yalnızca izleyici ve
+    # etiket gerektirir
+    label = QLabel()
+    label.resize(480, 360)
+    # Camera.get_frame gibi kopya döndürür
+    cycle = itertools.cycle(frames)
+    tracker = SimpleNamespace(get_frame=lambda: next(cycle).copy())
+    window = SimpleNamespace(eye_tracker=tracker, camera_label=label)
+
+    def run():
+        for _ in range(count):
+            VisionCursorGUI._show_camera_frame(window)
+    return run, count
+
+
+def missing_modules(requires):
+    return [name for name in requires if importlib.util.find_spec(name) is None]
+
+
+def measure(setup, repeats):
+    """En iyi tekrarın işlem başına süresi (µs)"""
+    run, ops = setup()
+    sink = io.StringIO()
+    # Isınma: önbellekler, ilk ayırmalar
+    with contextlib.redirect_stdout(sink):
+        run()
+    best = float('inf')
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(sink):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best / ops * 1e6
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Performans gerileme testi")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Temel JSON dosyası")
+    parser.add_argument('--save-baseline', action='store_true', help="Sonuçları temel olarak kaydet")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="İzin verilen yavaşlama oranı (0.25 = %%25)")
+    parser.add_argument('--repeats', type=int, default=7, help="Ölçüm başına tekrar (en iyisi alınır)")
+    parser.add_argument('--only', nargs='+', help="Yalnızca bu önekle başlayan ölçümler")
+    parser.add_argument('--json', action='store_true', help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+
+    install_stubs()
+
+    results = {}
+    skipped = {}
+    for name, (requires, setup) in BENCHMARKS.items():
+        if args.only and not any(name.startswith(prefix) for prefix in args.only):
+            continue
+        missing = missing_modules(requires)
+        if missing:
+            skipped[name] = missing
+            continue
+        results[name] = measure(setup, args.repeats)
+
+    baseline = load_baseline(args.baseline)
+    baseline_results = baseline['results'] if baseline else {}
+
+    regressions = []
+    rows = []
+    for name, value in results.items():
+        previous = baseline_results.get(name)
+        ratio = value / previous if previous else None
+        if ratio is not None and ratio > 1 + args.threshold:
+            regressions.append(name)
+        rows.append((name, value, previous, ratio))
+
+    if args.json:
+        print(json.dumps({
+            'results': results,
+            'baseline': baseline_results,
+            'skipped': skipped,
+            'regressions': regressions
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'Ölçüm':<24} {'µs/işlem':>12} {'temel':>12} {'oran':>8}")
+        for name, value, previous, ratio in rows:
+            previous_text = f"{previous:.2f}" if previous else "-"
+            ratio_text = f"{ratio:.2f}x" if ratio else "-"
+            flag = "  YAVAŞLAMA" if name in regressions else ""
+            print(f"{name:<24} {value:>12.2f} {previous_text:>12} {ratio_text:>8}{flag}")
+        for name, missing in skipped.items():
+            print(f"{name:<24} atlandı (eksik: {', '.join(missing)})")
+
+    if args.save_baseline:
+        # Yalnızca ölçülen değerler güncellenir, atlananlar korunur
+        merged = dict(baseline_results)
+        merged.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'processor': platform.processor(),
+                'results': merged
+            }, f, ensure_ascii=False, indent=2)
+        print(f"Temel kaydedildi: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"Temel bulunamadı ({args.baseline}); oluşturmak için --save-baseline kullanın")
+        return 0
+
+    if regressions:
+        print(f"{len(regressions)} ölçüm %{args.threshold * 100:.0f} eşiğinden fazla yavaşladı: "
+              f"{', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
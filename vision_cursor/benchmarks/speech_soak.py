@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Ses Tanıma Dayanıklılık Testi
+
+Mikrofon yerine dosya ya da sentetik ses kaynağı ile SpeechRecognizer'ın
+dinleme, kuyruk ve çözümleme yolunu gerçek zamandan hızlı çalıştırır.
+İşlem hızı ile bellek kararlılığını (RSS büyümesi) raporlar.
+
+Kullanım:
+    # Bir kaydı 20 kez, sınırsız hızda çal
+    python benchmarks/speech_soak.py --file kayit.wav --loops 20 --speed 0
+
+    # 2 saatlik sentetik konuşma, küçük modelle
+    python benchmarks/speech_soak.py --synthetic 7200 --speed 0 --model tiny
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import psutil
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.audio_source import FileSource, NumpySource, synthetic_speech
+from modules.speech_recognizer import SpeechRecognizer
+
+
+class MemorySampler:
+    """Belirli aralıklarla süreç RSS değerini kaydeder"""
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.samples = []
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="soak-memory", daemon=True)
+
+    def start(self):
+        self._start_time = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            elapsed = time.perf_counter() - self._start_time
+            self.samples.append((elapsed, self._process.memory_info().rss / (1024 * 1024)))
+            self._stop.wait(self.interval)
+
+
+def rss_slope(samples):
+    """RSS büyüme eğimi (MB/dakika), en küçük kareler ile"""
+    if len(samples) < 2:
+        return 0.0
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_m = sum(m for _, m in samples) / n
+    numerator = sum((t - mean_t) * (m - mean_m) for t, m in samples)
+    denominator = sum((t - mean_t) ** 2 for t, _ in samples)
+    return numerator / denominator * 60 if denominator else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ses tanıma dayanıklılık testi")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--file', help="WAV/AIFF/FLAC kaynak dosyası")
+    source_group.add_argument('--synthetic', type=float, help="Sentetik konuşma süresi (saniye)")
+    parser.add_argument('--loops', type=int, default=1, help="Dosya kaç kez çalınacak")
+    parser.add_argument('--speed', type=float, default=0, help="Oynatma hızı (1 gerçek zaman, 0 sınırsız)")
+    parser.add_argument('--engine', default='openai')
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--workers', type=int, default=1, help="Çözücü iş parçacığı sayısı")
+    parser.add_argument('--queue-size', type=int, default=32)
+    parser.add_argument('--streaming', action='store_true', help="Akış modunu da test et")
+    parser.add_argument('--memory-interval', type=float, default=1.0)
+    parser.add_argument('--output', help="JSON sonuç dosyası")
+    args = parser.parse_args()
+
+    if args.file:
+        source = FileSource(args.file, speed=args.speed, loops=args.loops)
+    else:
+        source = NumpySource(synthetic_speech(args.synthetic), speed=args.speed)
+
+    recognized = {'text': 0, 'command': 0, 'partial': 0}
+
+    def callback(text, is_command=False, command=None, is_partial=False, stable_text=""):
+        if is_partial:
+            recognized['partial'] += 1
+        elif is_command:
+            recognized['command'] += 1
+        else:
+            recognized['text'] += 1
+
+    recognizer = SpeechRecognizer(
+        callback=callback,
+        whisper_engine=args.engine,
+        whisper_model=args.model,
+        streaming=args.streaming,
+        audio_source=source,
+        decoder_workers=args.workers,
+        max_queue_size=args.queue_size
+    )
+
+    sampler = MemorySampler(args.memory_interval)
+    sampler.start()
+    start = time.perf_counter()
+
+    recognizer.start()
+    try:
+        recognizer.wait_until_done()
+    except KeyboardInterrupt:
+        print("Kesildi, sonuçlar şimdiye kadarki ölçümlerle raporlanıyor")
+    wall_seconds = time.perf_counter() - start
+    recognizer.stop()
+    sampler.stop()
+
+    audio_seconds = source.audio_seconds
+    rss = [m for _, m in sampler.samples] or [0.0]
+    report = {
+        'source': repr(source),
+        'engine': recognizer.engine.name if recognizer.engine else None,
+        'model': recognizer.engine.model_name if recognizer.engine else None,
+        'audio_seconds': round(audio_seconds, 1),
+        'wall_seconds': round(wall_seconds, 1),
+        'speedup': round(audio_seconds / wall_seconds, 2) if wall_seconds else None,
+        'segments_queued': recognizer.segments_queued,
+        'segments_decoded': recognizer.segments_decoded,
+        'segments_per_second': round(recognizer.segments_decoded / wall_seconds, 3) if wall_seconds else None,
+        'callbacks': recognized,
+        'rss_mb': {
+            'start': round(rss[0], 1),
+            'end': round(rss[-1], 1),
+            'max': round(max(rss), 1),
+            'slope_mb_per_min': round(rss_slope(sampler.samples), 3)
+        }
+    }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
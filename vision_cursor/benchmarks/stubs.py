@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Karşılaştırma Sahteleri
+
+Kamera, MediaPipe FaceMesh, pyautogui ve Whisper için belirlenimci sahte
+nesneler. Karşılaştırmalar ekran, kamera ve model olmadan, başsız bir
+Linux makinesinde aynı girdilerle çalışır.
+
+install_stubs() sahte mediapipe ve pyautogui modüllerini sys.modules'a
+koyar; modules.eye_tracker bundan sonra içe aktarılmalıdır.
+"""
+
+import math
+import sys
+import types
+
+import numpy as np
+
+# MediaPipe refine_landmarks=True ile 478 nokta döndürür
+LANDMARK_COUNT = 478
+LEFT_IRIS = (474, 475, 476, 477)
+RIGHT_IRIS = (469, 470, 471, 472)
+SCREEN_SIZE = (1920, 1080)
+
+
+class Landmark:
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class FaceLandmarks:
+    def __init__(self, landmark):
+        self.landmark = landmark
+
+
+class FaceMeshResult:
+    def __init__(self, multi_face_landmarks):
+        self.multi_face_landmarks = multi_face_landmarks
+
+
+def gaze_point(index, period=240):
+    """index. karede bakış noktası (normalize): yavaş Lissajous eğrisi ve duraklamalar"""
+    phase = 2 * math.pi * (index % period) / period
+    # Her periyodun son çeyreğinde bakış sabit kalır (tıklama yolunu çalıştırır)
+    if index % period >= period * 3 // 4:
+        phase = 2 * math.pi * 0.75
+    return 0.5 + 0.3 * math.sin(phase), 0.5 + 0.2 * math.sin(2 * phase)
+
+
+class StubFaceMesh:
+    """mp.solutions.face_mesh.FaceMesh yerine belirlenimci sonuç döndürür
+
+    İris noktaları gaze_point() eğrisini ya da ayarlanmışsa gaze konumunu
+    izler; diğer noktalar sabittir. Çağrı başına maliyet sabittir, böylece
+    ölçülen süre VisionCursor kodudur.
+    """
+
+    def __init__(self, max_num_faces=1, refine_landmarks=True,
+                 min_detection_confidence=0.5, min_tracking_confidence=0.5, face_every=1):
+        self.calls = 0
+        self.face_every = face_every  # Her n. karede yüz bulunur (1: her karede)
+        self.gaze = None              # (x, y) normalize bakış noktası; None ise gaze_point()
+        self._landmarks = [Landmark(0.5, 0.5) for _ in range(LANDMARK_COUNT)]
+        self._result = FaceMeshResult([FaceLandmarks(self._landmarks)])
+        self._empty = FaceMeshResult(None)
+
+    def process(self, image):
+        self.calls += 1
+        if self.calls % self.face_every:
+            return self._empty
+        x, y = self.gaze if self.gaze is not None else gaze_point(self.calls)
+        # MediaPipe noktaları float32 olarak tutar
+        x, y = float(np.float32(x)), float(np.float32(y))
+        for offset, index in enumerate(LEFT_IRIS):
+            landmark = self._landmarks[index]
+            landmark.x = float(np.float32(x + 0.002 * (offset - 1.5)))
+            landmark.y = y
+        for offset, index in enumerate(RIGHT_IRIS):
+            landmark = self._landmarks[index]
+            landmark.x = float(np.float32(x + 0.002 * (offset - 1.5)))
+            landmark.y = float(np.float32(y + 0.001))
+        return self._result
+
+    def close(self):
+        pass
+
+
+class RecordingPointer:
+    """pyautogui yerine: imleç hareketlerini ve tıklamaları kaydeder"""
+
+    def __init__(self, size=SCREEN_SIZE):
+        self._size = size
+        self.moves = 0
+        self.clicks = 0
+        self.position = (0, 0)
+
+    def size(self):
+        return self._size
+
+    def moveTo(self, x, y, *args, **kwargs):
+        self.moves += 1
+        self.position = (x, y)
+
+    def click(self, *args, **kwargs):
+        self.clicks += 1
+
+
+def install_stubs(face_every=1):
+    """Sahte mediapipe ve pyautogui modüllerini kaydet, (FaceMesh sınıfı, pointer) döndür"""
+    pointer = RecordingPointer()
+    pyautogui = types.ModuleType('pyautogui')
+    pyautogui.size = pointer.size
+    pyautogui.moveTo = pointer.moveTo
+    pyautogui.click = pointer.click
+    pyautogui.FAILSAFE = False
+    sys.modules['pyautogui'] = pyautogui
+
+    def face_mesh_factory(**options):
+        return StubFaceMesh(face_every=face_every, **options)
+
+    mediapipe = types.ModuleType('mediapipe')
+    mediapipe.solutions = types.SimpleNamespace(
+        face_mesh=types.SimpleNamespace(FaceMesh=face_mesh_factory),
+        drawing_utils=types.SimpleNamespace(),
+        drawing_styles=types.SimpleNamespace()
+    )
+    sys.modules['mediapipe'] = mediapipe
+    return face_mesh_factory, pointer
+
+
+class SyntheticCapture:
+    """cv2.VideoCapture yerine: önceden üretilmiş kareleri döngüyle verir"""
+
+    def __init__(self, width=640, height=480, frames=8, limit=None, on_exhausted=None):
+        rng = np.random.default_rng(0)
+        self._frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+                        for _ in range(frames)]
+        self.limit = limit                  # Bu kadar kareden sonra on_exhausted çağrılır
+        self.on_exhausted = on_exhausted
+        self.reads = 0
+
+    def read(self):
+        if self.limit is not None and self.reads >= self.limit:
+            if self.on_exhausted:
+                self.on_exhausted()
+            return False, None
+        frame = self._frames[self.reads % len(self._frames)]
+        self.reads += 1
+        return True, frame
+
+    def isOpened(self):
+        return True
+
+    def set(self, *args):
+        return True
+
+    def release(self):
+        pass
+
+
+class StubWhisperEngine:
+    """Belirlenimci Whisper motoru: ses süresine göre sabit metin döndürür
+
+    WhisperEngine arayüzünü uygular; SpeechRecognizer'da ENGINES sözlüğüne
+    "stub" adıyla eklenerek kullanılır.
+    """
+
+    name = "stub"
+
+    TEXTS = (
+        "Merhaba, bugün hava çok güzel!",
+        "göz takibini başlat",
+        "hmm evet evet evet tamam, kaydet",
+        "Toplantı notlarını yarın sabah gönder.",
+    )
+
+    def __init__(self, model_name="stub"):
+        self.model_name = model_name
+        self.calls = 0
+
+    def transcribe(self, samples, language, prompt=None, max_tokens=None):
+        self.calls += 1
+        text = self.TEXTS[len(samples) % len(self.TEXTS)]
+        return text, 0.05
+
+    def transcribe_batch(self, samples_list, language):
+        return [self.transcribe(samples, language) for samples in samples_list]
+
+    def memory_bytes(self):
+        return 0
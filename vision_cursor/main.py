@@ -10,7 +10,12 @@ from modules.gui import VisionCursorGUI
 from modules.eye_tracker import EyeTracker
 from modules.speech_recognizer import SpeechRecognizer
 from modules.performance_monitor import PerformanceMonitor
+from modules.metrics_exporter import MetricsExporter
+from modules.transcript_journal import TranscriptJournal, latest_session
+from modules.gaze_trace import GazeTraceWriter
+from modules.settings import ConfigWatcher, load_settings
 import threading
+import time
 
 # log ayarları
 logging.basicConfig(
@@ -19,6 +24,16 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Yapılandırma dosyası
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini')
+
+# Ses tanıma motorlarının gerektirdiği paketler
+ENGINE_MODULES = {
+    'openai': ('whisper', 'openai-whisper'),
+    'faster-whisper': ('faster_whisper', 'faster-whisper'),
+    'whisper.cpp': ('pywhispercpp', 'pywhispercpp'),
+}
+
 class WorkerThread(threading.Thread):
     def __init__(self, target, *args, **kwargs):
         super().__init__()
@@ -33,7 +48,78 @@ class WorkerThread(threading.Thread):
         except Exception as e:
             logging.error(f"thread hatası: {str(e)}")
 
-def check_dependencies():
+def load_config():
+    """config.ini dosyasını tipli ayarlara çevir; geçersiz değerlerin yerine varsayılan kullanılır"""
+    settings, errors = load_settings(CONFIG_FILE)
+    for error in errors:
+        logging.warning(f"yapılandırma hatası: {error}")
+    return settings
+
+def speech_settings(settings):
+    """SpeechRecognizer oluşturulurken verilen ayarlar (diğerleri apply_settings ile uygulanır)"""
+    section = settings['speech_recognition']
+    return {name: section[name] for name in (
+        'language', 'use_whisper', 'whisper_engine', 'whisper_model', 'streaming',
+        'partial_interval', 'command_fast_path', 'command_model', 'command_max_duration',
+        'commands_file', 'corrections_file', 'decoder_workers', 'max_queue_size',
+        'max_batch_size', 'max_batch_wait',
+        'noise_profile_file', 'noise_suppression', 'noise_suppression_method')}
+
+def create_transcript_journal(settings):
+    """yapılandırmaya göre metin günlüğünü oluştur, kapalıysa None"""
+    section = settings['transcript']
+    if not section['journal_enabled']:
+        return None
+    previous = latest_session(section['journal_dir'])
+    if previous:
+        logging.info(f"önceki oturum günlüğü: {previous}")
+    journal = TranscriptJournal(section['journal_dir'], fsync_interval=section['fsync_interval'],
+                                max_sessions=section['max_sessions'])
+    logging.info(f"metin günlüğü: {journal.path}")
+    return journal
+
+def create_gaze_trace(settings):
+    """yapılandırmaya göre bakış izi yazıcısını oluştur, kapalıysa None"""
+    section = settings['eye_tracking']
+    if not section['gaze_trace']:
+        return None
+    path = os.path.join(section['gaze_trace_dir'],
+                        time.strftime("gaze-%Y%m%d-%H%M%S") + f"-{os.getpid()}")
+    trace = GazeTraceWriter(path, landmark_dtype=section['gaze_trace_landmarks'])
+    logging.info(f"bakış izi: {path}")
+    return trace
+
+def watch_config(settings, eye_tracker, speech_recognizer, performance_monitor):
+    """config.ini değişikliklerini çalışan modüllere canlı uygula"""
+    watcher = ConfigWatcher(CONFIG_FILE, settings)
+    watcher.subscribe('eye_tracking', eye_tracker.apply_settings)
+    watcher.subscribe('camera', eye_tracker.camera.apply_settings)
+    watcher.subscribe('speech_recognition', speech_recognizer.apply_settings)
+    watcher.subscribe('performance', performance_monitor.apply_settings)
+    watcher.start()
+    return watcher
+
+def register_metrics(monitor, eye_tracker, speech_recognizer):
+    """alt sistem sayaçlarını performans monitörüne kaydet"""
+    camera = eye_tracker.camera
+    monitor.register_metric('camera_frames', 'counter', "Frames read from the camera",
+                            lambda: camera.frame_index)
+    monitor.register_metric('camera_dropped_frames', 'counter', "Failed camera reads",
+                            lambda: camera.frames_dropped)
+    monitor.register_metric('eye_frames_processed', 'counter', "Frames run through FaceMesh",
+                            lambda: eye_tracker.frames_processed)
+    monitor.register_metric('eye_clicks', 'counter', "Dwell clicks performed",
+                            lambda: eye_tracker.click_count)
+    monitor.register_metric('speech_queue_depth', 'gauge', "Utterances waiting for a decoder",
+                            speech_recognizer.audio_queue.qsize)
+    monitor.register_metric('speech_segments_queued', 'counter', "Utterances queued for decoding",
+                            lambda: speech_recognizer.segments_queued)
+    monitor.register_metric('speech_segments_decoded', 'counter', "Utterances decoded",
+                            lambda: speech_recognizer.segments_decoded)
+    monitor.register_metric('speech_decode_rtf', 'gauge', "Whisper decode time / audio time",
+                            lambda: speech_recognizer.decode_rtf)
+
+def check_dependencies(whisper_engine='openai'):
     """paketlerin olup olmadığını kontrol et"""
     required_modules = [
         ('cv2', 'opencv-python'),
@@ -41,7 +127,7 @@ def check_dependencies():
         ('PyQt5', 'PyQt5'),
         ('pyautogui', 'pyautogui'),
         ('speech_recognition', 'SpeechRecognition'),
-        ('whisper', 'openai-whisper'),
+        ENGINE_MODULES.get(whisper_engine, ENGINE_MODULES['openai']),
         ('numpy', 'numpy'),
         ('face_recognition', 'face-recognition'),
         ('PIL', 'pillow'),
@@ -67,29 +153,78 @@ def main():
         # stil ayarla
         app.setStyle('Fusion')
         
+        # ayarları oku
+        settings = load_config()
+        
         # paketleri kontrol et
-        deps_ok, error_msg = check_dependencies()
+        deps_ok, error_msg = check_dependencies(settings['speech_recognition']['whisper_engine'])
         if not deps_ok:
             QMessageBox.critical(None, "hata", f"paketler eksik!\n\n{error_msg}\n\nrequirements.txt dosyasındaki paketleri yükle.")
             return
         
         # ana pencereyi oluştur
         window = VisionCursorGUI()
+        window.resize(settings['gui']['window_width'], settings['gui']['window_height'])
+        window.set_font_size(settings['gui']['font_size'])
         window.show()
         
         # göz takibi ve ses modüllerini başlat
         try:
             # Performans monitörü başlat
-            performance_monitor = PerformanceMonitor()
-            performance_monitor.start_monitoring()
+            performance = settings['performance']
+            performance_monitor = PerformanceMonitor(
+                instrumentation=performance['instrumentation'],
+                sample_interval=performance['sample_interval'],
+                fps_history_size=performance['fps_history_size'],
+                accuracy_history_size=performance['accuracy_history_size'],
+                system_history_size=performance['system_history_size'])
+            # iz kaydı ayarları; kill -USR2 ile iz dosyası yazılır
+            performance_monitor.apply_settings(performance)
+            performance_monitor.install_trace_signal()
+            if performance['monitor_enabled']:
+                performance_monitor.start_monitoring()
+            
+            eye_tracker = EyeTracker(performance_monitor=performance_monitor)
+            eye_tracker.apply_settings(settings['eye_tracking'])
+            eye_tracker.camera.apply_settings(settings['camera'])
+            eye_tracker.trace = create_gaze_trace(settings)
+            speech_recognizer = SpeechRecognizer(callback=window.on_speech_recognized,
+                                                 **speech_settings(settings))
+            speech_recognizer.apply_settings(settings['speech_recognition'])
+            
+            # alt sistem bellek ölçümleri
+            performance_monitor.register_memory_probe('eye_tracking', eye_tracker.memory_usage)
+            performance_monitor.register_memory_probe('speech', speech_recognizer.memory_usage)
             
-            eye_tracker = EyeTracker()
-            speech_recognizer = SpeechRecognizer(callback=window.on_speech_recognized)
+            # uzun oturumlar için bellek büyümesi profili
+            if performance['memory_profiling']:
+                performance_monitor.enable_memory_profiling(
+                    output_dir=performance['memory_profile_dir'],
+                    interval=performance['memory_profile_interval'],
+                    frame_counter=lambda: eye_tracker.frames_processed)
+            
+            # dışa aktarılan sayaç ve göstergeler
+            register_metrics(performance_monitor, eye_tracker, speech_recognizer)
+            if performance['metrics_exporter']:
+                MetricsExporter(
+                    performance_monitor,
+                    host=performance['metrics_host'],
+                    port=performance['metrics_port']
+                ).start()
             
             # modülleri gui'ye bağla
             window.set_eye_tracker(eye_tracker)
             window.set_speech_recognizer(speech_recognizer)
-            window.set_performance_monitor(performance_monitor)
+            window.set_performance_monitor(performance_monitor,
+                                           update_interval=performance['stats_update_interval'])
+            
+            # tanınan metin günlüğe yazılır
+            journal = create_transcript_journal(settings)
+            if journal:
+                window.set_transcript_journal(journal)
+            
+            # ayar değişiklikleri yeniden başlatmadan uygulanır
+            watch_config(settings, eye_tracker, speech_recognizer, performance_monitor)
             
             # göz takibini başlat
             eye_tracker.start()
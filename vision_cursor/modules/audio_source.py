@@ -0,0 +1,253 @@
+"""
+VisionCursor Ses Kaynakları
+
+SpeechRecognizer'ın dinleme döngüsü bu kaynaklardan biriyle çalışır:
+- MicrophoneSource: canlı mikrofon
+- FileSource: WAV/AIFF/FLAC dosyası
+- NumpySource: numpy dizileri üreten bir üreteç
+
+Dosya ve üreteç kaynakları gerçek zamanlı, hızlandırılmış ya da
+sınırsız (speed=0) hızda okunabilir. Böylece ses işlem hattı başsız bir
+makinede saatlerce dikte ile dakikalar içinde test edilebilir.
+"""
+
+import time
+import numpy as np
+import speech_recognition as sr
+
+
+class ThrottledStream:
+    """Okuma hızını ses süresine göre sınırlayan akış sarmalayıcısı"""
+
+    def __init__(self, stream, sample_rate, sample_width, speed=1.0):
+        self.stream = stream
+        self.bytes_per_second = sample_rate * sample_width
+        self.speed = speed              # 1.0 gerçek zaman, 0 sınırsız
+        self.bytes_read = 0
+        self.exhausted = False
+        self._start_time = None
+
+    def read(self, size):
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+
+        data = self.stream.read(size)
+        if not data:
+            self.exhausted = True
+            return data
+        self.bytes_read += len(data)
+
+        if self.speed:
+            # Okunan sesin süresi kadar (hıza bölünmüş) zaman geçmesini bekle
+            target = self.bytes_read / self.bytes_per_second / self.speed
+            delay = target - (time.perf_counter() - self._start_time)
+            if delay > 0:
+                time.sleep(delay)
+        return data
+
+    @property
+    def audio_seconds(self):
+        return self.bytes_read / self.bytes_per_second
+
+
+class MicrophoneSource:
+    """Canlı mikrofon kaynağı"""
+
+    live = True
+
+    def __init__(self, device_index=None, sample_rate=None, chunk_size=1024):
+        self.device_index = device_index
+        self.sample_rate = sample_rate
+        self.chunk_size = chunk_size
+        self._source = None
+
+    @property
+    def device_key(self):
+        """Cihazı tanımlayan anahtar"""
+        if self.device_index is None:
+            return "default"
+        try:
+            return sr.Microphone.list_microphone_names()[self.device_index]
+        except Exception:
+            return f"device_{self.device_index}"
+
+    @property
+    def exhausted(self):
+        return False
+
+    def __enter__(self):
+        self._source = sr.Microphone(
+            device_index=self.device_index,
+            sample_rate=self.sample_rate,
+            chunk_size=self.chunk_size
+        )
+        return self._source.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        result = self._source.__exit__(exc_type, exc_value, traceback)
+        self._source = None
+        return result
+
+    def __repr__(self):
+        return f"MicrophoneSource({self.device_key})"
+
+
+class FileSource:
+    """WAV/AIFF/FLAC dosyasından ses kaynağı"""
+
+    live = False
+
+    def __init__(self, path, speed=1.0, loops=1):
+        self.path = path
+        self.speed = speed      # 1.0 gerçek zaman, 0 sınırsız
+        self.loops = loops      # Dosya kaç kez art arda çalınacak
+        self._file = None
+        self._stream = None
+
+    @property
+    def device_key(self):
+        return f"file:{self.path}"
+
+    @property
+    def exhausted(self):
+        return self._stream is not None and self._stream.exhausted
+
+    @property
+    def audio_seconds(self):
+        return self._stream.audio_seconds if self._stream else 0.0
+
+    def __enter__(self):
+        self._file = sr.AudioFile(self.path)
+        source = self._file.__enter__()
+        stream = _LoopingStream(self._file, source.stream, self.loops)
+        self._stream = ThrottledStream(stream, source.SAMPLE_RATE, source.SAMPLE_WIDTH, self.speed)
+        source.stream = self._stream
+        return source
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._file.__exit__(exc_type, exc_value, traceback)
+        self._file = None
+
+    def __repr__(self):
+        return f"FileSource({self.path}, speed={self.speed})"
+
+
+class _LoopingStream:
+    """Dosya sonunda başa saran akış"""
+
+    def __init__(self, audio_file, stream, loops):
+        self.audio_file = audio_file
+        self.stream = stream
+        self.remaining = loops
+
+    def read(self, size):
+        data = self.stream.read(size)
+        while not data and self.remaining > 1:
+            self.remaining -= 1
+            self.audio_file.audio_reader.rewind()
+            data = self.stream.read(size)
+        return data
+
+
+class _GeneratorStream:
+    """numpy üretecini bayt akışına çeviren okuyucu"""
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.buffer = bytearray()
+        self.finished = False
+
+    def read(self, size):
+        while len(self.buffer) < size and not self.finished:
+            try:
+                block = next(self.generator)
+            except StopIteration:
+                self.finished = True
+                break
+            block = np.asarray(block)
+            if block.dtype.kind == 'f':
+                # [-1, 1] aralığındaki float örnekler 16 bit PCM'e çevrilir
+                block = np.clip(block, -1.0, 1.0) * 32767
+            self.buffer += block.astype('<i2').tobytes()
+
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+class _ArrayAudioSource(sr.AudioSource):
+    """speech_recognition ile uyumlu bellek içi ses kaynağı"""
+
+    def __init__(self, stream, sample_rate, chunk_size):
+        self.stream = stream
+        self.SAMPLE_RATE = sample_rate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = chunk_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+class NumpySource:
+    """numpy dizileri üreten bir üreteçten ses kaynağı
+
+    Üreteç mono float32 ([-1, 1]) ya da int16 örnek blokları döndürmelidir.
+    """
+
+    live = False
+
+    def __init__(self, generator, sample_rate=16000, chunk_size=1024, speed=1.0):
+        self.generator = generator
+        self.sample_rate = sample_rate
+        self.chunk_size = chunk_size
+        self.speed = speed
+        self._stream = None
+
+    @property
+    def device_key(self):
+        return "numpy"
+
+    @property
+    def exhausted(self):
+        return self._stream is not None and self._stream.exhausted
+
+    @property
+    def audio_seconds(self):
+        return self._stream.audio_seconds if self._stream else 0.0
+
+    def __enter__(self):
+        self._stream = ThrottledStream(_GeneratorStream(self.generator),
+                                       self.sample_rate, 2, self.speed)
+        return _ArrayAudioSource(self._stream, self.sample_rate, self.chunk_size)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+    def __repr__(self):
+        return f"NumpySource(speed={self.speed})"
+
+
+def synthetic_speech(duration, sample_rate=16000, block_seconds=0.1, seed=0):
+    """Konuşma benzeri (ses patlaması + sessizlik) sentetik sinyal üreteci
+
+    Enerji tabanlı konuşma algılamayı tetikleyen, yük testleri için basit bir
+    kaynak üretir.
+    """
+    rng = np.random.default_rng(seed)
+    block = int(sample_rate * block_seconds)
+    t = np.arange(block) / sample_rate
+    produced = 0.0
+    while produced < duration:
+        # 1-4 saniye "konuşma", ardından 0.5-1.5 saniye sessizlik
+        speech_blocks = int(rng.uniform(1.0, 4.0) / block_seconds)
+        silence_blocks = int(rng.uniform(0.5, 1.5) / block_seconds)
+        for _ in range(speech_blocks):
+            frequency = rng.uniform(120, 260)
+            tone = 0.3 * np.sin(2 * np.pi * frequency * t) * (1 + 0.5 * np.sin(2 * np.pi * 4 * t))
+            yield (tone + rng.normal(0, 0.01, block)).astype(np.float32)
+        for _ in range(silence_blocks):
+            yield rng.normal(0, 0.002, block).astype(np.float32)
+        produced += (speech_blocks + silence_blocks) * block_seconds
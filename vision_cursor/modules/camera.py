@@ -1,6 +1,7 @@
 import cv2
 import numpy as np
 import threading
+from .instrumentation import stage, set_trace_args
 
 class Camera:
     def __init__(self, width=640, height=480, fps=30):
@@ -11,6 +12,11 @@ class Camera:
         self.is_running = False
         self.frame = None
         self.thread = None
+        self.frame_index = 0  # İz kaydında kareleri eşlemek için
+        self.frames_dropped = 0  # Okunamayan kareler
+        # Canlı ayar değişiklikleri yakalama döngüsünde uygulanır
+        self._pending_settings = None
+        self._settings_lock = threading.Lock()
 
     def start(self, callback=None):
         if self.is_running:
@@ -51,15 +57,13 @@ class Camera:
             return False
             
         # Kamera ayarları
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
-        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        self._configure_capture()
         
         # Buffer boyutunu azalt (düşük gecikme için)
         self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         
         self.is_running = True
-        self.thread = threading.Thread(target=self._capture_loop, args=(callback,))
+        self.thread = threading.Thread(target=self._capture_loop, args=(callback,), name="camera-capture")
         self.thread.daemon = True
         self.thread.start()
         return True
@@ -73,13 +77,44 @@ class Camera:
         self.cap = None
         self.frame = None
 
+    def _configure_capture(self):
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+
+    def apply_settings(self, settings):
+        """[camera] ayarlarını uygula; kamera açıksa yakalama iş parçacığında
+        bir sonraki okumadan önce uygulanır (VideoCapture iş parçacığı güvenli değil)"""
+        with self._settings_lock:
+            self._pending_settings = dict(self._pending_settings or {}, **settings)
+        if not self.is_running:
+            self._apply_pending_settings()
+
+    def _apply_pending_settings(self):
+        with self._settings_lock:
+            settings, self._pending_settings = self._pending_settings, None
+        if not settings:
+            return
+        for name in ('width', 'height', 'fps'):
+            if name in settings:
+                setattr(self, name, settings[name])
+        if self.cap is not None:
+            self._configure_capture()
+
     def _capture_loop(self, callback):
         while self.is_running:
-            ret, frame = self.cap.read()
+            if self._pending_settings is not None:
+                self._apply_pending_settings()
+            set_trace_args(frame=self.frame_index + 1)
+            with stage("camera.read"):
+                ret, frame = self.cap.read()
             if not ret or frame is None:
+                self.frames_dropped += 1
                 continue
-            frame = cv2.flip(frame, 1)
-            self.frame = frame.copy()
+            self.frame_index += 1
+            with stage("camera.flip_copy"):
+                frame = cv2.flip(frame, 1)
+                self.frame = frame.copy()
             if callback:
                 callback(frame)
 
@@ -0,0 +1,397 @@
+"""
+VisionCursor Komut Eşleştirici
+
+Sesli komut ve makroları derlenmiş yapılarla eşleştirir:
+- Tam ifade eşleşmeleri için kelime tabanlı Aho-Corasick otomatı
+- En uzun eşleşme önceliği ("göz takibini durdur" > "durdur")
+- ASR yazım hataları için komut kelimeleri üzerinde düzenleme mesafesi
+  indeksi (simetrik silme) ile bulanık arama
+
+Bulanık eşleşme yalnızca komut tüm cümleyi kapsıyorsa kabul edilir; 4
+harfe kadar kelimeler düzeltilmez, daha uzunlarda en fazla 1 mesafeye izin
+verilir. Komut kelimesinin çekimli hali olan kelimeler ("durdu", "başla",
+"kaydetti", "sile") düzeltilmez: bunlar yazım hatası değil, dikte edilen
+sıradan Türkçedir.
+
+Yıkıcı eylemler (metni silme, dinlemeyi durdurma) tam eşleşmede de
+cümlenin neredeyse tamamı olmalıdır: komut dışında en fazla bir kelime
+bulunabilir. "bu dosyayı sil lütfen" metni temizlemez.
+"""
+
+import configparser
+from collections import deque
+
+from .text_processing import turkish_lower, normalize_words
+
+# Dikte içinde geçtiğinde yanlışlıkla çalışması veri kaybettiren eylemler
+DESTRUCTIVE_ACTIONS = frozenset({'clear', 'stop_speech'})
+
+
+def edit_distance(a, b, limit=None):
+    """İki dizi arasındaki Levenshtein mesafesi
+
+    limit verilirse mesafe limiti aştığında erken çıkılır ve limit + 1 döner.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if limit is not None and row_min > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class CommandMatch:
+    """Eşleşen komut bilgisi"""
+
+    __slots__ = ('phrase', 'actions', 'start', 'end', 'distance')
+
+    def __init__(self, phrase, actions, start, end, distance=0):
+        self.phrase = phrase          # Komut ifadesi
+        self.actions = actions        # Çalıştırılacak eylemler (makrolarda birden fazla)
+        self.start = start            # Metindeki ilk kelime indeksi
+        self.end = end                # Metindeki son kelime indeksi (hariç)
+        self.distance = distance      # 0: tam eşleşme, >0: bulanık eşleşme
+
+    @property
+    def exact(self):
+        return self.distance == 0
+
+    def __repr__(self):
+        return f"CommandMatch({self.phrase!r}, {self.actions!r}, distance={self.distance})"
+
+
+class AhoCorasick:
+    """Kelime dizileri üzerinde çalışan Aho-Corasick otomatı"""
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]   # Bu düğümde biten en uzun ifade
+        self._link = [0]        # Sonek zincirinde bir sonraki çıkışlı düğüm
+        self._built = False
+
+    def add(self, words, value):
+        """Kelime dizisini otomata ekle"""
+        node = 0
+        for word in words:
+            next_node = self._goto[node].get(word)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][word] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._link.append(0)
+            node = next_node
+        self._output[node] = (len(words), value)
+        self._built = False
+
+    def build(self):
+        """Başarısızlık bağlantılarını BFS ile hesapla"""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for word, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(word, 0)
+                self._fail[child] = target if target != child else 0
+                fail_node = self._fail[child]
+                self._link[child] = fail_node if self._output[fail_node] else self._link[fail_node]
+                queue.append(child)
+        self._built = True
+
+    def iter_matches(self, words):
+        """(başlangıç, bitiş, değer) üçlülerini üret"""
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        link = self._link
+        node = 0
+        for index, word in enumerate(words):
+            while node and word not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(word, 0)
+
+            hit = node if output[node] else link[node]
+            while hit:
+                length, value = output[hit]
+                yield index + 1 - length, index + 1, value
+                hit = link[hit]
+
+
+# Türkçe ünsüz yumuşaması: kaydet -> kaydedi, git -> gidiyor
+_SOFTENING = {'p': 'b', 'ç': 'c', 't': 'd', 'k': 'ğ'}
+
+
+def is_inflection(word, root):
+    """word, root kelimesinin çekimli/eksik hali mi (yalnızca sondaki ekler farklı)
+
+    Biri diğerinin önekiyse (durdu / durdur, sile / sil) ya da root'un son
+    ünsüzü yumuşamış haliyle word başlıyorsa (kaydedin / kaydet) True.
+    """
+    if word.startswith(root) or root.startswith(word):
+        return True
+    softened = _SOFTENING.get(root[-1:])
+    return bool(softened) and word.startswith(root[:-1] + softened)
+
+
+def _deletes(word, depth):
+    """Kelimeden en fazla depth karakter silinerek elde edilen varyantlar"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(depth):
+        next_frontier = set()
+        for variant in frontier:
+            if len(variant) <= 1:
+                continue
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+class DeletionIndex:
+    """Simetrik silme yöntemiyle düzenleme mesafesi indeksi
+
+    Mesafesi k'yı aşmayan iki kelimenin, en fazla k silme ile elde edilen
+    ortak bir varyantı vardır. Sorguda yalnızca bu varyantlara bakılır ve
+    adaylar gerçek mesafe ile doğrulanır.
+    """
+
+    def __init__(self, max_distance=2):
+        self.max_distance = max_distance
+        self._index = {}
+        self.size = 0
+
+    def add(self, key):
+        """Anahtar ekle"""
+        self.size += 1
+        for variant in _deletes(key, self.max_distance):
+            self._index.setdefault(variant, []).append(key)
+
+    def search(self, key, max_distance):
+        """Mesafesi max_distance'ı aşmayan (mesafe, anahtar) listesini döndür"""
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variant in _deletes(key, max_distance):
+            keys = self._index.get(variant)
+            if keys:
+                candidates.update(keys)
+
+        results = []
+        for candidate in candidates:
+            distance = edit_distance(key, candidate, limit=max_distance)
+            if distance <= max_distance:
+                results.append((distance, candidate))
+        results.sort()
+        return results
+
+
+class CommandMatcher:
+    """Derlenmiş komut ve makro eşleştirici"""
+
+    def __init__(self, commands=None, max_distance=2, fuzzy_max_words=4,
+                 destructive_actions=DESTRUCTIVE_ACTIONS):
+        self.max_distance = max_distance          # Bulanık eşleşmede izin verilen en büyük mesafe
+        self.fuzzy_max_words = fuzzy_max_words    # Uzun dikte cümlelerinde bulanık arama yapılmaz
+        self.destructive_actions = frozenset(destructive_actions)
+        self.commands = {}
+        if commands:
+            for phrase, actions in commands.items():
+                self.add(phrase, actions)
+        self.compile()
+
+    def add(self, phrase, actions):
+        """Komut veya makro ekle; actions tek eylem ya da eylem listesi olabilir"""
+        if isinstance(actions, str):
+            actions = (actions,)
+        words = normalize_words(phrase)
+        if not words:
+            return
+        self.commands[' '.join(words)] = tuple(actions)
+        self._compiled = False
+
+    def compile(self):
+        """Otomatı ve bulanık arama indeksini oluştur"""
+        self._automaton = AhoCorasick()
+        self._fuzzy_index = DeletionIndex(self.max_distance)
+        self._vocabulary = set()
+        self._corrections = {}
+
+        for phrase in self.commands:
+            words = phrase.split()
+            self._automaton.add(words, phrase)
+            self._vocabulary.update(words)
+
+        if self.max_distance:
+            for word in self._vocabulary:
+                self._fuzzy_index.add(word)
+
+        self._automaton.build()
+        self._compiled = True
+
+    @property
+    def phrases(self):
+        return list(self.commands.keys())
+
+    def _tolerance(self, word):
+        """Kelime uzunluğuna göre izin verilen düzenleme mesafesi
+
+        Kısa kelimelerde tek harf değişikliği başka bir anlamlı kelime verir
+        (sil/sile, dur/durdu); bu yüzden 4 harfe kadar düzeltme yapılmaz.
+        """
+        if len(word) <= 4:
+            return 0
+        return min(self.max_distance, 1)
+
+    def _correct(self, word):
+        """Komut sözlüğündeki en yakın kelimeyi ve mesafesini bul"""
+        cached = self._corrections.get(word)
+        if cached is not None:
+            return cached
+
+        correction = (word, 0)
+        tolerance = self._tolerance(word)
+        if tolerance:
+            for distance, key in self._fuzzy_index.search(word, tolerance):
+                # Komut kökünün çekimli hali yazım hatası sayılmaz
+                if not is_inflection(word, key):
+                    correction = (key, distance)
+                    break
+
+        # Önbellek sınırsız büyümesin
+        if len(self._corrections) > 10000:
+            self._corrections.clear()
+        self._corrections[word] = correction
+        return correction
+
+    def _allowed(self, phrase, start, end, word_count):
+        """Yıkıcı komutun dışında cümlede en fazla bir kelime olabilir"""
+        if self.destructive_actions.isdisjoint(self.commands[phrase]):
+            return True
+        return word_count <= (end - start) + 1
+
+    def _longest(self, words, guarded=False):
+        """Otomat eşleşmeleri içinde en uzun, eşitlikte en erken olanı seç
+
+        guarded: dikte içinde kalan yıkıcı komutları atla
+        """
+        best = None
+        for start, end, phrase in self._automaton.iter_matches(words):
+            if guarded and not self._allowed(phrase, start, end, len(words)):
+                continue
+            if best is None or (end - start, -start) > (best[1] - best[0], -best[0]):
+                best = (start, end, phrase)
+        return best
+
+    def match(self, text):
+        """Metindeki en uygun komutu bul, yoksa None döndür
+
+        Tam ve bulanık adaylar birlikte değerlendirilir: daha uzun ifade
+        kazanır, eşitlikte mesafesi küçük olan. Böylece "göz takibni durdur"
+        içindeki tam "durdur" eşleşmesi, cümlenin tamamını kapsayan bulanık
+        "göz takibini durdur" eşleşmesini gölgelemez.
+        """
+        if not self._compiled:
+            self.compile()
+
+        words = normalize_words(text)
+        if not words:
+            return None
+
+        candidates = []
+        best = self._longest(words, guarded=True)
+        if best is not None:
+            start, end, phrase = best
+            candidates.append(CommandMatch(phrase, self.commands[phrase], start, end))
+
+        if len(words) <= self.fuzzy_max_words and self.max_distance:
+            fuzzy = self._fuzzy_match(words)
+            if fuzzy is not None:
+                candidates.append(fuzzy)
+
+        if not candidates:
+            return None
+        return max(candidates, key=lambda match: (match.end - match.start, -match.distance))
+
+    def _fuzzy_match(self, words):
+        """Sözlükte olmayan kelimeleri indeksle düzeltip otomatı yeniden çalıştır
+
+        Yalnızca düzeltilmiş komut cümlenin tamamını kapsıyorsa eşleşme
+        döner; "araba durdu" gibi dikte içindeki tek kelime komut sayılmaz.
+        """
+        corrected = []
+        distances = []
+        for word in words:
+            if word in self._vocabulary:
+                corrected.append(word)
+                distances.append(0)
+            else:
+                key, distance = self._correct(word)
+                corrected.append(key)
+                distances.append(distance)
+
+        if not any(distances):
+            return None
+
+        best = self._longest(corrected)
+        if best is None:
+            return None
+        start, end, phrase = best
+        if start != 0 or end != len(words):
+            return None
+        return CommandMatch(phrase, self.commands[phrase], start, end, sum(distances))
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """INI dosyasından komutları yükle
+
+        [commands] bölümü 'ifade = eylem', [macros] bölümü
+        'ifade = eylem1, eylem2' biçimindedir.
+        """
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.optionxform = turkish_lower
+        with open(path, encoding='utf-8') as f:
+            parser.read_file(f)
+
+        if parser.has_section('matcher'):
+            kwargs.setdefault('max_distance', parser.getint('matcher', 'max_distance', fallback=2))
+            kwargs.setdefault('fuzzy_max_words', parser.getint('matcher', 'fuzzy_max_words', fallback=4))
+            if parser.has_option('matcher', 'destructive_actions'):
+                actions = parser.get('matcher', 'destructive_actions')
+                kwargs.setdefault('destructive_actions', [a.strip() for a in actions.split(',') if a.strip()])
+
+        commands = {}
+        if parser.has_section('commands'):
+            for phrase, action in parser.items('commands'):
+                commands[phrase] = action.strip()
+        if parser.has_section('macros'):
+            for phrase, actions in parser.items('macros'):
+                commands[phrase] = [a.strip() for a in actions.split(',') if a.strip()]
+        return cls(commands, **kwargs)
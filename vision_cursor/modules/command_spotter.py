@@ -0,0 +1,67 @@
+import threading
+import time
+from .command_matcher import normalize_words
+
+# Whisper'ın beklediği örnekleme hızı
+SAMPLE_RATE = 16000
+
+
+class CommandSpotter:
+    """Kısa ses segmentlerinde sesli komutları hızlıca yakalar
+
+    Dikte modelinden önce küçük bir Whisper motoru, komut listesi ile
+    yönlendirilmiş ve kısa tutulmuş bir çözümleme yapar. Segment bir
+    komutsa dikte modeli hiç çalıştırılmaz.
+    """
+
+    def __init__(self, matcher, engine, language="tr", max_duration=2.0,
+                 max_tokens=12, no_speech_threshold=0.5, max_prompt_phrases=32, engine_lock=None):
+        self.matcher = matcher
+        self.engine = engine
+        # Motor çağrıları sıralanır; dikte motoru paylaşılıyorsa onun kilidi verilir
+        self.engine_lock = engine_lock or threading.Lock()
+        self.language = language
+        self.max_duration = max_duration          # Bu süreden uzun segmentler dikte sayılır
+        self.max_tokens = max_tokens              # Komutlar kısa, uzun çözümlemeye gerek yok
+        self.no_speech_threshold = no_speech_threshold
+
+        # Komut kelimeleri çözücüye ipucu olarak verilir (istem uzunluğu sınırlı)
+        self.prompt = ", ".join(matcher.phrases[:max_prompt_phrases])
+
+    def is_candidate(self, samples):
+        """Segment komut yolu için yeterince kısa mı"""
+        return len(samples) <= self.max_duration * SAMPLE_RATE
+
+    def spot(self, samples):
+        """Segment bir komutsa (metin, CommandMatch) döndür, değilse None"""
+        if not self.is_candidate(samples):
+            return None
+
+        start_time = time.time()
+        with self.engine_lock:
+            text, no_speech_prob = self.engine.transcribe(
+                samples, self.language, prompt=self.prompt, max_tokens=self.max_tokens
+            )
+
+        if no_speech_prob > self.no_speech_threshold:
+            return None
+
+        text = text.lower()
+        match = self.match(text)
+        if match:
+            elapsed = (time.time() - start_time) * 1000
+            print(f"Hızlı komut yolu: '{text}' ({elapsed:.0f} ms)")
+            return text, match
+        return None
+
+    def match(self, text):
+        """Metin yalnızca bir komuttan oluşuyorsa CommandMatch döndür"""
+        command_match = self.matcher.match(text)
+        if command_match is None:
+            return None
+
+        # Komut segmentin çoğunu kaplamalı, yoksa bu bir dikte cümlesidir
+        word_count = len(normalize_words(text))
+        if word_count > (command_match.end - command_match.start) + 1:
+            return None
+        return command_match
@@ -0,0 +1,69 @@
+"""
+VisionCursor Yapılandırma Dosyası Yazımı
+
+configparser dosyayı yeniden yazarken yorumları ve sıralamayı kaybeder.
+update_config() yalnızca değişen "anahtar = değer" satırlarını günceller;
+yorumlar, boş satırlar ve diğer bölümler olduğu gibi kalır.
+"""
+
+import os
+import re
+
+_SECTION = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+_OPTION = re.compile(r'^(\s*)([^#;=\s][^=]*?)(\s*=\s*)(.*?)(\s*)$')
+
+
+def format_value(value):
+    """Python değerini config.ini biçimine çevir"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
+def update_config(path, section, values):
+    """section bölümündeki anahtarları values ile güncelle
+
+    Bölümde olmayan anahtarlar bölümün son ayarından sonra, bölüm yoksa
+    dosyanın sonuna eklenir. Dosya geçici dosya üzerinden atomik olarak
+    değiştirilir.
+    """
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+
+    pending = {key: format_value(value) for key, value in values.items()}
+    current = None
+    section_end = None  # Bölümün son ayar satırından sonraki konum
+    for i, line in enumerate(lines):
+        match = _SECTION.match(line)
+        if match:
+            current = match.group(1).strip()
+            if current == section:
+                section_end = i + 1
+            continue
+        if current != section:
+            continue
+        match = _OPTION.match(line)
+        if not match:
+            continue
+        section_end = i + 1
+        key = match.group(2).strip()
+        if key in pending:
+            indent, _, separator, _, trailing = match.groups()
+            lines[i] = f"{indent}{key}{separator}{pending.pop(key)}{trailing}"
+
+    if pending:
+        added = [f"{key} = {value}" for key, value in pending.items()]
+        if section_end is None:
+            if lines and lines[-1].strip():
+                lines.append("")
+            lines.append(f"[{section}]")
+            lines.extend(added)
+        else:
+            lines[section_end:section_end] = added
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(temp_path, path)
@@ -0,0 +1,72 @@
+"""
+VisionCursor İmleç Arka Uçları
+
+EyeTracker imleci bu arayüz üzerinden hareket ettirir:
+- PyAutoGuiCursor: gerçek fare imleci (pyautogui)
+- RecordingCursor: hareketleri ve tıklamaları zaman damgasıyla kaydeder;
+  ekran gerekmez (gecikme ölçümü, karşılaştırmalar)
+"""
+
+import time
+from collections import deque
+
+
+class CursorBackend:
+    """İmleç arka ucu arayüzü"""
+
+    def size(self):
+        """Ekran boyutu (genişlik, yükseklik) piksel"""
+        raise NotImplementedError
+
+    def move_to(self, x, y):
+        raise NotImplementedError
+
+    def click(self):
+        raise NotImplementedError
+
+
+class PyAutoGuiCursor(CursorBackend):
+    def __init__(self):
+        # Ekransız ortamlarda pyautogui içe aktarılırken hata verir
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def size(self):
+        return self._pyautogui.size()
+
+    def move_to(self, x, y):
+        self._pyautogui.moveTo(x, y)
+
+    def click(self):
+        self._pyautogui.click()
+
+
+class RecordingCursor(CursorBackend):
+    """İmleci hareket ettirmeden (zaman, x, y) olaylarını kaydeder"""
+
+    def __init__(self, width=1920, height=1080, clock=time.perf_counter, max_events=None):
+        self.width = width
+        self.height = height
+        self.clock = clock
+        self.position = None
+        self.last_move_time = None
+        self.moves = deque(maxlen=max_events)   # (zaman, x, y)
+        self.clicks = deque(maxlen=max_events)  # (zaman, x, y)
+
+    def size(self):
+        return self.width, self.height
+
+    def move_to(self, x, y):
+        self.last_move_time = self.clock()
+        self.position = (x, y)
+        self.moves.append((self.last_move_time, x, y))
+
+    def click(self):
+        x, y = self.position if self.position else (None, None)
+        self.clicks.append((self.clock(), x, y))
+
+    def reset(self):
+        self.position = None
+        self.last_move_time = None
+        self.moves.clear()
+        self.clicks.clear()
@@ -1,27 +1,30 @@
 import numpy as np
 import mediapipe as mp
-import pyautogui
 import time
 import threading
 import cv2
 from .camera import Camera
+from .cursor import PyAutoGuiCursor
+from .instrumentation import stage
 
 class EyeTracker:
-    def __init__(self):
-        # MediaPipe yüz algılama modülü
+    def __init__(self, performance_monitor=None, cursor=None):
+        # MediaPipe yüz algılama modülü (ayarlar nokta önbelleği anahtarına da girer)
+        self.face_mesh_settings = {
+            'max_num_faces': 1,
+            'refine_landmarks': True,
+            'min_detection_confidence': 0.7,
+            'min_tracking_confidence': 0.7
+        }
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        )
+        self.face_mesh = self.mp_face_mesh.FaceMesh(**self.face_mesh_settings)
         
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
-        # Ekran boyutları
-        self.screen_width, self.screen_height = pyautogui.size()
+        # İmleç arka ucu ve ekran boyutları
+        self.cursor = cursor or PyAutoGuiCursor()
+        self.screen_width, self.screen_height = self.cursor.size()
         
         # Kamera
         self.camera = Camera(width=640, height=480, fps=30)
@@ -29,11 +32,19 @@ class EyeTracker:
         # İzleme durumu
         self.tracking = False
         
+        # FPS ölçümü için
+        self.performance_monitor = performance_monitor
+        
+        # Kare başına bakış izi (GazeTraceWriter), kapalıyken None
+        self.trace = None
+        
         # Göz takibi için değişkenler
         self.last_positions = []
         self.smooth_factor = 8
         self.frame_skip = 2
         self.frame_count = 0
+        self.frames_processed = 0
+        self.click_count = 0
         
         # Tıklama için değişkenler
         self.gaze_duration = 0
@@ -42,7 +53,7 @@ class EyeTracker:
         self.movement_threshold = 20  # Daha geniş hareket toleransı
         self.last_time = time.time()
         self.click_cooldown = 1.0  # Tıklamalar arası minimum süre
-        self.last_click_time = 0
+        self.last_click_time = float('-inf')
         
         # Kalibrasyon
         self.offset_x = 0
@@ -57,6 +68,10 @@ class EyeTracker:
         self.LEFT_IRIS = [474, 475, 476, 477]
         self.RIGHT_IRIS = [469, 470, 471, 472]
         
+        # Canlı ayar değişiklikleri bir sonraki karenin başında toplu uygulanır
+        self._pending_settings = None
+        self._settings_lock = threading.Lock()
+        
     def start(self):
         if self.tracking:
             return
@@ -75,58 +90,106 @@ class EyeTracker:
     def stop(self):
         self.tracking = False
         self.camera.stop()
+        if self.trace is not None:
+            self.trace.flush()
         print("Göz takibi durduruldu")
     
-    def _process_frame(self, image):
+    def _process_frame(self, image, timestamp=None):
+        """Kamera karesini işle; timestamp karenin zamanı (saniye, varsayılan: şimdi)
+
+        İmlecin taşındığı ekran konumunu, kare atlandıysa ya da yüz yoksa None döndürür.
+        """
         if not self.tracking:
-            return
+            return None
+        
+        if self._pending_settings is not None:
+            self._apply_pending_settings()
+        
+        if self.performance_monitor:
+            self.performance_monitor.record_frame()
             
         # Performans için frame atlama
         self.frame_count += 1
         if self.frame_count % self.frame_skip != 0:
-            return
+            return None
+        self.frames_processed += 1
             
         try:
-            # RGB'ye çevir
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # MediaPipe ile yüz tespiti
-            results = self.face_mesh.process(rgb_image)
-            
-            if results.multi_face_landmarks:
-                face_landmarks = results.multi_face_landmarks[0]
-                
-                # İris merkezlerini al
-                left_iris_center = self._get_iris_center(face_landmarks, self.LEFT_IRIS)
-                right_iris_center = self._get_iris_center(face_landmarks, self.RIGHT_IRIS)
-                
-                if left_iris_center and right_iris_center:
-                    # Ortalamasını al
-                    avg_x = (left_iris_center[0] + right_iris_center[0]) / 2
-                    avg_y = (left_iris_center[1] + right_iris_center[1]) / 2
-                    
-                    # Görüntü koordinatlarına çevir
-                    img_x = int(avg_x * image.shape[1])
-                    img_y = int(avg_y * image.shape[0])
-                    
-                    # Pozisyonu yumuşat
-                    smooth_x, smooth_y = self._smooth_position(img_x, img_y)
-                    
-                    # Ekran koordinatlarına ölçekle
-                    screen_x = self._map_to_screen_x(smooth_x, image.shape[1])
-                    screen_y = self._map_to_screen_y(smooth_y, image.shape[0])
-                    
-                    # İmleci hareket ettir
-                    pyautogui.moveTo(int(screen_x), int(screen_y))
-                    
-                    # Tıklama kontrolü
-                    self._check_for_click(smooth_x, smooth_y)
-                    
-                    # Görselleştirme
-                    self._draw_tracking_info(image, img_x, img_y)
+            face_landmarks = self._detect_face(image)
+            if face_landmarks is not None:
+                return self._process_landmarks(face_landmarks, image, timestamp)
+            if self.trace is not None:
+                self._record_trace(timestamp)
             
         except Exception as e:
             print(f"Frame işleme hatası: {str(e)}")
+        return None
+    
+    def _detect_face(self, image):
+        """BGR karede FaceMesh çalıştır: ilk yüzün noktaları ya da None"""
+        # RGB'ye çevir
+        with stage("eye.cvt_color"):
+            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        
+        # MediaPipe ile yüz tespiti
+        with stage("eye.face_mesh"):
+            results = self.face_mesh.process(rgb_image)
+        
+        if results.multi_face_landmarks:
+            return results.multi_face_landmarks[0]
+        return None
+    
+    def _process_landmarks(self, face_landmarks, image, timestamp=None):
+        """Yüz noktalarından imleci hareket ettir, ekran konumunu döndür (iris yoksa None)"""
+        # İris merkezlerini al
+        with stage("eye.landmarks"):
+            left_iris_center = self._get_iris_center(face_landmarks, self.LEFT_IRIS)
+            right_iris_center = self._get_iris_center(face_landmarks, self.RIGHT_IRIS)
+        
+        if not (left_iris_center and right_iris_center):
+            if self.trace is not None:
+                self._record_trace(timestamp, face_landmarks, (left_iris_center, right_iris_center))
+            return None
+        
+        # Ortalamasını al
+        avg_x = (left_iris_center[0] + right_iris_center[0]) / 2
+        avg_y = (left_iris_center[1] + right_iris_center[1]) / 2
+        
+        # Görüntü koordinatlarına çevir
+        img_x = int(avg_x * image.shape[1])
+        img_y = int(avg_y * image.shape[0])
+        
+        # Pozisyonu yumuşat
+        with stage("eye.smoothing"):
+            smooth_x, smooth_y = self._smooth_position(img_x, img_y)
+        
+        # Ekran koordinatlarına ölçekle
+        screen_x = int(self._map_to_screen_x(smooth_x, image.shape[1]))
+        screen_y = int(self._map_to_screen_y(smooth_y, image.shape[0]))
+        
+        # İmleci hareket ettir
+        with stage("eye.move_to"):
+            self.cursor.move_to(screen_x, screen_y)
+        
+        # Tıklama kontrolü
+        with stage("eye.click_check"):
+            self._check_for_click(smooth_x, smooth_y, timestamp)
+        
+        # Görselleştirme
+        self._draw_tracking_info(image, img_x, img_y)
+        
+        if self.trace is not None:
+            self._record_trace(timestamp, face_landmarks, (left_iris_center, right_iris_center),
+                               (smooth_x, smooth_y), (screen_x, screen_y))
+        return screen_x, screen_y
+    
+    def _record_trace(self, timestamp, face_landmarks=None, iris=None, gaze=None, screen=None):
+        """İşlenen kareyi bakış izine ekle"""
+        with stage("eye.trace"):
+            self.trace.append(
+                self.frame_count, timestamp if timestamp is not None else time.time(),
+                landmarks=face_landmarks.landmark if face_landmarks is not None else None,
+                iris=iris, gaze=gaze, screen=screen)
     
     def _get_iris_center(self, face_landmarks, iris_indices):
         """İris merkezini hesapla"""
@@ -175,13 +238,14 @@ class EyeTracker:
         screen_y = normalized_y * self.screen_height * self.scale_y + self.offset_y
         return max(0, min(self.screen_height - 1, screen_y))
     
-    def _check_for_click(self, x, y):
+    def _check_for_click(self, x, y, current_time=None):
         """Sabit bakış tıklama kontrolü"""
         if not self.clicking_enabled:
             return
             
         try:
-            current_time = time.time()
+            if current_time is None:
+                current_time = time.time()
             
             # Cooldown kontrolü
             if current_time - self.last_click_time < self.click_cooldown:
@@ -198,7 +262,10 @@ class EyeTracker:
                     
                     if self.gaze_duration > self.gaze_threshold:
                         # Tıklama yap
-                        pyautogui.click()
+                        self.cursor.click()
+                        self.click_count += 1
+                        if self.trace is not None:
+                            self.trace.click(current_time, self.frame_count, x, y)
                         self.gaze_duration = 0
                         self.last_click_time = current_time
                         print("Göz tıklaması!")
@@ -227,6 +294,47 @@ class EyeTracker:
         except Exception as e:
             print(f"Görselleştirme hatası: {e}")
     
+    def apply_settings(self, settings):
+        """[eye_tracking] ayarlarını uygula (bilinmeyen anahtarlar yok sayılır)
+
+        Takip sürerken değerler kare iş parçacığında, bir sonraki karenin
+        başında birlikte uygulanır; bir kare hiçbir zaman eski ve yeni
+        ayarların karışımıyla işlenmez.
+        """
+        with self._settings_lock:
+            self._pending_settings = dict(self._pending_settings or {}, **settings)
+        if not self.tracking:
+            self._apply_pending_settings()
+    
+    def _apply_pending_settings(self):
+        with self._settings_lock:
+            settings, self._pending_settings = self._pending_settings, None
+        if not settings:
+            return
+        for name in ('smooth_factor', 'frame_skip', 'gaze_threshold', 'movement_threshold',
+                     'click_cooldown', 'clicking_enabled'):
+            if name in settings:
+                setattr(self, name, settings[name])
+        # Küçülen yumuşatma penceresi hemen geçerli olsun
+        del self.last_positions[:-self.smooth_factor]
+        
+        # Güven eşikleri FaceMesh yeniden oluşturularak uygulanır
+        confidence = {key: settings[name] for name, key in (
+            ('detection_confidence', 'min_detection_confidence'),
+            ('tracking_confidence', 'min_tracking_confidence')) if name in settings}
+        if any(self.face_mesh_settings[key] != value for key, value in confidence.items()):
+            self.face_mesh_settings = dict(self.face_mesh_settings, **confidence)
+            previous, self.face_mesh = self.face_mesh, self.mp_face_mesh.FaceMesh(**self.face_mesh_settings)
+            previous.close()
+    
+    def reset_state(self):
+        """Yumuşatma ve tıklama durumunu sıfırla (ör. kayıtta yeni bölüme geçerken)"""
+        self.last_positions = []
+        self.frame_count = 0
+        self.gaze_duration = 0
+        self.last_gaze_pos = None
+        self.last_click_time = float('-inf')
+    
     def calibrate(self, offset_x=0, offset_y=0, scale_x=1.0, scale_y=1.0):
         """Kalibrasyon ayarları"""
         self.offset_x = offset_x
@@ -235,6 +343,12 @@ class EyeTracker:
         self.scale_y = scale_y
         print(f"Kalibrasyon: offset({offset_x}, {offset_y}), scale({scale_x}, {scale_y})")
     
+    def memory_usage(self):
+        """Göz takibinin bilinen bellek kullanımı (bayt): kamera kareleri"""
+        frame = self.camera.frame
+        # Son kare ve geri çağrıya verilen kopya
+        return frame.nbytes * 2 if frame is not None else 0
+    
     def get_frame(self):
         """Mevcut frame'i al"""
         return self.camera.get_frame()
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+VisionCursor Bakış Ölçütleri
+
+Etiketli kayıtlarda imleç davranışını ölçer: sakkad sonrası oturma süresi,
+sabit durum hatası, titreme ve yanlış tıklama oranı. Gecikme ölçümü
+(benchmarks/gaze_latency.py) ve parametre taraması (sweep_gaze.py) aynı
+tanımları kullanır.
+
+Etiket dosyası CSV'dir: frame,x,y[,t][,click]. x ve y hedefin normalize
+ekran konumu (0-1), t saniye cinsinden kare zamanı, click o karede
+tıklama istendiyse 1'dir.
+"""
+
+import csv
+
+import numpy as np
+
+
+def load_labels(path):
+    """{kare: (x, y, t ya da None, tıklama)}"""
+    labels = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            t = row.get('t')
+            labels[int(row['frame'])] = (float(row['x']), float(row['y']),
+                                         float(t) if t not in (None, '') else None,
+                                         row.get('click') in ('1', 'true', 'True'))
+    return labels
+
+
+def summarize(values):
+    """Ortalama, p50/p95/p99 ve en büyük değer; değer yoksa None"""
+    if not values:
+        return None
+    values = np.asarray(values, dtype=np.float64)
+    return {
+        'mean': float(values.mean()),
+        'p50': float(np.percentile(values, 50)),
+        'p95': float(np.percentile(values, 95)),
+        'p99': float(np.percentile(values, 99)),
+        'max': float(values.max())
+    }
+
+
+def analyze(records, screen_size, tolerance=50.0, hold=3):
+    """Sakkad başına oturma süresi, yerleştikten sonraki piksel hatası ve titreme
+
+    records: kare başına {'t', 'target' (normalize ya da None), 'cursor' (piksel ya da None)}.
+    Hedef tolerans değerinden fazla sıçradığında yeni bir sabit bakış başlar.
+    İmleç hold kare boyunca tolerans içinde kaldığı ilk karede yerleşmiş sayılır.
+    Hiç yerleşmeyen sakkadlar 'settling_penalized_ms' içinde sabit bakışın
+    tüm süresiyle sayılır. Titreme, yerleşmiş karelerde ardışık imleç
+    konumları arasındaki mesafenin karesel ortalamasıdır.
+    """
+    width, height = screen_size
+    for record in records:
+        target, position = record['target'], record['cursor']
+        record['target_px'] = (target[0] * width, target[1] * height) if target else None
+        if target and position:
+            record['error_px'] = float(np.hypot(position[0] - record['target_px'][0],
+                                                position[1] - record['target_px'][1]))
+        else:
+            record['error_px'] = None
+
+    # Sabit bakış dilimleri: [(başlangıç, bitiş)] kayıt indeksleri
+    segments = []
+    start = None
+    previous = None
+    for i, record in enumerate(records):
+        target = record['target_px']
+        if target is None:
+            continue
+        if previous is None or np.hypot(target[0] - previous[0], target[1] - previous[1]) > tolerance:
+            if start is not None:
+                segments.append((start, i))
+            start = i
+        previous = target
+    if start is not None:
+        segments.append((start, len(records)))
+
+    settling = []
+    penalized = []
+    steady_errors = []
+    steps = []
+    unsettled = 0
+    # İlk dilim başlangıç konumundan gelir, sakkad sayılmaz
+    for segment_index, (begin, end) in enumerate(segments):
+        errors = [records[i]['error_px'] for i in range(begin, end)]
+        settled_at = None
+        for i in range(len(errors) - hold + 1):
+            window = errors[i:i + hold]
+            if all(error is not None and error <= tolerance for error in window):
+                settled_at = i
+                break
+        if settled_at is None:
+            if segment_index:
+                unsettled += 1
+                penalized.append((records[end - 1]['t'] - records[begin]['t']) * 1000)
+            continue
+        if segment_index:
+            settling.append((records[begin + settled_at]['t'] - records[begin]['t']) * 1000)
+            penalized.append(settling[-1])
+        steady_errors.extend(error for error in errors[settled_at:] if error is not None)
+        positions = [records[i]['cursor'] for i in range(begin + settled_at, end)]
+        steps.extend(float(np.hypot(b[0] - a[0], b[1] - a[1]))
+                     for a, b in zip(positions, positions[1:]) if a and b)
+
+    return {
+        'saccades': max(0, len(segments) - 1),
+        'unsettled': unsettled,
+        'settling_ms': summarize(settling),
+        'settling_penalized_ms': float(np.mean(penalized)) if penalized else None,
+        'steady_error_px': summarize(steady_errors),
+        'jitter_px': float(np.sqrt(np.mean(np.square(steps)))) if steps else None
+    }
+
+
+def click_metrics(click_times, label_click_times, duration, window=1.0):
+    """Tıklamaları etiketlerle eşle: doğru, yanlış, kaçan ve dakikada yanlış tıklama
+
+    Etiketlenmiş bir tıklamadan en fazla window saniye sonra gelen ilk
+    tıklama doğru sayılır; kalanlar yanlış tıklamadır.
+    """
+    labels = sorted(label_click_times)
+    used = [False] * len(labels)
+    true_clicks = 0
+    for t in sorted(click_times):
+        for i, label in enumerate(labels):
+            if not used[i] and label <= t <= label + window:
+                used[i] = True
+                true_clicks += 1
+                break
+    false_clicks = len(click_times) - true_clicks
+    return {
+        'clicks': len(click_times),
+        'true_clicks': true_clicks,
+        'false_clicks': false_clicks,
+        'missed_clicks': len(labels) - true_clicks,
+        'false_clicks_per_min': false_clicks / (duration / 60) if duration else None
+    }
@@ -0,0 +1,200 @@
+"""
+VisionCursor Bakış Parametre Taraması
+
+Önbellekteki yüz noktalarını (landmark_cache) farklı yumuşatma, sabit bakış
+ve tıklama ayarlarıyla EyeTracker işlem hattına yeniden verir ve her
+yapılandırmayı etiketlere göre ölçer. Yapılandırmalar süreç havuzunda
+paralel değerlendirilir; FaceMesh hiç çalıştırılmaz.
+
+Arama uzayı "ad=değerler" biçimindedir:
+    smooth_factor=2,4,8         ızgara değerleri
+    gaze_threshold=1.0:3.0      rastgele arama aralığı (iki tamsayı ise tamsayı)
+"""
+
+import contextlib
+import io
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .gaze_metrics import analyze, click_metrics
+
+# Taranabilen EyeTracker ayarları ve tipleri
+PARAMETERS = {
+    'smooth_factor': int,
+    'movement_threshold': float,
+    'gaze_threshold': float,
+    'click_cooldown': float,
+    'frame_skip': int,
+}
+
+# Sıralama puanı ağırlıkları (düşük puan daha iyi)
+DEFAULT_WEIGHTS = {
+    'latency': 0.01,        # ms başına (sakkad sonrası ortalama oturma süresi)
+    'jitter': 1.0,          # piksel başına
+    'false_clicks': 10.0,   # dakikadaki yanlış tıklama başına
+    'missed_clicks': 5.0,   # kaçan tıklama oranı (0-1) başına
+}
+
+# İşçi sürecindeki değerlendirme verisi
+_worker_state = None
+
+
+def parse_space(specs):
+    """["ad=1,2,3", "ad=0.5:2.0"] -> {ad: [değerler] ya da (alt, üst)}"""
+    space = {}
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        name = name.strip()
+        if name not in PARAMETERS:
+            raise ValueError(f"Bilinmeyen parametre: {name} (seçenekler: {', '.join(PARAMETERS)})")
+        cast = PARAMETERS[name]
+        if ':' in values:
+            low, high = (cast(value) for value in values.split(':', 1))
+            space[name] = (low, high)
+        else:
+            space[name] = [cast(value) for value in values.split(',') if value.strip()]
+    return space
+
+
+def grid_configs(space):
+    """Izgaradaki tüm birleşimler"""
+    for name, values in space.items():
+        if isinstance(values, tuple):
+            raise ValueError(f"{name} için aralık verildi; ızgara yerine --random kullanın")
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def random_configs(space, count, seed=0):
+    """Uzaydan count rastgele yapılandırma (listelerden seçim, aralıklardan düzgün örnek)"""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(count):
+        config = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                value = rng.randint(low, high) if PARAMETERS[name] is int else rng.uniform(low, high)
+            else:
+                value = rng.choice(values)
+            config[name] = value
+        configs.append(config)
+    return configs
+
+
+def _init_worker(recordings, base, screen_size, tolerance, hold, click_window):
+    """recordings: [(önbellek klasörü, etiketler)]; noktalar memmap ile paylaşılır"""
+    global _worker_state
+    from .landmark_cache import CachedLandmarks
+    from .offline_gaze import make_tracker
+    tracker = make_tracker(screen_size)
+    # base verilmezse çevrimdışı izleyicinin değerleri (frame_skip=1) kullanılır
+    defaults = {name: getattr(tracker, name) for name in PARAMETERS}
+    defaults.update(base or {})
+    _worker_state = {
+        'recordings': [(CachedLandmarks(directory), labels) for directory, labels in recordings],
+        'tracker': tracker,
+        # Yapılandırmada olmayan ayarlar her değerlendirmede temel değere döner
+        'defaults': defaults,
+        'screen_size': screen_size,
+        'tolerance': tolerance,
+        'hold': hold,
+        'click_window': click_window,
+    }
+
+
+def evaluate(config):
+    """Bir yapılandırmayı tüm kayıtlarda değerlendir (işçi sürecinde)"""
+    from .offline_gaze import replay_landmarks
+    state = _worker_state
+    tracker = state['tracker']
+    settings = dict(state['defaults'], **config)
+    frame_skip = settings.pop('frame_skip')
+    for name, value in settings.items():
+        setattr(tracker, name, value)
+    tracker.clicking_enabled = True
+
+    totals = {'saccades': 0, 'unsettled': 0, 'clicks': 0, 'true_clicks': 0,
+              'false_clicks': 0, 'missed_clicks': 0, 'duration': 0.0}
+    settling = []
+    jitter = []
+    errors = []
+    for cached, labels in state['recordings']:
+        # "Göz tıklaması!" satırları işçi çıktısını doldurmasın
+        with contextlib.redirect_stdout(io.StringIO()):
+            xs, ys, clicks = replay_landmarks(tracker, cached, frame_skip)
+
+        records = []
+        position = None
+        for index in range(len(cached)):
+            # İmleç yeni konum gelene kadar yerinde kalır
+            if not np.isnan(xs[index]):
+                position = (float(xs[index]), float(ys[index]))
+            label = labels.get(index)
+            records.append({
+                't': label[2] if label and label[2] is not None else index / cached.fps,
+                'target': (label[0], label[1]) if label else None,
+                'cursor': position
+            })
+        result = analyze(records, state['screen_size'], state['tolerance'], state['hold'])
+        duration = len(cached) / cached.fps
+        clicked = click_metrics([records[index]['t'] for index in clicks],
+                                [records[frame]['t'] for frame, label in labels.items()
+                                 if label[3] and frame < len(records)],
+                                duration, state['click_window'])
+
+        totals['saccades'] += result['saccades']
+        totals['unsettled'] += result['unsettled']
+        totals['duration'] += duration
+        for key in ('clicks', 'true_clicks', 'false_clicks', 'missed_clicks'):
+            totals[key] += clicked[key]
+        if result['settling_penalized_ms'] is not None:
+            settling.append((result['settling_penalized_ms'], result['saccades']))
+        if result['jitter_px'] is not None:
+            jitter.append(result['jitter_px'])
+        if result['steady_error_px'] is not None:
+            errors.append(result['steady_error_px']['mean'])
+
+    weight = sum(count for _, count in settling)
+    label_clicks = totals['true_clicks'] + totals['missed_clicks']
+    return {
+        'config': config,
+        'latency_ms': sum(value * count for value, count in settling) / weight if weight else None,
+        'jitter_px': float(np.mean(jitter)) if jitter else None,
+        'steady_error_px': float(np.mean(errors)) if errors else None,
+        'false_clicks_per_min': totals['false_clicks'] / (totals['duration'] / 60) if totals['duration'] else None,
+        'missed_click_rate': totals['missed_clicks'] / label_clicks if label_clicks else 0.0,
+        **{key: totals[key] for key in ('saccades', 'unsettled', 'clicks', 'true_clicks',
+                                        'false_clicks', 'missed_clicks')}
+    }
+
+
+def score(result, weights=DEFAULT_WEIGHTS):
+    """Ağırlıklı puan; ölçülemeyen gecikme/titreme en kötü kabul edilir"""
+    if result['latency_ms'] is None or result['jitter_px'] is None:
+        return float('inf')
+    return (weights['latency'] * result['latency_ms']
+            + weights['jitter'] * result['jitter_px']
+            + weights['false_clicks'] * (result['false_clicks_per_min'] or 0.0)
+            + weights['missed_clicks'] * result['missed_click_rate'])
+
+
+def sweep(recordings, configs, base=None, workers=None, screen_size=(1920, 1080), tolerance=50.0,
+          hold=3, click_window=1.0, weights=DEFAULT_WEIGHTS, progress=None):
+    """Yapılandırmaları paralel değerlendir, puana göre sıralı sonuçları döndür
+
+    recordings: [(önbellek klasörü, etiketler)]; base: yapılandırmada olmayan
+    parametrelerin değerleri (ör. config.ini); progress(tamamlanan, toplam).
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(recordings, base, screen_size, tolerance, hold, click_window)) as pool:
+        for done, result in enumerate(pool.map(evaluate, configs), 1):
+            result['score'] = score(result, weights)
+            results.append(result)
+            if progress:
+                progress(done, len(configs))
+    return sorted(results, key=lambda result: result['score'])
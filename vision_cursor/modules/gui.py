@@ -2,16 +2,79 @@ import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QTextEdit, 
                              QGroupBox, QSplitter, QFileDialog)
-from PyQt5.QtGui import QPixmap, QImage, QFont, QIcon, QTextCursor
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QPixmap, QImage, QFont, QIcon, QTextCursor, QTextCharFormat, QColor
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal, pyqtSlot
 import cv2
 import numpy as np
 import os
+import threading
+from .instrumentation import stage
+
+# Kamera görüntüsü ve metin güncellemeleri için kare aralığı (ms)
+FRAME_INTERVAL_MS = 30
+
+
+class SpeechDispatcher(QObject):
+    """Ses tanıma sonuçlarını GUI iş parçacığına taşır
+
+    Çözücü iş parçacıkları sonuçları yalnızca bir listeye ekler; liste boşken
+    gelen ilk sonuç kuyruklu bir sinyal gönderir. GUI iş parçacığı bir kare
+    aralığı bekleyip o sürede biriken tüm sonuçları tek seferde işler, böylece
+    hızlı dikte sırasında her cümle için ayrı yerleşim ve çizim yapılmaz.
+    """
+    
+    _pending_signal = pyqtSignal()
+    
+    def __init__(self, handler, interval_ms=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.handler = handler  # GUI iş parçacığında sonuç listesiyle çağrılır
+        self._lock = threading.Lock()
+        self._pending = []
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._pending_signal.connect(self._schedule, Qt.QueuedConnection)
+        
+        # İstatistik: birleştirmenin etkisini görmek için
+        self.results_dispatched = 0
+        self.flushes = 0
+    
+    def __call__(self, text, is_command=False, command=None,
+                 is_partial=False, stable_text=""):
+        """SpeechRecognizer callback'i; herhangi bir iş parçacığından çağrılabilir"""
+        with self._lock:
+            notify = not self._pending
+            self._pending.append((text, is_command, command, is_partial, stable_text))
+        if notify:
+            self._pending_signal.emit()
+    
+    @pyqtSlot()
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    @pyqtSlot()
+    def flush(self):
+        """Biriken sonuçları işle (GUI iş parçacığı)"""
+        self._timer.stop()
+        with self._lock:
+            results, self._pending = self._pending, []
+        if not results:
+            return
+        self.results_dispatched += len(results)
+        self.flushes += 1
+        self.handler(results)
+
 
 class VisionCursorGUI(QMainWindow):
     # Özel sinyaller
     speech_command_signal = pyqtSignal(str)
     
+    # _execute_command'ın uygulayabildiği eylemler; diğerleri dikte olarak yazılır
+    SPEECH_COMMANDS = frozenset(("clear", "save", "start_eye", "stop_eye", "start_speech", "stop_speech"))
+    
     def __init__(self):
         super().__init__()
         
@@ -34,12 +97,23 @@ class VisionCursorGUI(QMainWindow):
         # Kamera güncelleme zamanlayıcısı
         self.camera_timer = QTimer()
         self.camera_timer.timeout.connect(self.update_camera_feed)
-        self.camera_timer.start(30)  # 30ms (yaklaşık 33 FPS)
+        self.camera_timer.start(FRAME_INTERVAL_MS)  # 30ms (yaklaşık 33 FPS)
         
         # Başlangıçta modüllerin durumu
         self.eye_tracking_active = False
         self.speech_recognition_active = False
         
+        # Akış modunda gösterilen geçici metnin başlangıç konumu
+        self._partial_start = None
+        
+        # Metin günlüğü; belge elle düzenlenirse dışa aktarma belgeden yapılır
+        self.transcript_journal = None
+        self._updating_text = False
+        self._document_edited = False
+        
+        # Ses tanıma sonuçları GUI iş parçacığına bu nesne üzerinden gelir
+        self.speech_dispatcher = SpeechDispatcher(self._apply_speech_results, parent=self)
+        
     def _create_ui(self):
         """UI bileşenlerini oluşturur"""
         # Ana düzen için yatay bölücü
@@ -102,6 +176,7 @@ class VisionCursorGUI(QMainWindow):
         self.text_edit = QTextEdit()
         self.text_edit.setFont(QFont("Arial", 16))
         self.text_edit.setReadOnly(False)  # Kullanıcı düzenleyebilsin
+        self.text_edit.textChanged.connect(self._on_text_changed)
         text_layout.addWidget(self.text_edit)
         text_group.setLayout(text_layout)
         right_layout.addWidget(text_group)
@@ -122,6 +197,10 @@ class VisionCursorGUI(QMainWindow):
         self.status_bar = self.statusBar()
         self.status_bar.showMessage("Hazır")
         
+    def set_font_size(self, font_size):
+        """Tanınan metin kutusunun yazı boyutunu ayarla"""
+        self.text_edit.setFont(QFont("Arial", font_size))
+        
     def set_eye_tracker(self, eye_tracker):
         """Göz takip modülünü ayarlar"""
         self.eye_tracker = eye_tracker
@@ -130,28 +209,38 @@ class VisionCursorGUI(QMainWindow):
         """Ses tanıma modülünü ayarlar"""
         self.speech_recognizer = speech_recognizer
         
-    def set_performance_monitor(self, performance_monitor):
-        """Performans monitörünü ayarla"""
+    def set_transcript_journal(self, transcript_journal):
+        """Metin günlüğünü ayarla"""
+        # Diske indirme günlüğün kendi iş parçacığında yapılır
+        self.transcript_journal = transcript_journal
+        
+    def set_performance_monitor(self, performance_monitor, update_interval=5.0):
+        """Performans monitörünü ayarla; istatistikler update_interval saniyede bir güncellenir"""
         self.performance_monitor = performance_monitor
         
         # Performans güncelleme zamanlayıcısı
         self.perf_timer = QTimer()
         self.perf_timer.timeout.connect(self.update_performance_stats)
-        self.perf_timer.start(5000)  # 5 saniyede bir güncelle
+        self.perf_timer.start(int(update_interval * 1000))
     
     def update_camera_feed(self):
         """Kamera görüntüsünü günceller"""
         if self.eye_tracker and self.eye_tracking_active:
-            frame = self.eye_tracker.get_frame()
-            if frame is not None:
-                # OpenCV BGR formatından Qt için RGB formatına dönüştürme
-                rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_image.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                self.camera_label.setPixmap(QPixmap.fromImage(qt_image).scaled(
-                    self.camera_label.width(), self.camera_label.height(),
-                    Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            with stage("gui.camera_feed"):
+                self._show_camera_frame()
+    
+    def _show_camera_frame(self):
+        """Son kareyi kamera etiketine çiz"""
+        frame = self.eye_tracker.get_frame()
+        if frame is not None:
+            # OpenCV BGR formatından Qt için RGB formatına dönüştürme
+            rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            h, w, ch = rgb_image.shape
+            bytes_per_line = ch * w
+            qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            self.camera_label.setPixmap(QPixmap.fromImage(qt_image).scaled(
+                self.camera_label.width(), self.camera_label.height(),
+                Qt.KeepAspectRatio, Qt.SmoothTransformation))
     
     def toggle_eye_tracking(self):
         """Göz takibini açıp/kapatır"""
@@ -200,47 +289,151 @@ class VisionCursorGUI(QMainWindow):
                          f"RAM: %{stats['memory_usage']['current']:.1f}"
             self.status_bar.showMessage(status_text)
     
-    def on_speech_recognized(self, text, is_command=False, command=None):
-        """Tanınan metin için callback"""
-        if is_command:
-            # Komut işleme
-            self.speech_command_signal.emit(command)
-            self.status_bar.showMessage(f"Komut algılandı: {command}")
+    def on_speech_recognized(self, text, is_command=False, command=None,
+                             is_partial=False, stable_text=""):
+        """Tanınan metin için callback (iş parçacığı güvenli)"""
+        self.speech_dispatcher(text, is_command, command, is_partial, stable_text)
+    
+    def _apply_speech_results(self, results):
+        """Bir kare aralığında biriken sonuçları sırayla uygula"""
+        with stage("gui.apply_speech"):
+            self._apply_speech_results_batch(results)
+    
+    def _apply_speech_results_batch(self, results):
+        final_texts = []
+        partial = None
+        
+        for text, is_command, command, is_partial, stable_text in results:
+            if is_partial:
+                # Yalnızca en son geçici metin gösterilir
+                partial = (text, stable_text)
+                continue
             
-            # Temel komutlar
-            if command == "clear":
-                self.clear_text()
-            elif command == "save":
-                self.save_text()
-            elif command == "start_eye":
-                if not self.eye_tracking_active:
-                    self.toggle_eye_tracking()
-            elif command == "stop_eye":
-                if self.eye_tracking_active:
-                    self.toggle_eye_tracking()
-            elif command == "start_speech":
-                if not self.speech_recognition_active:
-                    self.toggle_speech_recognition()
-            elif command == "stop_speech":
-                if self.speech_recognition_active:
-                    self.toggle_speech_recognition()
-        else:
-            # Normal metin
-            cursor = self.text_edit.textCursor()
-            cursor.movePosition(cursor.End)
-            cursor.insertText(f"{text} ")
-            self.text_edit.setTextCursor(cursor)
-            self.text_edit.ensureCursorVisible()
+            # Kesin sonuç geçici metnin yerini alır
+            partial = None
+            if is_command and command in self.SPEECH_COMMANDS:
+                # Komutlar metin değiştirebilir; önceki metinler önce yazılır
+                self._update_text(final_texts, None)
+                final_texts = []
+                if self.transcript_journal:
+                    self.transcript_journal.append(text, kind="command", action=command)
+                self._execute_command(command)
+            else:
+                if self.transcript_journal:
+                    self.transcript_journal.append(text)
+                final_texts.append(text)
+        
+        self._update_text(final_texts, partial)
+    
+    def _update_text(self, final_texts, partial):
+        """Kesin metinleri ve geçici metni tek düzenleme bloğunda yaz"""
+        if not final_texts and partial is None:
+            return
+        
+        cursor = self.text_edit.textCursor()
+        self._updating_text = True
+        cursor.beginEditBlock()
+        try:
+            if final_texts:
+                self._remove_partial_text()
+                cursor.movePosition(cursor.End)
+                cursor.insertText(''.join(f"{text} " for text in final_texts), QTextCharFormat())
+                self.text_edit.setTextCursor(cursor)
+            if partial is not None:
+                self._show_partial_text(*partial)
+        finally:
+            cursor.endEditBlock()
+            self._updating_text = False
+        self.text_edit.ensureCursorVisible()
+    
+    def _execute_command(self, command):
+        """Sesli komutu uygula (GUI iş parçacığı)"""
+        self._updating_text = True
+        try:
+            self._remove_partial_text()
+        finally:
+            self._updating_text = False
+        self.speech_command_signal.emit(command)
+        self.status_bar.showMessage(f"Komut algılandı: {command}")
+        
+        # Temel komutlar
+        if command == "clear":
+            self.clear_text()
+        elif command == "save":
+            self.save_text()
+        elif command == "start_eye":
+            if not self.eye_tracking_active:
+                self.toggle_eye_tracking()
+        elif command == "stop_eye":
+            if self.eye_tracking_active:
+                self.toggle_eye_tracking()
+        elif command == "start_speech":
+            if not self.speech_recognition_active:
+                self.toggle_speech_recognition()
+        elif command == "stop_speech":
+            if self.speech_recognition_active:
+                self.toggle_speech_recognition()
+    
+    def _show_partial_text(self, text, stable_text=""):
+        """Geçici metni göster; kesinleşmemiş kısım soluk yazılır"""
+        self._remove_partial_text()
+        if not text:
+            return
+        
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(cursor.End)
+        self._partial_start = cursor.position()
+        
+        stable_format = QTextCharFormat()
+        stable_format.setForeground(QColor("#555"))
+        tentative_format = QTextCharFormat()
+        tentative_format.setForeground(QColor("#999"))
+        tentative_format.setFontItalic(True)
+        
+        tentative = text
+        if stable_text and text.startswith(stable_text):
+            cursor.insertText(f"{stable_text} ", stable_format)
+            tentative = text[len(stable_text):].strip()
+        if tentative:
+            cursor.insertText(tentative, tentative_format)
+        self.text_edit.ensureCursorVisible()
+    
+    def _remove_partial_text(self):
+        """Gösterilen geçici metni kaldır"""
+        if self._partial_start is None:
+            return
+        
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(cursor.End)
+        if self._partial_start < cursor.position():
+            cursor.setPosition(self._partial_start)
+            cursor.movePosition(cursor.End, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+        cursor.setCharFormat(QTextCharFormat())
+        self.text_edit.setTextCursor(cursor)
+        self._partial_start = None
+    
+    def _on_text_changed(self):
+        """Kullanıcı metni elle değiştirdi mi"""
+        if not self._updating_text:
+            self._document_edited = True
     
     def clear_text(self):
         """Metin kutusunu temizler"""
-        self.text_edit.clear()
+        self._partial_start = None
+        self._updating_text = True
+        try:
+            self.text_edit.clear()
+        finally:
+            self._updating_text = False
+        self._document_edited = False
+        if self.transcript_journal:
+            self.transcript_journal.mark_clear()
         self.status_bar.showMessage("Metin temizlendi")
     
     def save_text(self):
         """Metni dosyaya kaydeder"""
-        text = self.text_edit.toPlainText()
-        if not text:
+        if self.text_edit.document().isEmpty():
             self.status_bar.showMessage("Kaydedilecek metin yok")
             return
             
@@ -250,8 +443,12 @@ class VisionCursorGUI(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(text)
+                if self.transcript_journal and not self._document_edited:
+                    # Belge yeniden serileştirilmez; günlükten akış halinde yazılır
+                    self.transcript_journal.export(file_path)
+                else:
+                    with open(file_path, 'w', encoding='utf-8') as file:
+                        file.write(self.text_edit.toPlainText())
                 self.status_bar.showMessage(f"Metin kaydedildi: {file_path}")
             except Exception as e:
                 self.status_bar.showMessage(f"Kaydetme hatası: {str(e)}")
@@ -361,8 +558,21 @@ class VisionCursorGUI(QMainWindow):
         if self.eye_tracker and self.eye_tracking_active:
             self.eye_tracker.stop()
             
+        if self.eye_tracker and self.eye_tracker.trace:
+            self.eye_tracker.trace.close()
+            
         if self.speech_recognizer and self.speech_recognition_active:
             self.speech_recognizer.stop()
+        
+        # Bekleyen ses tanıma sonuçlarını yaz
+        self.speech_dispatcher.flush()
+        
+        if self.transcript_journal:
+            self.transcript_journal.close()
+        
+        # Son bellek profili örneği de yazılır
+        if hasattr(self, 'performance_monitor'):
+            self.performance_monitor.stop_monitoring()
             
         event.accept()
     
@@ -0,0 +1,297 @@
+"""
+VisionCursor Aşama Ölçümü
+
+Sıcak yoldaki adlandırılmış aşamaların (kamera okuma, FaceMesh, Whisper
+çözümleme vb.) sürelerini sabit bellekli HDR tarzı histogramlarda toplar.
+
+    from .instrumentation import stage, timed
+
+    with stage("eye.face_mesh"):
+        results = face_mesh.process(rgb)
+
+    @timed("speech.text_postprocess")
+    def process(...): ...
+
+Ölçüm kapalıyken stage() paylaşılan boş bir bağlam döndürür ve timed()
+yalnızca bir bayrak kontrolü ekler; maliyet mikrosaniyenin altındadır.
+
+İz kaydı açıkken her aşama ayrıca sınırlı bir halka tampona olay olarak
+eklenir ve Chrome Trace Event JSON olarak (Perfetto, chrome://tracing)
+dışa aktarılabilir. set_trace_args() ile iş parçacığının o anki kare veya
+cümle kimliği sonraki aşamalara eklenir.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Alt kova bitleri: her ikinin kuvveti aralığı 64 kovaya bölünür (~%1.6 bağıl hata)
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+# Kaydedilebilen en büyük süre: 2^36 ns (~68 saniye); üstü son kovaya yazılır
+MAX_VALUE_BITS = 36
+BUCKET_COUNT = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 2) * SUB_BUCKET_HALF
+
+
+def _bucket_index(value):
+    """Değerin (ns) kova indeksi: ilk 128 değer doğrusal, sonrası log-doğrusal"""
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+
+def _bucket_upper(index):
+    """Kovanın kapsadığı en büyük değer (ns)"""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+    mantissa = index - (shift << (SUB_BUCKET_BITS - 1))
+    return ((mantissa + 1) << shift) - 1
+
+
+class HdrHistogram:
+    """Sabit bellekli, log-doğrusal kovalı süre histogramı (nanosaniye)
+
+    Kayıtlar kilitsizdir; aynı aşamaya birden fazla iş parçacığı aynı anda
+    yazarsa nadiren bir sayım kaybolabilir, yüzdelikleri etkilemez.
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        index = _bucket_index(value) if value > 0 else 0
+        if index >= BUCKET_COUNT:
+            index = BUCKET_COUNT - 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentiles(self, quantiles):
+        """Yüzdelik değerleri (ns), artan sırada verilen oranlar için"""
+        results = []
+        if not self.count:
+            return [0] * len(quantiles)
+        targets = [max(1, int(q * self.count + 0.5)) for q in quantiles]
+        position = 0
+        cumulative = 0
+        for index, bucket in enumerate(self.counts):
+            if not bucket:
+                continue
+            cumulative += bucket
+            while position < len(targets) and cumulative >= targets[position]:
+                results.append(min(_bucket_upper(index), self.max))
+                position += 1
+            if position == len(targets):
+                break
+        return results
+
+    def cumulative_counts(self, bounds):
+        """Artan sınırlar (ns) için sınıra kadar olan kayıt sayıları (Prometheus 'le' kovaları)
+
+        Kova üst sınırı sınırı aşan kayıtlar sayılmaz; hata kova genişliği kadardır.
+        """
+        results = []
+        cumulative = 0
+        position = 0
+        for index, bucket in enumerate(self.counts):
+            upper = _bucket_upper(index)
+            while position < len(bounds) and upper > bounds[position]:
+                results.append(cumulative)
+                position += 1
+            if position == len(bounds):
+                break
+            cumulative += bucket
+        while len(results) < len(bounds):
+            results.append(cumulative)
+        return results
+
+    def reset(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+
+class _NullStage:
+    """Ölçüm kapalıyken kullanılan boş bağlam"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+# İş parçacığı başına iz argümanları (kare / cümle kimliği)
+_trace_local = threading.local()
+
+
+class _Stage:
+    __slots__ = ('registry', 'name', 'histogram', 'start')
+
+    def __init__(self, registry, name, histogram):
+        self.registry = registry
+        self.name = name
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self.histogram.record(end - self.start)
+        trace = self.registry.trace
+        if trace is not None:
+            # deque.append iş parçacığı güvenlidir; dolunca en eski olay düşer
+            trace.append((self.name, self.start, end - self.start,
+                          threading.get_native_id(), getattr(_trace_local, 'args', None)))
+        return False
+
+
+class StageRegistry:
+    """Aşama adı -> histogram kaydı"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.trace = None           # İz kaydı açıkken sınırlı olay tamponu
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, HdrHistogram())
+        return histogram
+
+    def stage(self, name):
+        """Aşama süresini ölçen bağlam yöneticisi"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, self.histogram(name))
+
+    def timed(self, name):
+        """Fonksiyon süresini ölçen dekoratör"""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Stage(self, name, self.histogram(name)):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name, duration_ns):
+        """Dışarıda ölçülmüş bir süreyi ekle"""
+        if self.enabled:
+            self.histogram(name).record(duration_ns)
+
+    def snapshot(self):
+        """Aşama başına sayım ve ms cinsinden p50/p95/p99/max/ortalama"""
+        stats = {}
+        for name, histogram in sorted(self._histograms.items()):
+            if not histogram.count:
+                continue
+            p50, p95, p99 = histogram.percentiles((0.50, 0.95, 0.99))
+            stats[name] = {
+                'count': histogram.count,
+                'mean_ms': histogram.total / histogram.count / 1e6,
+                'p50_ms': p50 / 1e6,
+                'p95_ms': p95 / 1e6,
+                'p99_ms': p99 / 1e6,
+                'max_ms': histogram.max / 1e6
+            }
+        return stats
+
+    def histograms(self):
+        """(ad, histogram) çiftleri, ada göre sıralı"""
+        return sorted(self._histograms.items())
+
+    def reset(self):
+        with self._lock:
+            for histogram in self._histograms.values():
+                histogram.reset()
+
+    def enable_tracing(self, capacity=100000):
+        """Son capacity aşamayı iz olayı olarak tut (ölçümü de açar)"""
+        self.trace = deque(maxlen=capacity)
+        self.enabled = True
+
+    def disable_tracing(self):
+        self.trace = None
+
+    def trace_snapshot(self):
+        """Tamponun ve iş parçacığı adlarının ucuz kopyası: (olaylar, {kimlik: ad})"""
+        trace = self.trace
+        if trace is None:
+            return [], {}
+        events = list(trace)
+        # Yerel kimlik -> iş parçacığı adı (Perfetto'da satır başlıkları)
+        main = threading.main_thread()
+        names = {thread.native_id: ("qt-main" if thread is main else thread.name)
+                 for thread in threading.enumerate() if thread.native_id is not None}
+        return events, names
+
+    def trace_events(self, snapshot=None):
+        """Tampondaki (ya da verilen kopyadaki) olaylar Chrome Trace Event biçiminde"""
+        events, names = snapshot if snapshot is not None else self.trace_snapshot()
+        pid = os.getpid()
+        result = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                   'args': {'name': names.get(tid, f"thread-{tid}")}}
+                  for tid in sorted({event[3] for event in events})]
+
+        for name, start, duration, tid, args in events:
+            event = {
+                'name': name,
+                'cat': name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': start / 1000,         # mikrosaniye
+                'dur': duration / 1000,
+                'pid': pid,
+                'tid': tid
+            }
+            if args:
+                event['args'] = args
+            result.append(event)
+        return result
+
+    def dump_trace(self, path, snapshot=None):
+        """İz tamponunu Chrome Trace Event JSON dosyasına yaz, olay sayısını döndür"""
+        events = self.trace_events(snapshot)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(events)
+
+
+def set_trace_args(**args):
+    """Bu iş parçacığında sonraki aşamalara eklenecek argümanlar (ör. frame=12)"""
+    _trace_local.args = args or None
+
+
+# Uygulama genelinde paylaşılan kayıt
+stages = StageRegistry()
+stage = stages.stage
+timed = stages.timed
@@ -0,0 +1,185 @@
+"""
+VisionCursor Yüz Noktası Önbelleği
+
+Bir videonun kare başına FaceMesh çıktısını diskte saklar. Anahtar video
+içeriğinin SHA-256 özeti ile FaceMesh ayarlarıdır; dosya yeniden
+adlandırılsa da önbellek bulunur, ayar değişince yenisi oluşturulur.
+Sonraki çalıştırmalarda FaceMesh hiç çalıştırılmaz, noktalar aynı işlem
+hattına (yumuşatma, ekran eşleme, tıklama) yeniden verilir.
+
+    önbellek/
+        hashes.json             yol, boyut ve değişme zamanı -> içerik özeti
+        <anahtar>/
+            meta.json           ayarlar, FPS, kare boyutu
+            landmarks.npy       float32 (kare, N, 2) normalize x, y
+            found.npy           bool (kare,) yüz bulundu mu
+
+Diziler np.load(mmap_mode='r') ile kopyasız açılır.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+# Varsayılan önbellek klasörü
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".vision_cursor", "landmark_cache")
+CACHE_VERSION = 1
+_HASH_BLOCK = 1024 * 1024
+
+
+def file_hash(path):
+    """Dosya içeriğinin SHA-256 özeti"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _Point:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class _Points:
+    """Tek karenin noktaları; MediaPipe listesi gibi indekslenir ve dilimlenir"""
+
+    __slots__ = ('_rows',)
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        # MediaPipe noktaları float32 tutar; float() ile aynı Python değeri elde edilir
+        if isinstance(index, slice):
+            return [_Point(x, y) for x, y in self._rows[index].tolist()]
+        row = self._rows[index]
+        return _Point(float(row[0]), float(row[1]))
+
+
+class ReplayLandmarks:
+    """FaceMesh sonucunun (face_landmarks) yerine geçen hafif görünüm"""
+
+    __slots__ = ('landmark',)
+
+    def __init__(self, points):
+        # İşlem hattı yalnızca birkaç iris noktası okur; satır kopyalanmaz
+        self.landmark = _Points(points)
+
+
+class CachedLandmarks:
+    """Önbellekteki bir videonun noktaları"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json"), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.landmarks = np.load(os.path.join(directory, "landmarks.npy"), mmap_mode='r')
+        self.found = np.load(os.path.join(directory, "found.npy"), mmap_mode='r')
+        self.fps = self.meta['fps']
+        self.width = self.meta['width']
+        self.height = self.meta['height']
+
+    def __len__(self):
+        return len(self.found)
+
+    def face(self, index):
+        """index. karenin noktaları (ReplayLandmarks) ya da yüz yoksa None"""
+        if not self.found[index]:
+            return None
+        return ReplayLandmarks(self.landmarks[index])
+
+
+class LandmarkCache:
+    """İçerik adresli yüz noktası önbelleği"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, "hashes.json")
+        self._lock = threading.Lock()
+
+    def file_hash(self, path):
+        """İçerik özeti; boyut ve değişme zamanı aynıysa yeniden okunmaz"""
+        stat = os.stat(path)
+        entry_key = os.path.abspath(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        with self._lock:
+            index = self._load_index()
+            entry = index.get(entry_key)
+            if entry and entry['signature'] == signature:
+                return entry['sha256']
+        digest = file_hash(path)
+        with self._lock:
+            index = self._load_index()
+            index[entry_key] = {'signature': signature, 'sha256': digest}
+            self._write_json(self._index_path, index)
+        return digest
+
+    def key(self, path, settings):
+        """Video içeriği + FaceMesh ayarlarından önbellek anahtarı"""
+        payload = json.dumps({'version': CACHE_VERSION, 'file': self.file_hash(path),
+                              'settings': settings}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+    def load(self, path, settings):
+        """Önbellekte varsa CachedLandmarks, yoksa None"""
+        directory = os.path.join(self.directory, self.key(path, settings))
+        if not os.path.exists(os.path.join(directory, "meta.json")):
+            return None
+        try:
+            return CachedLandmarks(directory)
+        except (OSError, ValueError) as e:
+            print(f"Nokta önbelleği okuma hatası: {e}")
+            return None
+
+    def store(self, path, settings, landmarks, found, fps, frame_size):
+        """Noktaları kaydet; yarım kalmış giriş görünmesin diye klasör en son taşınır"""
+        directory = os.path.join(self.directory, self.key(path, settings))
+        temp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        try:
+            np.save(os.path.join(temp_dir, "landmarks.npy"), np.asarray(landmarks, dtype=np.float32))
+            np.save(os.path.join(temp_dir, "found.npy"), np.asarray(found, dtype=bool))
+            self._write_json(os.path.join(temp_dir, "meta.json"), {
+                'version': CACHE_VERSION,
+                'source': os.path.abspath(path),
+                'settings': settings,
+                'fps': fps,
+                'width': frame_size[0],
+                'height': frame_size[1],
+                'frames': len(found)
+            })
+            try:
+                os.rename(temp_dir, directory)
+            except OSError:
+                # Aynı anahtar başka bir süreçte yazılmış
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        return CachedLandmarks(directory)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_json(path, data):
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
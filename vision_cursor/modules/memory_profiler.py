@@ -0,0 +1,165 @@
+"""
+VisionCursor Bellek Büyümesi Profili
+
+Uzun oturumlarda yavaşlamanın kaynağını bulmak için tracemalloc ile
+belirli aralıklarla anlık görüntü alır ve:
+- bir önceki görüntüye ve başlangıca göre en çok büyüyen ayırma yerlerini,
+- RSS, izlenen bellek ve iş parçacığı sayısını,
+- işlenen kare başına net bellek büyümesini
+diske yazar. Rapor her aralıkta yenilendiği için uygulama çökse de son
+durum okunabilir.
+
+tracemalloc Python ayırmalarını yavaşlattığından yalnızca profil modunda
+açılmalıdır.
+"""
+
+import json
+import linecache
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import psutil
+
+# Varsayılan rapor klasörü
+DEFAULT_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".vision_cursor", "memory_profiles")
+
+# Profil aracının kendi ayırmaları rapora girmez
+_IGNORED_FILES = (tracemalloc.__file__, linecache.__file__, "<frozen importlib._bootstrap>",
+                  "<frozen importlib._bootstrap_external>", "<unknown>")
+
+
+def _site_stats(stats, top):
+    """StatisticDiff listesini JSON'a uygun kayıtlara çevir"""
+    sites = []
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        sites.append({
+            'site': f"{frame.filename}:{frame.lineno}",
+            'line': linecache.getline(frame.filename, frame.lineno).strip(),
+            'size_diff_kb': round(stat.size_diff / 1024, 1),
+            'count_diff': stat.count_diff,
+            'size_kb': round(stat.size / 1024, 1),
+            'count': stat.count
+        })
+    return sites
+
+
+class MemoryProfiler:
+    """tracemalloc anlık görüntülerinden bellek büyümesi raporu"""
+
+    def __init__(self, output_dir=DEFAULT_PROFILE_DIR, interval=60.0, top=25,
+                 traceback_frames=1, frame_counter=None, memory_probes=None, max_samples=1440):
+        self.output_dir = output_dir
+        self.interval = interval                # Anlık görüntü aralığı (saniye)
+        self.top = top                          # Raporlanan ayırma yeri sayısı
+        self.traceback_frames = traceback_frames
+        self.frame_counter = frame_counter      # İşlenen kare sayısını döndüren fonksiyon
+        self.memory_probes = memory_probes      # Alt sistem bellek ölçümleri (MemoryProbes)
+
+        self.path = None
+        # Raporda son max_samples örnek tutulur (60 s aralıkla 24 saat)
+        self.samples = deque(maxlen=max_samples)
+        self._started_tracing = False  # tracemalloc'u bu profil mi açtı
+        self._process = psutil.Process()
+        self._baseline = None
+        self._previous = None
+        self._previous_frames = 0
+        self._start_time = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.path = os.path.join(self.output_dir, time.strftime("memory-%Y%m%d-%H%M%S.json"))
+        # -X tracemalloc ya da başka bir araç izlemeyi zaten açmışsa ona dokunulmaz
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(self.traceback_frames)
+
+        self._start_time = time.monotonic()
+        self._baseline = self._previous = self._snapshot()
+        self._previous_frames = self._frames()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="memory-profiler", daemon=True)
+        self._thread.start()
+        print(f"Bellek profili açık, rapor: {self.path}")
+
+    def stop(self):
+        """Son bir örnek al, raporu yaz; tracemalloc'u yalnızca bu profil açtıysa kapat"""
+        if not self._thread:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.sample()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"Bellek profili hatası: {e}")
+
+    def _snapshot(self):
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, name) for name in _IGNORED_FILES])
+
+    def _frames(self):
+        return self.frame_counter() if self.frame_counter else 0
+
+    def sample(self):
+        """Anlık görüntü al, farkları hesapla ve raporu diske yaz"""
+        snapshot = self._snapshot()
+        frames = self._frames()
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        interval_stats = snapshot.compare_to(self._previous, 'lineno')
+        interval_growth = sum(stat.size_diff for stat in interval_stats)
+        frame_delta = frames - self._previous_frames
+
+        sample = {
+            'elapsed_s': round(time.monotonic() - self._start_time, 1),
+            'rss_mb': round(self._process.memory_info().rss / (1024 * 1024), 1),
+            'traced_mb': round(traced / (1024 * 1024), 2),
+            'peak_mb': round(peak / (1024 * 1024), 2),
+            'threads': threading.active_count(),
+            'frames': frames,
+            'growth_kb': round(interval_growth / 1024, 1),
+            # Net büyüme / kare: sabit durumda sıfıra yakın olmalı
+            'growth_bytes_per_frame': round(interval_growth / frame_delta, 1) if frame_delta else None,
+            'top_growth': _site_stats(interval_stats, self.top)
+        }
+        if self.memory_probes is not None:
+            sample['subsystems_mb'] = {
+                name: round(value / (1024 * 1024), 2) if value is not None else None
+                for name, value in self.memory_probes.subsystems().items()
+            }
+        self.samples.append(sample)
+        self._previous = snapshot
+        self._previous_frames = frames
+
+        self._write_report(snapshot)
+        return sample
+
+    def _write_report(self, snapshot):
+        total_stats = snapshot.compare_to(self._baseline, 'lineno')
+        report = {
+            'pid': os.getpid(),
+            'interval_s': self.interval,
+            'growth_since_start': _site_stats(total_stats, self.top),
+            'samples': list(self.samples)
+        }
+        # Yarım yazılmış rapor bırakmamak için önce geçici dosyaya yaz
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,165 @@
+"""
+VisionCursor Metrik Sunucusu
+
+PerformanceMonitor verilerini OpenMetrics (Prometheus) metin biçiminde
+yalnızca yerel adreste yayınlar:
+
+    curl http://127.0.0.1:9464/metrics
+
+Sunucu kendi iş parçacığında çalışır; sıcak yola hiçbir şey eklemez. Çıktı
+en fazla cache_seconds aralıkla yeniden oluşturulur, aradaki istekler aynı
+bayt dizisini döndürür.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PREFIX = "visioncursor"
+
+# Aşama süresi histogram kovaları (saniye)
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_DURATION_BUCKETS_NS = [int(bound * 1e9) for bound in DURATION_BUCKETS]
+_DURATION_LABELS = [repr(bound) for bound in DURATION_BUCKETS]
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    if value is None:
+        return "NaN"
+    return repr(float(value))
+
+
+class MetricsExporter:
+    """PerformanceMonitor için yerel OpenMetrics HTTP sunucusu"""
+
+    def __init__(self, monitor, host="127.0.0.1", port=9464, cache_seconds=1.0):
+        self.monitor = monitor
+        self.host = host
+        self.port = port
+        self.cache_seconds = cache_seconds
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._cached = b""
+        self._cached_at = None
+
+    def start(self):
+        if self._server:
+            return
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = exporter.render()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = HTTPServer((self.host, self.port), Handler)
+        # Port 0 verildiyse işletim sisteminin seçtiği port
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="metrics-exporter", daemon=True)
+        self._thread.start()
+        print(f"Metrik sunucusu: http://{self.host}:{self.port}/metrics")
+
+    def stop(self):
+        if not self._server:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def render(self):
+        """Önbellekteki çıktıyı döndür, süresi dolmuşsa yeniden oluştur"""
+        with self._lock:
+            now = time.monotonic()
+            if self._cached_at is None or now - self._cached_at >= self.cache_seconds:
+                self._cached = self._render().encode('utf-8')
+                self._cached_at = now
+            return self._cached
+
+    def _render(self):
+        monitor = self.monitor
+        stats = monitor.get_stats()
+        lines = []
+
+        def family(name, metric_type, help_text, samples):
+            """samples: [(etiketler sözlüğü ya da None, değer)]"""
+            full_name = f"{PREFIX}_{name}"
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            lines.append(f"# HELP {full_name} {help_text}")
+            suffix = "_total" if metric_type == "counter" else ""
+            for labels, value in samples:
+                label_text = ""
+                if labels:
+                    label_text = "{" + ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items()) + "}"
+                lines.append(f"{full_name}{suffix}{label_text} {_number(value)}")
+
+        family("fps", "gauge", "Camera frames per second",
+               [(None, stats['fps']['current'])])
+        family("system_cpu_percent", "gauge", "System-wide CPU usage",
+               [(None, stats['cpu_usage']['current'])])
+        family("system_memory_percent", "gauge", "System-wide memory usage",
+               [(None, stats['memory_usage']['current'])])
+        family("process_cpu_percent", "gauge", "Process CPU usage (100 = one core)",
+               [(None, stats['process']['cpu']['current'])])
+        family("process_resident_memory_bytes", "gauge", "Process RSS",
+               [(None, stats['process']['rss_mb']['current'] * 1024 * 1024)])
+        if stats['process']['uss_mb'] is not None:
+            family("process_unique_memory_bytes", "gauge", "Process USS",
+                   [(None, stats['process']['uss_mb'] * 1024 * 1024)])
+        family("subsystem_cpu_percent", "gauge", "CPU usage per subsystem (100 = one core)",
+               [({'subsystem': name}, cpu['current'])
+                for name, cpu in sorted(stats['subsystem_cpu'].items())])
+        memory = [({'subsystem': name}, value * 1024 * 1024)
+                  for name, value in sorted(stats['subsystem_memory_mb'].items()) if value is not None]
+        if memory:
+            family("subsystem_memory_bytes", "gauge", "Known memory usage per subsystem", memory)
+
+        # Alt sistemlerin kaydettiği sayaç ve göstergeler
+        for name, (metric_type, help_text, getter) in sorted(monitor.metric_probes.items()):
+            try:
+                value = getter()
+            except Exception:
+                continue
+            family(name, metric_type, help_text, [(None, value)])
+
+        self._render_stage_histograms(lines)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _render_stage_histograms(self, lines):
+        histograms = [(name, histogram) for name, histogram in self.monitor.stages.histograms()
+                      if histogram.count]
+        if not histograms:
+            return
+        full_name = f"{PREFIX}_stage_duration_seconds"
+        lines.append(f"# TYPE {full_name} histogram")
+        lines.append(f"# HELP {full_name} Duration of instrumented hot-path stages")
+        for name, histogram in histograms:
+            stage_label = _escape(name)
+            cumulative = histogram.cumulative_counts(_DURATION_BUCKETS_NS)
+            # Kayıtlar kilitsiz olduğundan toplam sayı kovalardan geride kalabilir
+            count = max(histogram.count, cumulative[-1])
+            for label, bucket_count in zip(_DURATION_LABELS, cumulative):
+                lines.append(f'{full_name}_bucket{{stage="{stage_label}",le="{label}"}} {bucket_count}')
+            lines.append(f'{full_name}_bucket{{stage="{stage_label}",le="+Inf"}} {count}')
+            lines.append(f'{full_name}_count{{stage="{stage_label}"}} {count}')
+            lines.append(f'{full_name}_sum{{stage="{stage_label}"}} {histogram.total / 1e9!r}')
@@ -0,0 +1,156 @@
+"""
+VisionCursor Metrik Deposu
+
+Her metrik sabit boyutlu bir numpy halka tamponunda tutulur. Toplam,
+minimum ve maksimum her eklemede güncellenir (min/max için monoton
+kuyruklar), böylece istatistik sorguları pencere boyutundan bağımsız
+olarak sabit sürede yanıtlanır.
+"""
+
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class RollingWindow:
+    """Son N değer üzerinde sabit süreli ortalama, min ve max"""
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("Pencere boyutu en az 1 olmalı")
+        self.size = size
+        self._values = np.zeros(size, dtype=np.float64)
+        self._sequence = 0          # Şimdiye kadar eklenen değer sayısı
+        self._total = 0.0
+        # (sıra, değer) çiftleri; baştaki eleman penceredeki min/max'tır
+        self._min_queue = deque()
+        self._max_queue = deque()
+        self._lock = threading.Lock()
+
+    def append(self, value):
+        value = float(value)
+        with self._lock:
+            sequence = self._sequence
+            position = sequence % self.size
+            if sequence >= self.size:
+                self._total -= self._values[position]
+            self._values[position] = value
+            self._total += value
+            self._sequence = sequence + 1
+
+            # Kayan nokta birikimini önlemek için her tam turda toplamı yeniden hesapla
+            if position == self.size - 1:
+                self._total = float(self._values.sum())
+
+            expired = sequence - self.size
+            min_queue = self._min_queue
+            while min_queue and min_queue[-1][1] >= value:
+                min_queue.pop()
+            min_queue.append((sequence, value))
+            if min_queue[0][0] <= expired:
+                min_queue.popleft()
+
+            max_queue = self._max_queue
+            while max_queue and max_queue[-1][1] <= value:
+                max_queue.pop()
+            max_queue.append((sequence, value))
+            if max_queue[0][0] <= expired:
+                max_queue.popleft()
+
+    def __len__(self):
+        return min(self._sequence, self.size)
+
+    @property
+    def current(self):
+        if not self._sequence:
+            return 0
+        return float(self._values[(self._sequence - 1) % self.size])
+
+    @property
+    def mean(self):
+        count = len(self)
+        return self._total / count if count else 0
+
+    @property
+    def min(self):
+        return self._min_queue[0][1] if self._min_queue else 0
+
+    @property
+    def max(self):
+        return self._max_queue[0][1] if self._max_queue else 0
+
+    def values(self):
+        """Penceredeki değerler, eskiden yeniye (kopya)"""
+        with self._lock:
+            count = len(self)
+            start = self._sequence % self.size if self._sequence >= self.size else 0
+            return np.roll(self._values, -start)[:count].copy()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'current': self.current,
+                'average': self.mean,
+                'min': self.min,
+                'max': self.max
+            }
+
+    def resize(self, size):
+        """Pencere boyutunu değiştir; en yeni değerler korunur"""
+        if size < 1:
+            raise ValueError("Pencere boyutu en az 1 olmalı")
+        with self._lock:
+            count = len(self)
+            start = self._sequence % self.size if self._sequence >= self.size else 0
+            kept = np.roll(self._values, -start)[:count][-size:]
+            self.size = size
+            self._values = np.zeros(size, dtype=np.float64)
+            self._values[:len(kept)] = kept
+            self._sequence = len(kept)
+            self._total = float(kept.sum())
+            self._min_queue.clear()
+            self._max_queue.clear()
+            for sequence, value in enumerate(kept.tolist()):
+                while self._min_queue and self._min_queue[-1][1] >= value:
+                    self._min_queue.pop()
+                self._min_queue.append((sequence, value))
+                while self._max_queue and self._max_queue[-1][1] <= value:
+                    self._max_queue.pop()
+                self._max_queue.append((sequence, value))
+
+    def clear(self):
+        with self._lock:
+            self._sequence = 0
+            self._total = 0.0
+            self._min_queue.clear()
+            self._max_queue.clear()
+
+
+class MetricsStore:
+    """Ad -> RollingWindow"""
+
+    def __init__(self, default_size=60):
+        self.default_size = default_size
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, size=None):
+        """Metriği verilen pencere boyutuyla oluştur (varsa olanı döndür)"""
+        with self._lock:
+            window = self._windows.get(name)
+            if window is None:
+                window = self._windows[name] = RollingWindow(size or self.default_size)
+            return window
+
+    def window(self, name):
+        return self._windows.get(name) or self.register(name)
+
+    def record(self, name, value):
+        self.window(name).append(value)
+
+    def stats(self, name):
+        return self.window(name).stats()
+
+    def names(self):
+        return list(self._windows)
@@ -0,0 +1,82 @@
+"""
+VisionCursor Gürültü Profili
+
+Mikrofon başına ortam gürültüsü seviyesini ve enerji eşiğini saklar. Kayıtlı
+bir profil varsa ses tanıma kalibrasyon beklemeden başlar; eşik dinleme
+sırasında konuşma olmayan parçalardan sürekli iyileştirilir.
+"""
+
+import json
+import os
+import threading
+import time
+
+# Varsayılan profil dosyası
+DEFAULT_PROFILE_FILE = os.path.join(os.path.expanduser("~"), ".vision_cursor", "noise_profiles.json")
+
+
+class NoiseFloorEstimator:
+    """Konuşma olmayan parçaların enerjisinden gürültü tabanını tahmin eder"""
+
+    def __init__(self, noise_floor=None, ratio=1.5, adaptation=0.05, min_threshold=50):
+        self.noise_floor = noise_floor      # Gürültünün RMS enerjisi
+        self.ratio = ratio                  # Eşik = gürültü tabanı x oran
+        self.adaptation = adaptation        # Üstel ortalama katsayısı
+        self.min_threshold = min_threshold
+        self.samples = 0
+
+    def update(self, energy):
+        """Konuşma olmayan bir parçanın enerjisini ekle"""
+        if self.noise_floor is None:
+            self.noise_floor = energy
+        else:
+            self.noise_floor += self.adaptation * (energy - self.noise_floor)
+        self.samples += 1
+
+    @property
+    def energy_threshold(self):
+        if self.noise_floor is None:
+            return None
+        return max(self.min_threshold, self.noise_floor * self.ratio)
+
+
+class NoiseProfileStore:
+    """Cihaz başına gürültü profillerini JSON dosyasında saklar"""
+
+    def __init__(self, path=DEFAULT_PROFILE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._profiles = None
+
+    def _load_all(self):
+        if self._profiles is None:
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self._profiles = json.load(f)
+            except (OSError, ValueError):
+                self._profiles = {}
+        return self._profiles
+
+    def load(self, device_key):
+        """Cihazın profilini döndür, yoksa None"""
+        with self._lock:
+            return self._load_all().get(device_key)
+
+    def save(self, device_key, energy_threshold, noise_floor=None):
+        """Cihazın profilini güncelle ve dosyaya yaz"""
+        with self._lock:
+            profiles = self._load_all()
+            profiles[device_key] = {
+                'energy_threshold': round(float(energy_threshold), 2),
+                'noise_floor': round(float(noise_floor), 2) if noise_floor is not None else None,
+                'updated': time.time()
+            }
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                # Yarım yazılmış dosya bırakmamak için önce geçici dosyaya yaz
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(profiles, f, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"Gürültü profili kaydedilemedi: {e}")
@@ -0,0 +1,141 @@
+"""
+VisionCursor Gürültü Bastırma
+
+Whisper'dan önce çalışan, numpy STFT tabanlı spektral geçit / Wiener
+filtresi. Gürültü profili yalnızca dinleyicinin verdiği konuşma dışı sesten
+(sessizlik ve konuşma öncesi parçalar) learn_noise() ile öğrenilir; üstel
+ortalama sayesinde gürültü tabanı hem düşüp hem yükselebilir. Konuşma
+segmentleri profili değiştirmez. Ses sabit boyutlu bloklar halinde
+işlendiği için bellek kullanımı segment uzunluğundan bağımsızdır.
+"""
+
+import threading
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _frames(samples, frame_size, hop):
+    """Örtüşen çerçeveler (kopyasız görünüm)"""
+    if len(samples) < frame_size:
+        return np.empty((0, frame_size), dtype=np.float32)
+    return sliding_window_view(samples, frame_size)[::hop]
+
+
+class SpectralGate:
+    """Konuşma dışı sesten öğrenilen gürültü profiliyle spektral bastırma"""
+
+    def __init__(self, sample_rate=16000, frame_size=512, method="wiener",
+                 gate_db=6.0, gain_floor=0.1, adaptation=0.1, block_seconds=1.0):
+        if frame_size % 2:
+            raise ValueError("frame_size çift olmalı")
+        if method not in ("wiener", "gate"):
+            raise ValueError(f"Bilinmeyen gürültü bastırma yöntemi: {method}")
+
+        self.sample_rate = sample_rate
+        self.frame_size = frame_size
+        self.hop = frame_size // 2              # %50 örtüşme
+        self.method = method
+        self.gate_ratio = 10 ** (gate_db / 10)  # Geçit eşiği (güç oranı)
+        self.gain_floor = gain_floor            # Müzikal gürültüyü azaltmak için alt sınır
+        self.adaptation = adaptation            # Gürültü profili güncelleme katsayısı
+        self.block_size = int(block_seconds * sample_rate)
+
+        # Karekök Hann: analiz ve sentez pencerelerinin çarpımı %50 örtüşmede 1'e toplanır
+        self.window = np.sqrt(np.hanning(frame_size + 1)[:-1]).astype(np.float32)
+
+        self.noise_psd = None
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Öğrenilen gürültü profilini unut"""
+        with self._lock:
+            self.noise_psd = None
+
+    def learn_noise(self, samples):
+        """Yalnızca gürültü içeren sesten profili öğren/güncelle"""
+        frames = _frames(np.asarray(samples, dtype=np.float32), self.frame_size, self.hop)
+        if len(frames):
+            power = np.abs(np.fft.rfft(frames * self.window, axis=1)) ** 2
+            self._update_noise(power.mean(axis=0))
+
+    def _update_noise(self, psd):
+        with self._lock:
+            if self.noise_psd is None:
+                self.noise_psd = psd.astype(np.float32)
+            else:
+                self.noise_psd += self.adaptation * (psd - self.noise_psd)
+
+    def _gain(self, power):
+        """Çerçeve x frekans kazanç matrisi; profil yoksa ses değiştirilmez (kazanç 1)"""
+        noise_psd = self.noise_psd
+        if noise_psd is None:
+            # İlk sessizlik gelmeden konuşma başlayabilir
+            return np.ones_like(power, dtype=np.float32)
+        noise = noise_psd + 1e-10
+        if self.method == "wiener":
+            gain = 1.0 - noise / (power + 1e-10)
+        else:
+            gain = (power > noise * self.gate_ratio).astype(np.float32)
+            # Frekansta 3 noktalı yumuşatma ani kesintileri azaltır
+            gain[:, 1:-1] = (gain[:, :-2] + gain[:, 1:-1] + gain[:, 2:]) / 3
+        return np.clip(gain, self.gain_floor, 1.0)
+
+    def stream(self):
+        """Parça parça işleme için yeni bir akış durumu oluştur"""
+        return GateStream(self)
+
+    def process(self, samples):
+        """Bir segmenti bloklar halinde işle, aynı uzunlukta temiz ses döndür"""
+        samples = np.asarray(samples, dtype=np.float32)
+        stream = self.stream()
+        output = []
+        for start in range(0, len(samples), self.block_size):
+            output.append(stream.process_block(samples[start:start + self.block_size]))
+        output.append(stream.flush())
+        result = np.concatenate(output)
+        # Akışın getirdiği hop kadar gecikme atılır
+        return result[self.hop:self.hop + len(samples)]
+
+
+class GateStream:
+    """SpectralGate için örtüştür-topla akış durumu
+
+    Gürültü profili SpectralGate üzerinde paylaşılır; her akışın kendi
+    örtüşme tamponları vardır, böylece birden fazla çözücü aynı anda
+    kullanabilir.
+    """
+
+    def __init__(self, gate):
+        self.gate = gate
+        self._input_tail = np.zeros(gate.hop, dtype=np.float32)
+        self._output_tail = np.zeros(gate.hop, dtype=np.float32)
+
+    def process_block(self, block):
+        """Bir ses bloğunu işle; hop örnek gecikmeli çıktı döndür"""
+        gate = self.gate
+        hop = gate.hop
+        signal = np.concatenate([self._input_tail, np.asarray(block, dtype=np.float32)])
+        frames = _frames(signal, gate.frame_size, hop)
+        if not len(frames):
+            self._input_tail = signal
+            return np.empty(0, dtype=np.float32)
+
+        spectrum = np.fft.rfft(frames * gate.window, axis=1)
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+
+        spectrum *= gate._gain(power)
+
+        output = np.fft.irfft(spectrum, n=gate.frame_size, axis=1).astype(np.float32)
+        output *= gate.window
+
+        # Örtüştür-topla: her çerçevenin ilk yarısı önceki çerçevenin ikinci yarısıyla toplanır
+        result = output[:, :hop].copy()
+        result[0] += self._output_tail
+        result[1:] += output[:-1, hop:]
+        self._output_tail = output[-1, hop:].copy()
+        self._input_tail = signal[len(frames) * hop:]
+        return result.reshape(-1)
+
+    def flush(self):
+        """Kalan örnekleri sıfırlarla tamamlayıp çıkar"""
+        return self.process_block(np.zeros(self.gate.frame_size, dtype=np.float32))
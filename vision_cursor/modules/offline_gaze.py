@@ -0,0 +1,225 @@
+"""
+VisionCursor Çevrimdışı Bakış İşleme
+
+Kayıtlı oturum videolarını kamera olmadan EyeTracker işlem hattından
+geçirir. Videolar kare aralıklarına (bölüm) ayrılır ve bir süreç havuzunda
+işlenir; her işçinin kendi FaceMesh örneği vardır. Bölümler, yumuşatma
+penceresi ve FaceMesh takibinin oturması için biraz önceden (warmup)
+başlar; bu karelerin sonucu atılır. Bölüm sonuçları dosya başına tek bir
+bakış izinde birleştirilir.
+
+İz: kare numarası, zaman (saniye) ve imleç konumu (piksel; yüz
+bulunamayan karelerde NaN).
+
+LandmarkCache verilirse FaceMesh çıktısı önbelleğe yazılır; aynı video
+sonraki çalıştırmalarda FaceMesh olmadan, yalnızca yumuşatma, eşleme ve
+tıklama aşamalarından geçirilir.
+"""
+
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+
+import cv2
+import numpy as np
+
+from .gaze_trace import LANDMARK_COUNT
+
+# İşçi sürecindeki EyeTracker (işçi başına bir FaceMesh)
+_worker_tracker = None
+
+
+def video_info(path):
+    """(kare sayısı, FPS, genişlik, yükseklik)"""
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise ValueError(f"Video açılamadı: {path}")
+    try:
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    finally:
+        capture.release()
+    return frame_count, fps, width, height
+
+
+def plan_chunks(frame_count, chunk_frames):
+    """[(başlangıç, bitiş)] kare aralıkları"""
+    return [(start, min(start + chunk_frames, frame_count))
+            for start in range(0, frame_count, chunk_frames)]
+
+
+def make_tracker(screen_size=(1920, 1080), smooth_factor=8):
+    """Ekransız EyeTracker: imleç kaydedilir, kare atlama ve tıklama kapalı"""
+    from .cursor import RecordingCursor
+    from .eye_tracker import EyeTracker
+    tracker = EyeTracker(cursor=RecordingCursor(*screen_size, max_events=1))
+    tracker.smooth_factor = smooth_factor
+    tracker.frame_skip = 1
+    tracker.clicking_enabled = False
+    return tracker
+
+
+def _init_worker(screen_size, smooth_factor):
+    global _worker_tracker
+    # Paralellik süreçlerden gelir; OpenCV iş parçacıkları çekirdekleri paylaşmasın
+    cv2.setNumThreads(1)
+    _worker_tracker = make_tracker(screen_size, smooth_factor)
+
+
+def _seek(capture, frame_index):
+    """Kareye git; kap tam konumlanamıyorsa baştan sırayla ilerle"""
+    if frame_index == 0:
+        return
+    capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+    if int(capture.get(cv2.CAP_PROP_POS_FRAMES)) == frame_index:
+        return
+    capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    for _ in range(frame_index):
+        if not capture.grab():
+            break
+
+
+def process_chunk(path, start, end, warmup, fps, flip=True):
+    """[start, end) karelerini işle: (kare, x, y, noktalar, yüz bulundu) dizileri
+
+    Bölümden önceki warmup kare de işlenir ama sonuca girmez.
+    """
+    tracker = _worker_tracker
+    tracker.reset_state()
+    first = max(0, start - warmup)
+
+    capture = cv2.VideoCapture(path)
+    count = end - start
+    frames = np.arange(start, end, dtype=np.int64)
+    xs = np.full(count, np.nan, dtype=np.float32)
+    ys = np.full(count, np.nan, dtype=np.float32)
+    landmarks = np.full((count, LANDMARK_COUNT, 2), np.nan, dtype=np.float32)
+    found = np.zeros(count, dtype=bool)
+    try:
+        _seek(capture, first)
+        for index in range(first, end):
+            ret, frame = capture.read()
+            if not ret:
+                break
+            if flip:
+                # Camera._capture_loop ile aynı: ayna görüntüsü
+                frame = cv2.flip(frame, 1)
+            face = tracker._detect_face(frame)
+            if face is None:
+                continue
+            point = tracker._process_landmarks(face, frame, timestamp=index / fps)
+            if index < start:
+                continue
+            row = index - start
+            points = face.landmark[:LANDMARK_COUNT]
+            landmarks[row, :len(points), 0] = [p.x for p in points]
+            landmarks[row, :len(points), 1] = [p.y for p in points]
+            found[row] = True
+            if point is not None:
+                xs[row], ys[row] = point
+    finally:
+        capture.release()
+    return frames, xs, ys, landmarks, found
+
+
+def replay_landmarks(tracker, cached, frame_skip=1):
+    """Önbellekteki noktaları FaceMesh çalıştırmadan işlem hattına ver
+
+    (x, y, tıklama kareleri) döndürür; frame_skip canlı kare atlamayı taklit eder.
+    """
+    tracker.reset_state()
+    # Görselleştirme için yalnızca kare boyutu gerekir
+    image = np.zeros((cached.height, cached.width, 3), dtype=np.uint8)
+    xs = np.full(len(cached), np.nan, dtype=np.float32)
+    ys = np.full(len(cached), np.nan, dtype=np.float32)
+    clicks = []
+    for index in np.flatnonzero(cached.found):
+        if (index + 1) % frame_skip:
+            continue
+        click_count = tracker.click_count
+        point = tracker._process_landmarks(cached.face(index), image, timestamp=index / cached.fps)
+        if point is not None:
+            xs[index], ys[index] = point
+        if tracker.click_count != click_count:
+            clicks.append(int(index))
+    return xs, ys, clicks
+
+
+def _mediapipe_version():
+    try:
+        return metadata.version('mediapipe')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def cache_settings(tracker, flip, chunk_frames, warmup):
+    """Nokta önbelleği anahtarına giren ayarlar: FaceMesh çıktısını etkileyen her şey"""
+    # FaceMesh takip modu önceki kareye bağlı olduğundan bölümleme de sonucu etkiler
+    return dict(tracker.face_mesh_settings, flip=flip, chunk_frames=chunk_frames,
+                warmup=warmup, mediapipe=_mediapipe_version())
+
+
+def process_files(paths, workers=None, chunk_frames=900, warmup=30, screen_size=(1920, 1080),
+                  smooth_factor=8, flip=True, progress=None, cache=None):
+    """Videoları süreç havuzunda işle: {yol: {'frame', 't', 'x', 'y', 'fps', 'cached'}}
+
+    cache (LandmarkCache) verilirse önbellekte olan videolarda FaceMesh
+    çalıştırılmaz; noktalar yerel işlem hattına yeniden verilir. Diğerlerinin
+    noktaları işlendikten sonra önbelleğe yazılır.
+    progress(tamamlanan, toplam) her bölüm bittiğinde çağrılır.
+    """
+    workers = workers or os.cpu_count() or 1
+    infos = {path: video_info(path) for path in paths}
+
+    traces = {}
+    settings = None
+    if cache is not None:
+        tracker = make_tracker(screen_size, smooth_factor)
+        settings = cache_settings(tracker, flip, chunk_frames, warmup)
+        for path in paths:
+            cached = cache.load(path, settings)
+            if cached is not None:
+                xs, ys, _ = replay_landmarks(tracker, cached)
+                traces[path] = _trace(np.arange(len(cached), dtype=np.int64), xs, ys, cached.fps, True)
+
+    pending = [path for path in paths if path not in traces]
+    tasks = [(path, start, end) for path in pending
+             for start, end in plan_chunks(infos[path][0], chunk_frames)]
+    chunks = {path: [] for path in pending}
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(screen_size, smooth_factor)) as pool:
+            futures = [(path, pool.submit(process_chunk, path, start, end, warmup, infos[path][1], flip))
+                       for path, start, end in tasks]
+            for done, (path, future) in enumerate(futures, 1):
+                chunks[path].append(future.result())
+                if progress:
+                    progress(done, len(futures))
+
+    for path, parts in chunks.items():
+        frame_count, fps, width, height = infos[path]
+        if not parts:
+            traces[path] = _trace(np.empty(0, np.int64), np.empty(0, np.float32),
+                                  np.empty(0, np.float32), fps, False)
+            continue
+        frames, xs, ys, landmarks, found = (np.concatenate(column) for column in zip(*parts))
+        if cache is not None:
+            cache.store(path, settings, landmarks, found, fps, (width, height))
+        traces[path] = _trace(frames, xs, ys, fps, False)
+    return {path: traces[path] for path in paths}
+
+
+def _trace(frames, xs, ys, fps, cached):
+    return {'frame': frames, 't': frames / fps, 'x': xs, 'y': ys, 'fps': fps, 'cached': cached}
+
+
+def write_trace_csv(path, trace):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['frame', 't', 'x', 'y'])
+        for frame, t, x, y in zip(trace['frame'], trace['t'], trace['x'], trace['y']):
+            writer.writerow([int(frame), f"{t:.4f}",
+                             '' if np.isnan(x) else int(x), '' if np.isnan(y) else int(y)])
@@ -6,21 +6,72 @@ VisionCursor Performans İzleme Sistemi
 Bu modül göz takibi ve ses tanıma performansını izler
 """
 
+import os
+import signal
 import time
 import psutil
 import threading
-from collections import deque
+from .command_matcher import edit_distance, normalize_words
+from .instrumentation import stages
+from .metrics_store import MetricsStore
+from .process_stats import ThreadCpuSampler, MemoryProbes
+from .memory_profiler import MemoryProfiler
+
+
+def word_error_rate(reference, hypothesis):
+    """Kelime hata oranı (WER): düzenleme mesafesi / referans kelime sayısı"""
+    reference_words = normalize_words(reference)
+    hypothesis_words = normalize_words(hypothesis)
+    if not reference_words:
+        return 0.0 if not hypothesis_words else 1.0
+    return edit_distance(reference_words, hypothesis_words) / len(reference_words)
+
+
+def char_error_rate(reference, hypothesis):
+    """Karakter hata oranı (CER): normalize edilmiş metinler üzerinde"""
+    reference_text = ' '.join(normalize_words(reference))
+    hypothesis_text = ' '.join(normalize_words(hypothesis))
+    if not reference_text:
+        return 0.0 if not hypothesis_text else 1.0
+    return edit_distance(reference_text, hypothesis_text) / len(reference_text)
+
 
 class PerformanceMonitor:
-    def __init__(self):
-        self.fps_counter = deque(maxlen=30)  # Son 30 frame için FPS
-        self.speech_accuracy = deque(maxlen=10)  # Son 10 tanıma için doğruluk
-        self.cpu_usage = deque(maxlen=60)  # Son 60 saniye CPU kullanımı
-        self.memory_usage = deque(maxlen=60)  # Son 60 saniye RAM kullanımı
+    def __init__(self, instrumentation=False, sample_interval=1.0,
+                 fps_history_size=30, accuracy_history_size=10, system_history_size=60,
+                 memory_detail_interval=10.0):
+        # Sabit süreli istatistikler için halka tamponları
+        self.metrics = MetricsStore()
+        self.fps_counter = self.metrics.register('fps', fps_history_size)  # Son 30 frame için FPS
+        self.speech_accuracy = self.metrics.register('speech_accuracy', accuracy_history_size)  # Son 10 tanıma için doğruluk
+        self.cpu_usage = self.metrics.register('cpu_usage', system_history_size)  # Son 60 örnek CPU kullanımı
+        self.memory_usage = self.metrics.register('memory_usage', system_history_size)  # Son 60 örnek RAM kullanımı
+        self.system_history_size = system_history_size
+        
+        # Süreç ve iş parçacığı başına kaynak kullanımı
+        self.thread_sampler = ThreadCpuSampler()
+        self.memory_probes = MemoryProbes()
+        self.process_cpu = self.metrics.register('process.cpu', system_history_size)
+        self.process_rss = self.metrics.register('process.rss_mb', system_history_size)
+        self.thread_cpu = {}                # Son örnekte iş parçacığı adı -> CPU %
+        self.process_uss_mb = None
+        self.subsystem_memory_mb = {}
+        self.metric_probes = {}             # Ad -> (tür, açıklama, değer fonksiyonu)
+        self.memory_detail_interval = memory_detail_interval  # USS ve alt sistem ölçüm aralığı (saniye)
+        self._last_memory_detail = None
         
-        self.last_frame_time = time.time()
+        self.last_frame_time = None
+        self.sample_interval = sample_interval  # Sistem örnekleme aralığı (saniye)
         self.monitoring = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
+        
+        # Aşama süreleri (kamera okuma, FaceMesh, Whisper vb.)
+        self.stages = stages
+        self.stages.enabled = instrumentation
+        self.instrumentation = instrumentation
+        self.trace_dir = os.path.join(os.path.expanduser("~"), ".vision_cursor", "traces")
+        self.memory_profiler = None
         
     def start_monitoring(self):
         """Performans izlemeyi başlat"""
@@ -28,75 +79,217 @@ class PerformanceMonitor:
             return
             
         self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_system)
+        self._stop_event.clear()
+        self.monitor_thread = threading.Thread(target=self._monitor_system, name="performance-monitor")
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
         
     def stop_monitoring(self):
         """Performans izlemeyi durdur"""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join()
+            self.monitor_thread = None
+        if self.memory_profiler:
+            self.memory_profiler.stop()
+    
+    def enable_memory_profiling(self, output_dir=None, interval=60.0, frame_counter=None, top=25):
+        """tracemalloc ile bellek büyümesi profilini başlat (yavaşlatır, yalnızca teşhis için)"""
+        if self.memory_profiler:
+            return self.memory_profiler
+        options = {'output_dir': output_dir} if output_dir else {}
+        self.memory_profiler = MemoryProfiler(interval=interval, top=top, frame_counter=frame_counter,
+                                              memory_probes=self.memory_probes, **options)
+        self.memory_profiler.start()
+        return self.memory_profiler
+    
+    def register_memory_probe(self, name, probe):
+        """Alt sistem bellek ölçümü ekle; probe() bayt döndürür"""
+        self.memory_probes.register(name, probe)
+    
+    def register_metric(self, name, metric_type, help_text, getter):
+        """Dışa aktarılacak sayaç ('counter') ya da gösterge ('gauge') ekle"""
+        if metric_type not in ("counter", "gauge"):
+            raise ValueError(f"Bilinmeyen metrik türü: {metric_type}")
+        self.metric_probes[name] = (metric_type, help_text, getter)
     
     def record_frame(self):
         """Yeni frame kaydı"""
-        current_time = time.time()
-        if self.last_frame_time > 0:
+        current_time = time.perf_counter()
+        if self.last_frame_time is not None and current_time > self.last_frame_time:
             fps = 1.0 / (current_time - self.last_frame_time)
             self.fps_counter.append(fps)
         self.last_frame_time = current_time
     
+    def apply_settings(self, settings):
+        """[performance] ayarlarını çalışırken uygula (bilinmeyen anahtarlar yok sayılır)"""
+        if 'sample_interval' in settings:
+            # Örnekleme döngüsü bir sonraki beklemede yeni aralığı kullanır
+            self.sample_interval = settings['sample_interval']
+        if 'fps_history_size' in settings:
+            self.fps_counter.resize(settings['fps_history_size'])
+        if 'accuracy_history_size' in settings:
+            self.speech_accuracy.resize(settings['accuracy_history_size'])
+        if 'system_history_size' in settings:
+            self.system_history_size = settings['system_history_size']
+            for name in self.metrics.names():
+                if name in ('cpu_usage', 'memory_usage', 'process.cpu', 'process.rss_mb') \
+                        or name.startswith('cpu.'):
+                    self.metrics.window(name).resize(self.system_history_size)
+        if 'trace_dir' in settings:
+            self.trace_dir = settings['trace_dir']
+        tracing = settings.get('tracing', self.stages.trace is not None)
+        if not tracing:
+            self.stages.disable_tracing()
+        elif 'tracing' in settings or 'trace_capacity' in settings:
+            capacity = settings.get('trace_capacity')
+            if capacity is None:
+                capacity = self.stages.trace.maxlen if self.stages.trace is not None else 100000
+            if self.stages.trace is None or self.stages.trace.maxlen != capacity:
+                self.stages.enable_tracing(capacity)
+        if 'instrumentation' in settings:
+            self.instrumentation = settings['instrumentation']
+        # İz kaydı açıkken aşama ölçümü de açık kalmalı
+        self.stages.enabled = self.instrumentation or self.stages.trace is not None
+    
+    def enable_instrumentation(self, enabled=True):
+        """Aşama süresi ölçümünü aç/kapat"""
+        self.instrumentation = enabled
+        self.stages.enabled = enabled
+    
+    def enable_tracing(self, capacity=100000, trace_dir=None):
+        """Son capacity aşamayı Chrome/Perfetto iz olayı olarak tut"""
+        if trace_dir:
+            self.trace_dir = trace_dir
+        self.stages.enable_tracing(capacity)
+    
+    def dump_trace(self, path=None, background=False):
+        """İz tamponunu Chrome Trace Event JSON olarak yaz, dosya yolunu döndür
+
+        background=True: tampon çağıran iş parçacığında kopyalanır,
+        JSON'a çevirme ve yazma ayrı bir iş parçacığında yapılır.
+        """
+        if self.stages.trace is None:
+            print("İz kaydı kapalı")
+            return None
+        if path is None:
+            path = os.path.join(self.trace_dir, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+        snapshot = self.stages.trace_snapshot()
+        if background:
+            thread = threading.Thread(target=self._write_trace, args=(path, snapshot), name="trace-dump")
+            thread.daemon = True
+            thread.start()
+        else:
+            self._write_trace(path, snapshot)
+        return path
+    
+    def _write_trace(self, path, snapshot):
+        try:
+            count = self.stages.dump_trace(path, snapshot)
+            print(f"{count} iz olayı kaydedildi: {path}")
+        except OSError as e:
+            print(f"İz yazılamadı ({path}): {e}")
+    
+    def install_trace_signal(self, signal_name="SIGUSR2"):
+        """Sinyal gelince izi diske yaz (ör. kill -USR2 <pid>); ana iş parçacığından çağrılmalı"""
+        signal_number = getattr(signal, signal_name, None)
+        if signal_number is None:
+            print(f"{signal_name} bu sistemde desteklenmiyor")
+            return False
+        # İşleyici Qt ana iş parçacığında çalışır; yalnızca kopya burada alınır
+        signal.signal(signal_number, lambda signum, frame: self.dump_trace(background=True))
+        return True
+    
+    def get_stage_stats(self):
+        """Aşama başına süre yüzdelikleri (ms)"""
+        return self.stages.snapshot()
+    
     def record_speech_accuracy(self, expected_words, recognized_words):
         """Ses tanıma doğruluğunu kaydet"""
         if not expected_words or not recognized_words:
             return
             
-        # Basit word accuracy hesaplaması
-        expected_set = set(expected_words.lower().split())
-        recognized_set = set(recognized_words.lower().split())
-        
-        if expected_set:
-            accuracy = len(expected_set.intersection(recognized_set)) / len(expected_set)
-            self.speech_accuracy.append(accuracy)
+        # Kelime doğruluğu = 1 - WER (ekleme hataları WER'i 1'in üstüne çıkarabilir)
+        accuracy = max(0.0, 1.0 - word_error_rate(expected_words, recognized_words))
+        self.speech_accuracy.append(accuracy)
     
     def _monitor_system(self):
         """Sistem kaynaklarını izle"""
-        while self.monitoring:
+        # İlk çağrı ölçüm başlangıcını belirler; sonraki çağrılar beklemeden
+        # önceki çağrıdan bu yana geçen süredeki kullanımı döndürür
+        psutil.cpu_percent(interval=None)
+        self.thread_sampler.sample()
+        while not self._stop_event.wait(self.sample_interval):
             try:
                 # CPU kullanımı
-                cpu_percent = psutil.cpu_percent(interval=1)
-                self.cpu_usage.append(cpu_percent)
+                self.cpu_usage.append(psutil.cpu_percent(interval=None))
                 
                 # Bellek kullanımı
                 memory = psutil.virtual_memory()
                 self.memory_usage.append(memory.percent)
                 
+                self._sample_process()
+                
             except Exception as e:
                 print(f"Sistem izleme hatası: {e}")
-                time.sleep(1)
+    
+    def _sample_process(self):
+        """Süreç, iş parçacığı ve alt sistem kaynak kullanımını örnekle"""
+        cpu = self.thread_sampler.sample()
+        self.thread_cpu = cpu['threads']
+        self.process_cpu.append(cpu['process'])
+        for subsystem, percent in cpu['subsystems'].items():
+            self.metrics.register(f'cpu.{subsystem}', self.system_history_size).append(percent)
+        
+        # USS smaps okuması gerektirdiği için daha seyrek ölçülür
+        now = time.monotonic()
+        detail = (self._last_memory_detail is None
+                  or now - self._last_memory_detail >= self.memory_detail_interval)
+        memory = self.memory_probes.process_memory(include_uss=detail)
+        self.process_rss.append(memory['rss'] / (1024 * 1024))
+        if detail:
+            self._last_memory_detail = now
+            if memory['uss'] is not None:
+                self.process_uss_mb = memory['uss'] / (1024 * 1024)
+            self.subsystem_memory_mb = {
+                name: value / (1024 * 1024) if value is not None else None
+                for name, value in self.memory_probes.subsystems().items()
+            }
     
     def get_stats(self):
         """Performans istatistiklerini al"""
+        fps = self.fps_counter.stats()
+        speech_accuracy = self.speech_accuracy.stats()
+        cpu_usage = self.cpu_usage.stats()
+        memory_usage = self.memory_usage.stats()
         stats = {
-            'fps': {
-                'current': self.fps_counter[-1] if self.fps_counter else 0,
-                'average': sum(self.fps_counter) / len(self.fps_counter) if self.fps_counter else 0,
-                'min': min(self.fps_counter) if self.fps_counter else 0,
-                'max': max(self.fps_counter) if self.fps_counter else 0
-            },
+            'fps': fps,
             'speech_accuracy': {
-                'average': sum(self.speech_accuracy) / len(self.speech_accuracy) if self.speech_accuracy else 0,
-                'min': min(self.speech_accuracy) if self.speech_accuracy else 0,
-                'max': max(self.speech_accuracy) if self.speech_accuracy else 0
+                'average': speech_accuracy['average'],
+                'min': speech_accuracy['min'],
+                'max': speech_accuracy['max']
             },
             'cpu_usage': {
-                'current': self.cpu_usage[-1] if self.cpu_usage else 0,
-                'average': sum(self.cpu_usage) / len(self.cpu_usage) if self.cpu_usage else 0
+                'current': cpu_usage['current'],
+                'average': cpu_usage['average']
             },
             'memory_usage': {
-                'current': self.memory_usage[-1] if self.memory_usage else 0,
-                'average': sum(self.memory_usage) / len(self.memory_usage) if self.memory_usage else 0
-            }
+                'current': memory_usage['current'],
+                'average': memory_usage['average']
+            },
+            'process': {
+                'cpu': self.process_cpu.stats(),
+                'rss_mb': self.process_rss.stats(),
+                'uss_mb': self.process_uss_mb
+            },
+            'subsystem_cpu': {
+                name[len('cpu.'):]: self.metrics.stats(name)
+                for name in self.metrics.names() if name.startswith('cpu.')
+            },
+            'thread_cpu': dict(self.thread_cpu),
+            'subsystem_memory_mb': dict(self.subsystem_memory_mb),
+            'stages': self.get_stage_stats()
         }
         return stats
     
@@ -109,4 +302,18 @@ class PerformanceMonitor:
         print(f"Ses Doğruluğu: %{stats['speech_accuracy']['average']*100:.1f}")
         print(f"CPU Kullanımı: %{stats['cpu_usage']['current']:.1f} (Ort: %{stats['cpu_usage']['average']:.1f})")
         print(f"RAM Kullanımı: %{stats['memory_usage']['current']:.1f} (Ort: %{stats['memory_usage']['average']:.1f})")
+        process = stats['process']
+        uss = f"{process['uss_mb']:.0f} MB" if process['uss_mb'] is not None else "-"
+        print(f"Süreç: CPU %{process['cpu']['current']:.1f}  RSS {process['rss_mb']['current']:.0f} MB  USS {uss}")
+        for name, cpu in sorted(stats['subsystem_cpu'].items()):
+            memory = stats['subsystem_memory_mb'].get(name)
+            memory_text = f"  {memory:.1f} MB" if memory is not None else ""
+            print(f"  {name:<14} CPU %{cpu['current']:5.1f} (Ort: %{cpu['average']:.1f}){memory_text}")
+        for name, percent in sorted(stats['thread_cpu'].items(), key=lambda item: -item[1])[:10]:
+            print(f"    {name:<26} %{percent:5.1f}")
+        if stats['stages']:
+            print(f"{'Aşama':<26}{'sayı':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+            for name, stage in stats['stages'].items():
+                print(f"{name:<26}{stage['count']:>8}{stage['p50_ms']:>9.2f}{stage['p95_ms']:>9.2f}"
+                      f"{stage['p99_ms']:>9.2f}{stage['max_ms']:>9.2f}")
         print("=" * 45)
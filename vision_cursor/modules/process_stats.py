@@ -0,0 +1,154 @@
+"""
+VisionCursor Süreç İstatistikleri
+
+İş parçacığı başına CPU süresini okuyup adlandırılmış iş parçacıklarına ve
+alt sistemlere (göz takibi, ses tanıma, arayüz, izleme) eşler. Linux'ta
+/proc/self/task/*/stat, diğer sistemlerde psutil kullanılır. Ayrıca süreç
+RSS/USS değerlerini ve alt sistemlerin kaydettiği bellek ölçümlerini verir.
+"""
+
+import os
+import threading
+import time
+
+import psutil
+
+# İş parçacığı adı öneki -> alt sistem
+SUBSYSTEM_PREFIXES = (
+    ('camera', 'eye_tracking'),
+    ('speech-', 'speech'),
+    ('performance-', 'monitor'),
+    ('metrics-', 'monitor'),
+    ('memory-', 'monitor'),
+)
+MAIN_THREAD_NAME = 'qt-main'
+
+_PROC_TASKS = '/proc/self/task'
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+
+def _read_proc_threads():
+    """{tid: (komut adı, cpu saniyesi)} - /proc/self/task/*/stat"""
+    threads = {}
+    for entry in os.listdir(_PROC_TASKS):
+        try:
+            with open(f"{_PROC_TASKS}/{entry}/stat", 'rb') as f:
+                data = f.read().decode('utf-8', 'replace')
+        except OSError:
+            # Okuma sırasında sonlanan iş parçacığı
+            continue
+        # Komut adı boşluk içerebilir; alanlar son ')' karakterinden sonra başlar
+        comm = data[data.index('(') + 1:data.rindex(')')]
+        fields = data[data.rindex(')') + 2:].split()
+        # fields[11] = utime, fields[12] = stime (stat'ın 14. ve 15. alanları)
+        threads[int(entry)] = (comm, (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS)
+    return threads
+
+
+def _read_psutil_threads(process):
+    """{tid: (None, cpu saniyesi)} - /proc olmayan sistemler için"""
+    return {t.id: (None, t.user_time + t.system_time) for t in process.threads()}
+
+
+def thread_names():
+    """Yerel iş parçacığı kimliği -> Python iş parçacığı adı"""
+    main = threading.main_thread()
+    names = {}
+    for thread in threading.enumerate():
+        if thread.native_id is not None:
+            names[thread.native_id] = MAIN_THREAD_NAME if thread is main else thread.name
+    return names
+
+
+def subsystem_of(name):
+    """İş parçacığı adından alt sistem"""
+    if name == MAIN_THREAD_NAME:
+        return 'gui'
+    for prefix, subsystem in SUBSYSTEM_PREFIXES:
+        if name.startswith(prefix):
+            return subsystem
+    # Python'a ait olmayan iş parçacıkları (torch, mediapipe, ses sürücüsü...)
+    return 'native' if name.startswith('native:') else 'other'
+
+
+class ThreadCpuSampler:
+    """Ardışık örnekler arasında iş parçacığı başına CPU kullanımı (%)
+
+    100 bir çekirdeğin tamamen kullanıldığı anlamına gelir.
+    """
+
+    def __init__(self):
+        self._process = psutil.Process()
+        self._use_proc = os.path.isdir(_PROC_TASKS)
+        self._previous = {}
+        self._previous_time = None
+
+    def _read(self):
+        if self._use_proc:
+            return _read_proc_threads()
+        return _read_psutil_threads(self._process)
+
+    def sample(self):
+        """{'threads': {ad: %}, 'subsystems': {alt sistem: %}, 'process': %}"""
+        now = time.perf_counter()
+        current = self._read()
+        names = thread_names()
+
+        threads = {}
+        if self._previous_time is not None:
+            elapsed = now - self._previous_time
+            for tid, (comm, cpu_seconds) in current.items():
+                previous = self._previous.get(tid)
+                if previous is None:
+                    # İlk kez görülen iş parçacığı: bu örnek yalnızca taban olur,
+                    # toplam CPU süresi tek aralığa yazılırsa %100'ü aşabilir
+                    continue
+                used = cpu_seconds - previous[1]
+                name = names.get(tid) or f"native:{comm or tid}"
+                # Aynı adlı yerel iş parçacıkları (ör. torch havuzu) toplanır
+                threads[name] = threads.get(name, 0.0) + max(0.0, used) / elapsed * 100
+
+        self._previous = current
+        self._previous_time = now
+
+        subsystems = {}
+        for name, percent in threads.items():
+            subsystem = subsystem_of(name)
+            subsystems[subsystem] = subsystems.get(subsystem, 0.0) + percent
+        return {
+            'threads': threads,
+            'subsystems': subsystems,
+            'process': sum(threads.values())
+        }
+
+
+class MemoryProbes:
+    """Süreç RSS/USS ve alt sistem bellek ölçümleri (bayt)"""
+
+    def __init__(self):
+        self._process = psutil.Process()
+        self._probes = {}
+
+    def register(self, name, probe):
+        """probe(): alt sistemin bellek kullanımı (bayt) ya da bilinmiyorsa None"""
+        self._probes[name] = probe
+
+    def process_memory(self, include_uss=True):
+        """RSS ve (isteğe bağlı, daha pahalı) USS"""
+        if include_uss:
+            try:
+                info = self._process.memory_full_info()
+                return {'rss': info.rss, 'uss': info.uss}
+            except (psutil.AccessDenied, AttributeError):
+                pass
+        return {'rss': self._process.memory_info().rss, 'uss': None}
+
+    def subsystems(self):
+        usage = {}
+        for name, probe in self._probes.items():
+            try:
+                usage[name] = probe()
+            except Exception as e:
+                print(f"Bellek ölçümü hatası ({name}): {e}")
+                usage[name] = None
+        return usage
@@ -0,0 +1,282 @@
+"""
+VisionCursor Ayarları
+
+config.ini için tipli ve doğrulanmış ayar katmanı. SCHEMA her bölümdeki
+ayarların tipini, varsayılanını ve geçerli değerlerini tanımlar;
+load_settings() dosyayı {bölüm: {ad: değer}} sözlüğüne çevirir. Geçersiz
+ya da bilinmeyen ayarlar hata listesinde döner, yerlerine varsayılan
+kullanılır.
+
+ConfigWatcher dosyayı ucuz bir stat() ile yoklar. Değişiklik bir sonraki
+yoklamada da aynıysa (yazma bitmişse) dosyanın tamamı yeniden okunur;
+tek bir hata bile varsa değişiklik bütünüyle reddedilir ve çalışan
+ayarlar korunur. Geçerli değişiklikler bölüm aboneliklerine (ör.
+EyeTracker.apply_settings) yalnızca değişen ve canlı uygulanabilen
+anahtarlarla iletilir. Model, motor ve dosya yolu gibi ayarlar yeniden
+başlatma gerektirir; değişiklikleri yalnızca bildirilir.
+"""
+
+import configparser
+import os
+import threading
+
+_BOOLEANS = configparser.ConfigParser.BOOLEAN_STATES
+
+
+def path(text):
+    """Dosya yolu ayarı; ~ genişletilir, göreli yollar config.ini klasörüne göredir"""
+    return os.path.expanduser(text)
+
+
+class Option:
+    """Tek ayarın tipi, varsayılanı ve geçerli değerleri"""
+
+    __slots__ = ('kind', 'default', 'minimum', 'maximum', 'choices', 'live')
+
+    def __init__(self, kind, default, minimum=None, maximum=None, choices=None, live=True):
+        self.kind = kind
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.choices = choices
+        self.live = live            # False: yeniden başlatmada uygulanır
+
+    def parse(self, text):
+        """config.ini metnini tipli değere çevir; geçersizse ValueError"""
+        text = text.strip()
+        if self.kind is bool:
+            if text.lower() not in _BOOLEANS:
+                raise ValueError(f"true/false bekleniyordu: {text!r}")
+            value = _BOOLEANS[text.lower()]
+        else:
+            value = self.kind(text)
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"en az {self.minimum} olmalı: {text}")
+        if self.maximum is not None and value > self.maximum:
+            raise ValueError(f"en fazla {self.maximum} olmalı: {text}")
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"{', '.join(self.choices)} değerlerinden biri olmalı: {text}")
+        return value
+
+
+SCHEMA = {
+    'eye_tracking': {
+        'detection_confidence': Option(float, 0.7, 0.0, 1.0),
+        'tracking_confidence': Option(float, 0.7, 0.0, 1.0),
+        'gaze_threshold': Option(float, 2.5, 0.1),
+        'movement_threshold': Option(float, 20.0, 0.0),
+        'click_cooldown': Option(float, 1.0, 0.0),
+        'clicking_enabled': Option(bool, True),
+        'frame_skip': Option(int, 2, 1),
+        'smooth_factor': Option(int, 8, 1),
+        'gaze_trace': Option(bool, False, live=False),
+        'gaze_trace_dir': Option(path, '~/.vision_cursor/gaze_traces', live=False),
+        'gaze_trace_landmarks': Option(str, 'float16', choices=('float16', 'float32'), live=False),
+    },
+    'speech_recognition': {
+        'language': Option(str, 'tr'),
+        'use_whisper': Option(bool, True, live=False),
+        'whisper_engine': Option(str, 'openai', choices=('openai', 'faster-whisper', 'whisper.cpp'),
+                                 live=False),
+        'whisper_model': Option(str, 'base', live=False),
+        'energy_threshold': Option(float, 400.0, 0.0),
+        'pause_threshold': Option(float, 0.6, 0.1),
+        'phrase_time_limit': Option(float, 8.0, 1.0),
+        'min_word_length': Option(int, 2, 1),
+        'min_sentence_length': Option(int, 3, 0),
+        'streaming': Option(bool, False, live=False),
+        'partial_interval': Option(float, 1.0, 0.1),
+        'command_fast_path': Option(bool, True, live=False),
+        'command_model': Option(str, 'tiny', live=False),
+        'command_max_duration': Option(float, 2.0, 0.1),
+        'commands_file': Option(path, 'commands.ini', live=False),
+        'corrections_file': Option(path, 'corrections.ini', live=False),
+        'decoder_workers': Option(int, 1, 1, 16, live=False),
+        'max_queue_size': Option(int, 32, 1, live=False),
+        'max_batch_size': Option(int, 8, 1),
+        'max_batch_wait': Option(float, 0.05, 0.0),
+        'noise_profile_file': Option(path, '~/.vision_cursor/noise_profiles.json', live=False),
+        'noise_suppression': Option(bool, False),
+        'noise_suppression_method': Option(str, 'wiener', choices=('wiener', 'gate')),
+    },
+    'camera': {
+        'width': Option(int, 640, 160, 3840),
+        'height': Option(int, 480, 120, 2160),
+        'fps': Option(int, 30, 1, 240),
+    },
+    'performance': {
+        'monitor_enabled': Option(bool, True, live=False),
+        'stats_update_interval': Option(float, 5.0, 0.5, live=False),
+        'fps_history_size': Option(int, 30, 1),
+        'accuracy_history_size': Option(int, 10, 1),
+        'sample_interval': Option(float, 1.0, 0.1),
+        'system_history_size': Option(int, 60, 1),
+        'instrumentation': Option(bool, False),
+        'tracing': Option(bool, False),
+        'trace_capacity': Option(int, 100000, 1000),
+        'trace_dir': Option(path, '~/.vision_cursor/traces'),
+        'metrics_exporter': Option(bool, False, live=False),
+        'metrics_host': Option(str, '127.0.0.1', live=False),
+        'metrics_port': Option(int, 9464, 1, 65535, live=False),
+        'memory_profiling': Option(bool, False, live=False),
+        'memory_profile_interval': Option(float, 60.0, 1.0, live=False),
+        'memory_profile_dir': Option(path, '~/.vision_cursor/memory_profiles', live=False),
+    },
+    'transcript': {
+        'journal_enabled': Option(bool, True, live=False),
+        'journal_dir': Option(path, '~/.vision_cursor/transcripts', live=False),
+        'fsync_interval': Option(float, 2.0, 0.1, live=False),
+        'max_sessions': Option(int, 50, 1, live=False),
+    },
+    'gui': {
+        'window_width': Option(int, 1200, 400, live=False),
+        'window_height': Option(int, 800, 300, live=False),
+        'font_size': Option(int, 16, 6, 72, live=False),
+    },
+}
+
+
+def parse_settings(config, base_dir='.'):
+    """ConfigParser -> ({bölüm: {ad: değer}}, [hata])
+
+    Eksik ayarlar varsayılanı alır; geçersiz ve bilinmeyen ayarlar hata
+    listesine eklenir (geçersizlerin yerine varsayılan kullanılır).
+    """
+    settings = {}
+    errors = []
+    for section, options in SCHEMA.items():
+        values = settings[section] = {}
+        for name, option in options.items():
+            text = config.get(section, name, raw=True, fallback=None)
+            value = option.default
+            if text is not None:
+                try:
+                    value = option.parse(text)
+                except ValueError as e:
+                    errors.append(f"[{section}] {name}: {e}")
+            if option.kind is path:
+                value = os.path.join(base_dir, path(value))
+            values[name] = value
+        if config.has_section(section):
+            errors.extend(f"[{section}] {name}: bilinmeyen ayar"
+                          for name in config.options(section) if name not in options)
+    errors.extend(f"[{section}]: bilinmeyen bölüm" for section in config.sections() if section not in SCHEMA)
+    return settings, errors
+
+
+def load_settings(config_path):
+    """config.ini dosyasını oku -> ({bölüm: {ad: değer}}, [hata])"""
+    base_dir = os.path.dirname(os.path.abspath(config_path))
+    config = configparser.ConfigParser()
+    try:
+        with open(config_path, encoding='utf-8') as f:
+            config.read_file(f)
+    except (OSError, configparser.Error) as e:
+        return parse_settings(configparser.ConfigParser(), base_dir)[0], [f"{config_path}: {e}"]
+    return parse_settings(config, base_dir)
+
+
+def diff_settings(old, new):
+    """{bölüm: {ad: yeni değer}} yalnızca değişen ayarlar"""
+    changes = {}
+    for section, values in new.items():
+        changed = {name: value for name, value in values.items()
+                   if old.get(section, {}).get(name) != value}
+        if changed:
+            changes[section] = changed
+    return changes
+
+
+class ConfigWatcher:
+    """config.ini değişikliklerini yoklayıp abonelere canlı uygula"""
+
+    def __init__(self, config_path, settings=None, interval=1.0):
+        self.path = config_path
+        self.interval = interval
+        self.settings = settings if settings is not None else load_settings(config_path)[0]
+        self.reloads = 0            # Uygulanan yeniden yüklemeler
+        self.rejected = 0           # Hata yüzünden reddedilen değişiklikler
+        self._subscribers = {}      # Bölüm -> [callback(değişen ayarlar)]
+        self._signature = self._stat()
+        self._pending_signature = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.thread = None
+
+    def subscribe(self, section, callback):
+        """section bölümünde canlı ayar değişince callback({ad: değer}) çağrılır"""
+        if section not in SCHEMA:
+            raise ValueError(f"Bilinmeyen ayar bölümü: {section}")
+        self._subscribers.setdefault(section, []).append(callback)
+
+    def start(self):
+        if self.thread:
+            return
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._watch, name="config-watcher")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            # Atomik değiştirme sırasında dosya kısa süre yok olabilir
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _watch(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Ayar izleme hatası: {e}")
+
+    def check(self):
+        """Dosya değiştiyse ve yazma bittiyse yeniden yükle; uygulandıysa True"""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            self._pending_signature = None
+            return False
+        if signature != self._pending_signature:
+            # Yarım yazılmış dosyayı okumamak için bir yoklama daha bekle
+            self._pending_signature = signature
+            return False
+        self._signature = signature
+        self._pending_signature = None
+        return self.reload()
+
+    def reload(self):
+        """Dosyayı yeniden oku; hatasızsa değişen canlı ayarları abonelere ilet"""
+        with self._lock:
+            settings, errors = load_settings(self.path)
+            if errors:
+                self.rejected += 1
+                print(f"Ayar değişikliği reddedildi ({len(errors)} hata), çalışan ayarlar korunuyor:")
+                for error in errors:
+                    print(f"  {error}")
+                return False
+
+            changes = diff_settings(self.settings, settings)
+            self.settings = settings
+            self.reloads += 1
+            for section, changed in changes.items():
+                restart = [name for name in changed if not SCHEMA[section][name].live]
+                if restart:
+                    print(f"[{section}] {', '.join(restart)} yeniden başlatınca uygulanacak")
+                live = {name: value for name, value in changed.items() if SCHEMA[section][name].live}
+                if not live:
+                    continue
+                print(f"[{section}] ayarlar güncellendi: {live}")
+                for callback in self._subscribers.get(section, []):
+                    try:
+                        callback(live)
+                    except Exception as e:
+                        print(f"Ayar uygulama hatası ([{section}]): {e}")
+            return True
@@ -1,35 +1,332 @@
 import speech_recognition as sr
-import whisper
 import threading
 import queue
 import os
-import tempfile
 import time
 import numpy as np
 import logging
+from .command_spotter import CommandSpotter
+from .command_matcher import CommandMatcher
+from .audio_source import MicrophoneSource
+from .noise_profile import NoiseFloorEstimator, NoiseProfileStore, DEFAULT_PROFILE_FILE
+from .noise_suppressor import SpectralGate
+from .instrumentation import stage, set_trace_args
+from .text_processing import TextPostProcessor, DEFAULT_FILTER_WORDS, load_corrections
+
+# Varsayılan komut dosyası
+DEFAULT_COMMANDS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "commands.ini")
+DEFAULT_CORRECTIONS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "corrections.ini")
+
+# Whisper'ın beklediği örnekleme hızı
+WHISPER_SAMPLE_RATE = 16000
+# Toplu açgözlü çözümlemede güvensiz kalan segmentler için sıcaklık sırası
+# (0.0 toplu yolda zaten denendi)
+FALLBACK_TEMPERATURES = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+class WhisperEngine:
+    """Ses tanıma motoru arayüzü
+
+    Motorlar 16 kHz float32 ses dizisini alır ve (metin, sessizlik olasılığı)
+    döndürür. prompt ve max_tokens hızlı komut yolu için kullanılır.
+    """
+
+    name = None
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def transcribe(self, samples, language, prompt=None, max_tokens=None):
+        raise NotImplementedError
+
+    def transcribe_batch(self, samples_list, language):
+        """Birden fazla segmenti çözümle; varsayılan olarak tek tek işler"""
+        return [self.transcribe(samples, language) for samples in samples_list]
+
+    def memory_bytes(self):
+        """Model ağırlıklarının bellek kullanımı (bayt), bilinmiyorsa None"""
+        return None
+
+
+class OpenAIWhisperEngine(WhisperEngine):
+    """openai-whisper (PyTorch) motoru"""
+
+    name = "openai"
+
+    def __init__(self, model_name, device=None):
+        super().__init__(model_name)
+        import torch
+        import whisper
+        self._torch = torch
+        self._whisper = whisper
+        self.model = whisper.load_model(model_name, device=device)
+        # Yarı hassasiyet yalnızca GPU'da kullanılabilir
+        self.fp16 = self.model.device.type != "cpu"
+
+    def memory_bytes(self):
+        tensors = list(self.model.parameters()) + list(self.model.buffers())
+        return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+    def transcribe(self, samples, language, prompt=None, max_tokens=None):
+        whisper = self._whisper
+        
+        if max_tokens:
+            # Kısa, yönlendirilmiş tek pencere çözümlemesi
+            audio = whisper.pad_or_trim(samples)
+            mel = whisper.log_mel_spectrogram(audio, n_mels=self.model.dims.n_mels).to(self.model.device)
+            options = whisper.DecodingOptions(
+                language=language,
+                fp16=self.fp16,
+                temperature=0.0,
+                without_timestamps=True,
+                prompt=prompt,
+                sample_len=max_tokens
+            )
+            result = whisper.decode(self.model, mel, options)
+            return result.text.strip(), result.no_speech_prob
+        
+        return self._transcribe_full(samples, language, prompt, temperature=0.0)
+
+    def _transcribe_full(self, samples, language, prompt=None, temperature=0.0):
+        # Whisper ile tanıma - Türkçe optimize edilmiş parametreler
+        result = self.model.transcribe(
+            samples, 
+            language=language,
+            fp16=self.fp16,
+            temperature=temperature,  # 0.0: daha tutarlı sonuçlar için
+            condition_on_previous_text=False,  # Her tanıma bağımsız
+            initial_prompt=prompt,
+            no_speech_threshold=0.4,  # Sessizlik algılama
+            logprob_threshold=-1.0,
+            compression_ratio_threshold=2.4
+        )
+        return result["text"].strip(), 0.0
+
+    def transcribe_batch(self, samples_list, language):
+        """30 saniyeye sığan segmentleri tek kodlayıcı geçişi ve toplu açgözlü
+        çözümleme ile işle"""
+        whisper = self._whisper
+        results = [None] * len(samples_list)
+        
+        batch_indices = [i for i, samples in enumerate(samples_list)
+                         if len(samples) <= whisper.audio.N_SAMPLES]
+        if len(batch_indices) < 2:
+            batch_indices = []
+        if batch_indices:
+            # Segmentler 30 saniyeye tamamlanıp tek mel grubunda birleştirilir
+            mels = [whisper.log_mel_spectrogram(whisper.pad_or_trim(samples_list[i]),
+                                                n_mels=self.model.dims.n_mels)
+                    for i in batch_indices]
+            mel_batch = self._torch.stack(mels).to(self.model.device)
+            options = whisper.DecodingOptions(
+                language=language,
+                fp16=self.fp16,
+                temperature=0.0,
+                without_timestamps=True
+            )
+            decoded = whisper.decode(self.model, mel_batch, options)
+            
+            for index, result in zip(batch_indices, decoded):
+                # transcribe() ile aynı sessizlik kuralı
+                if result.no_speech_prob > 0.4 and result.avg_logprob < -1.0:
+                    results[index] = ("", result.no_speech_prob)
+                # Güvensiz sonuçlar aşağıda sıcaklık geri dönüşüyle tekrar çözülür
+                elif result.compression_ratio <= 2.4 and result.avg_logprob >= -1.0:
+                    results[index] = (result.text.strip(), result.no_speech_prob)
+        
+        for index, samples in enumerate(samples_list):
+            if results[index] is None:
+                # Aynı açgözlü çözümlemeyi tekrarlamak aynı sonucu verir;
+                # toplu yoldan reddedilenler artan sıcaklıklarla denenir
+                temperature = FALLBACK_TEMPERATURES if index in batch_indices else 0.0
+                results[index] = self._transcribe_full(samples, language, temperature=temperature)
+        return results
+
+
+class FasterWhisperEngine(WhisperEngine):
+    """CTranslate2 tabanlı faster-whisper motoru (CPU'da int8)"""
+
+    name = "faster-whisper"
+
+    def __init__(self, model_name, device="cpu", compute_type="int8", cpu_threads=0):
+        super().__init__(model_name)
+        from faster_whisper import WhisperModel
+        self.model = WhisperModel(
+            model_name,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads
+        )
+
+    def transcribe(self, samples, language, prompt=None, max_tokens=None):
+        options = {}
+        if max_tokens:
+            options["max_new_tokens"] = max_tokens
+        
+        segments, _ = self.model.transcribe(
+            samples,
+            language=language,
+            beam_size=1,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            initial_prompt=prompt,
+            without_timestamps=True,
+            no_speech_threshold=0.4,
+            log_prob_threshold=-1.0,
+            compression_ratio_threshold=2.4,
+            **options
+        )
+        
+        # Segmentler üreteç olarak döner, çözümleme burada yapılır
+        texts = []
+        no_speech_prob = 1.0
+        for segment in segments:
+            texts.append(segment.text)
+            no_speech_prob = min(no_speech_prob, segment.no_speech_prob)
+        if not texts:
+            return "", 1.0
+        return ''.join(texts).strip(), no_speech_prob
+
+
+class WhisperCppEngine(WhisperEngine):
+    """whisper.cpp (pywhispercpp) motoru"""
+
+    name = "whisper.cpp"
+
+    def __init__(self, model_name, n_threads=None):
+        super().__init__(model_name)
+        from pywhispercpp.model import Model
+        options = {"print_progress": False, "print_realtime": False}
+        if n_threads:
+            options["n_threads"] = n_threads
+        self.model = Model(model_name, **options)
+
+    def transcribe(self, samples, language, prompt=None, max_tokens=None):
+        options = {"language": language, "no_context": True}
+        if prompt:
+            options["initial_prompt"] = prompt
+        if max_tokens:
+            options["max_tokens"] = max_tokens
+            options["single_segment"] = True
+        
+        segments = self.model.transcribe(samples.astype(np.float32), **options)
+        text = ''.join(segment.text for segment in segments).strip()
+        return text, 0.0 if text else 1.0
+
+
+# Yapılandırmadaki whisper_engine değerleri
+ENGINES = {
+    OpenAIWhisperEngine.name: OpenAIWhisperEngine,
+    FasterWhisperEngine.name: FasterWhisperEngine,
+    WhisperCppEngine.name: WhisperCppEngine,
+}
+
+
+def create_engine(engine_name="openai", model_name="base"):
+    """Motoru oluştur; yüklenemezse daha küçük modele ve varsayılan motora düş"""
+    if engine_name not in ENGINES:
+        print(f"Bilinmeyen ses tanıma motoru '{engine_name}', 'openai' kullanılıyor")
+        engine_name = "openai"
+    
+    candidates = [(engine_name, model_name)]
+    if model_name != "tiny":
+        candidates.append((engine_name, "tiny"))
+    if engine_name != "openai":
+        candidates.append(("openai", "tiny"))
+    
+    last_error = None
+    for name, model in candidates:
+        try:
+            engine = ENGINES[name](model)
+            print(f"Whisper '{model}' modeli yüklendi ({name})")
+            return engine
+        except Exception as e:
+            print(f"Whisper '{model}' modeli yüklenemedi ({name}): {e}")
+            last_error = e
+    raise last_error
+
+
+class LocalAgreement:
+    """Ardışık hipotezlerde değişmeyen önek kelimeleri kesinleştirir"""
+
+    def __init__(self):
+        self.committed_words = []
+        self.previous_words = []
+
+    def reset(self):
+        """Yeni segment için durumu sıfırla"""
+        self.committed_words = []
+        self.previous_words = []
+
+    def update(self, hypothesis):
+        """Yeni hipotezi işle, (kesinleşen metin, tam metin) döndür"""
+        words = hypothesis.split()
+
+        # Son iki hipotezin ortak öneki kararlı kabul edilir
+        agreed = 0
+        for previous, current in zip(self.previous_words, words):
+            if previous != current:
+                break
+            agreed += 1
+
+        # Kesinleşen kısım geri alınmaz, yalnızca uzayabilir
+        if agreed > len(self.committed_words) and \
+                words[:len(self.committed_words)] == self.committed_words:
+            self.committed_words = words[:agreed]
+
+        self.previous_words = words
+
+        committed = ' '.join(self.committed_words)
+        full = ' '.join(self.committed_words + words[len(self.committed_words):])
+        return committed, full
+
 
 class SpeechRecognizer:
-    def __init__(self, language="tr", use_whisper=True, callback=None):
+    def __init__(self, language="tr", use_whisper=True, callback=None,
+                 streaming=False, partial_interval=1.0,
+                 command_fast_path=True, command_model="tiny", command_max_duration=2.0,
+                 commands_file=DEFAULT_COMMANDS_FILE, corrections_file=DEFAULT_CORRECTIONS_FILE,
+                 whisper_engine="openai", whisper_model="base",
+                 audio_source=None, decoder_workers=1, max_queue_size=32,
+                 max_batch_size=8, max_batch_wait=0.05,
+                 noise_profile_file=DEFAULT_PROFILE_FILE,
+                 noise_suppression=False, noise_suppression_method="wiener"):
         self.recognizer = sr.Recognizer()
         self.language = language  # Türkçe
         self.use_whisper = use_whisper
         self.callback = callback
         
-        # Whisper modeli - Türkçe için optimize edilmiş ayarlar
+        # Whisper motoru - "base" model daha iyi doğruluk sağlar
+        self.engine = None
+        # Çözücü ve ara tanıma iş parçacıkları motoru paylaşır; whisper.cpp
+        # bağlamı ve PyTorch modeli eşzamanlı çağrılara karşı güvenli değil
+        self.engine_lock = threading.Lock()
         if use_whisper:
-            try:
-                # "base" model daha iyi doğruluk sağlar
-                self.whisper_model = whisper.load_model("base")
-                print("Whisper 'base' modeli yüklendi")
-            except Exception as e:
-                print(f"Whisper 'base' modeli yüklenemedi, 'tiny' modeli deneniyor: {e}")
-                self.whisper_model = whisper.load_model("tiny")
+            self.engine = create_engine(whisper_engine, whisper_model)
+        
+        # Ses kaynağı: varsayılan olarak canlı mikrofon
+        self.audio_source = audio_source or MicrophoneSource()
         
         # Ses tanıma ayarları
         self.is_listening = False
         self.thread = None
-        self.audio_queue = queue.Queue()
-        self.temp_dir = tempfile.gettempdir()
+        
+        # Dinleyici segmentleri sınırlı kuyruğa koyar, sabit sayıda çözücü işler
+        self.audio_queue = queue.Queue(maxsize=max_queue_size)
+        self.decoder_workers = decoder_workers
+        self.decoder_threads = []
+        self.segments_queued = 0
+        self.segments_decoded = 0
+        
+        # Gerçek zaman faktörü (RTF) için toplam çözümleme ve ses süresi
+        self.decode_seconds = 0.0
+        self.decoded_audio_seconds = 0.0
+        # Çözücü iş parçacıklarının güncellediği sayaçlar bu kilitle korunur
+        self._stats_lock = threading.Lock()
+        
+        # Toplu çözümleme: yoğun konuşmada bekleyen segmentler birlikte çözülür
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait    # Grup dolana kadar en fazla bekleme (saniye)
         
         # Geliştirilmiş ses algılama parametreleri
         self.silence_threshold = 0.8  # Daha kısa bekleme
@@ -37,38 +334,132 @@ class SpeechRecognizer:
         self.pause_threshold = 0.6    # Kelimeler arası duraklama
         self.phrase_time_limit = 8    # Maksimum cümle süresi
         
+        # Gürültü profili: cihaz başına saklanır, dinlerken sürekli iyileştirilir
+        self.noise_store = NoiseProfileStore(noise_profile_file) if noise_profile_file else None
+        self.noise_estimator = NoiseFloorEstimator(ratio=self.recognizer.dynamic_energy_ratio)
+        self.calibration_duration = 0.5   # Profil yoksa yapılan kısa kalibrasyon
+        self.profile_save_interval = 30   # Profilin kaydedilme aralığı (saniye)
+        self._last_profile_save = 0
+        
+        # Whisper öncesi isteğe bağlı spektral gürültü bastırma
+        self.noise_suppressor = None
+        if noise_suppression:
+            self.noise_suppressor = SpectralGate(sample_rate=WHISPER_SAMPLE_RATE,
+                                                 method=noise_suppression_method)
+        self.denoise_cpu_seconds = 0.0    # Gürültü bastırmanın toplam CPU süresi
+        
+        # Akış modu: uzun cümlelerde ara (geçici) metin gösterimi
+        self.streaming = streaming and use_whisper
+        self.partial_interval = partial_interval  # Ara çözümleme aralığı (saniye)
+        self.pre_roll_duration = 0.3              # Konuşma öncesi tutulan ses
+        self._partial_queue = queue.Queue(maxsize=1)
+        self._partial_thread = None
+        self._segment_id = 0
+        self._agreement = LocalAgreement()
+        
         # Türkçe kelime filtreleme - daha kapsamlı liste
-        self.turkish_filter_words = [
-            'ne', 'nah', 'ah', 'eh', 'mm', 'hmm', 'uh', 'oh', 'hı', 'hım',
-            'aaa', 'eee', 'iii', 'ooo', 'uuu', 'şşş', 'tss', 'pff'
-        ]
+        self.turkish_filter_words = DEFAULT_FILTER_WORDS
         
         # Minimum kelime uzunluğu
         self.min_word_length = 2
         self.min_sentence_length = 3
         
-        # Komut listesi
+        # Metin son işleme hattı: düzenli ifadeler ve sözlükler bir kez derlenir
+        self.text_processor = TextPostProcessor(
+            filter_words=self.turkish_filter_words,
+            min_word_length=self.min_word_length,
+            min_sentence_length=self.min_sentence_length,
+            corrections=self._load_corrections(corrections_file)
+        )
+        
+        # Komut listesi (yalnızca arayüzün uygulayabildiği eylemler)
         self.commands = {
             "temizle": "clear",
             "sil": "clear", 
-            "başlat": "start",
-            "durdur": "stop",
-            "bitir": "stop",
             "kaydet": "save",
             "göz takibini başlat": "start_eye",
             "göz takibini durdur": "stop_eye", 
             "ses tanımayı başlat": "start_speech",
-            "ses tanımayı durdur": "stop_speech",
-            "kapat": "quit",
-            "çık": "quit"
+            "ses tanımayı durdur": "stop_speech"
         }
         
+        # Derlenmiş komut eşleştirici (dosya yoksa yerleşik liste kullanılır)
+        self.command_matcher = self._load_command_matcher(commands_file)
+        
+        # Kısa segmentler için hızlı komut yolu (dikte modelinden önce çalışır)
+        self.command_spotter = None
+        if use_whisper and command_fast_path:
+            try:
+                # Aynı boyutta model zaten yüklüyse tekrar yükleme
+                if command_model == self.engine.model_name:
+                    command_engine = self.engine
+                    command_lock = self.engine_lock
+                else:
+                    command_engine = ENGINES[self.engine.name](command_model)
+                    command_lock = None
+                    print(f"Komut modeli '{command_model}' yüklendi")
+                self.command_spotter = CommandSpotter(
+                    self.command_matcher,
+                    command_engine,
+                    language=language,
+                    max_duration=command_max_duration,
+                    engine_lock=command_lock
+                )
+            except Exception as e:
+                print(f"Komut modeli yüklenemedi, hızlı komut yolu kapalı: {e}")
+        
+    def apply_settings(self, settings):
+        """[speech_recognition] ayarlarını çalışırken uygula
+
+        Model, motor ve dosya ayarları yeniden başlatma gerektirir ve burada
+        yok sayılır. Akış modunda duraklama ve cümle süresi sınırı bir
+        sonraki dinleme başlangıcında geçerli olur.
+        """
+        if 'language' in settings:
+            self.language = settings['language']
+            if self.command_spotter:
+                self.command_spotter.language = self.language
+        if 'energy_threshold' in settings:
+            self.energy_threshold = settings['energy_threshold']
+            if self.is_listening:
+                # Dinleme sürerken yeni eşik uyarlamanın başlangıç noktası olur
+                self.recognizer.energy_threshold = self.energy_threshold
+                self.noise_estimator.noise_floor = self.energy_threshold / self.noise_estimator.ratio
+        if 'pause_threshold' in settings:
+            self.pause_threshold = settings['pause_threshold']
+            self.recognizer.pause_threshold = self.pause_threshold
+        for name in ('phrase_time_limit', 'partial_interval', 'max_batch_size', 'max_batch_wait'):
+            if name in settings:
+                setattr(self, name, settings[name])
+        if 'command_max_duration' in settings and self.command_spotter:
+            self.command_spotter.max_duration = settings['command_max_duration']
+        for name in ('min_word_length', 'min_sentence_length'):
+            if name in settings:
+                setattr(self, name, settings[name])
+                setattr(self.text_processor, name, settings[name])
+        if 'noise_suppression' in settings or 'noise_suppression_method' in settings:
+            enabled = settings.get('noise_suppression', self.noise_suppressor is not None)
+            method = settings.get('noise_suppression_method',
+                                  self.noise_suppressor.method if self.noise_suppressor else "wiener")
+            if not enabled:
+                self.noise_suppressor = None
+            elif self.noise_suppressor is None or self.noise_suppressor.method != method:
+                # Yeni bastırıcı hazır olunca tek atamayla değiştirilir
+                self.noise_suppressor = SpectralGate(sample_rate=WHISPER_SAMPLE_RATE, method=method)
+    
     def start(self):
         if self.is_listening:
             return
             
         self.is_listening = True
-        self.thread = threading.Thread(target=self._listen_and_recognize)
+        
+        for index in range(self.decoder_workers):
+            worker = threading.Thread(target=self._decoder_worker, name=f"speech-decoder-{index}")
+            worker.daemon = True
+            worker.start()
+            self.decoder_threads.append(worker)
+        
+        self.thread = threading.Thread(target=self._listen_and_recognize, name="speech-listener")
         self.thread.daemon = True
         self.thread.start()
         print("Ses tanıma başlatıldı")
@@ -77,23 +468,109 @@ class SpeechRecognizer:
         self.is_listening = False
         if self.thread:
             self.thread.join()
+        if self._partial_thread:
+            self._partial_thread.join()
+            self._partial_thread = None
+        
+        # Bekleyen segmentleri bırak, çözücülere durma işareti gönder
+        while True:
+            try:
+                self.audio_queue.get_nowait()
+                self.audio_queue.task_done()
+            except queue.Empty:
+                break
+        for _ in self.decoder_threads:
+            self.audio_queue.put(None)
+        for worker in self.decoder_threads:
+            worker.join()
+        self.decoder_threads = []
         print("Ses tanıma durduruldu")
     
+    def wait_until_done(self):
+        """Sonlu bir kaynak bitene ve kuyruktaki tüm segmentler çözülene kadar bekle"""
+        if self.thread:
+            self.thread.join()
+        self.audio_queue.join()
+    
+    def _enqueue_audio(self, audio):
+        """Segmenti çözücü kuyruğuna koy; kuyruk doluysa yer açılmasını bekle"""
+        while self.is_listening:
+            try:
+                # Kuyruk öğesi: (cümle kimliği, ses); iz kaydında cümleleri eşler
+                self.audio_queue.put((self.segments_queued + 1, audio), timeout=0.2)
+                self.segments_queued += 1
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _decoder_worker(self):
+        """Kuyruktaki segmentleri gruplar halinde çözümle"""
+        running = True
+        while running:
+            batch = self._collect_batch()
+            try:
+                if None in batch:
+                    running = False
+                    batch = [item for item in batch if item is not None]
+                if batch:
+                    set_trace_args(utterances=[utterance_id for utterance_id, _ in batch])
+                    with stage("speech.utterance_batch"):
+                        self._process_batch([audio for _, audio in batch])
+                    with self._stats_lock:
+                        self.segments_decoded += len(batch)
+            finally:
+                for _ in range(len(batch) + (0 if running else 1)):
+                    self.audio_queue.task_done()
+    
+    def _collect_batch(self):
+        """Bir segment bekle, ardından kuyrukta birikenleri gruba ekle
+
+        Tek segment varsa hemen döner (seyrek konuşmada ek gecikme yok); birden
+        fazla segment birikmişse grup dolana veya max_batch_wait dolana kadar
+        gelenler de eklenir.
+        """
+        batch = [self.audio_queue.get()]
+        if batch[0] is None:
+            return batch
+        
+        deadline = None
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self.audio_queue.get_nowait())
+            except queue.Empty:
+                if len(batch) == 1 or not self.max_batch_wait:
+                    break
+                if deadline is None:
+                    deadline = time.time() + self.max_batch_wait
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.audio_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                break
+        return batch
+    
     def _listen_and_recognize(self):
         """Geliştirilmiş ses dinleme ve tanıma fonksiyonu"""
         try:
-            with sr.Microphone() as source:
-                # Ortam gürültüsüne göre kalibre et
-                print("Ortam gürültüsü kalibre ediliyor...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=2)
-                
+            with self.audio_source as source:
                 # Ses tanıma parametrelerini ayarla
                 self.recognizer.dynamic_energy_threshold = True
-                self.recognizer.energy_threshold = self.energy_threshold
                 self.recognizer.pause_threshold = self.pause_threshold
                 
+                # Kayıtlı gürültü profilini uygula (yoksa kısa kalibrasyon)
+                self._apply_noise_profile(source)
+                
                 print("Dinleme başladı... (Konuşabilirsiniz)")
                 
+                if self.streaming:
+                    self._listen_streaming(source)
+                    return
+                
                 while self.is_listening:
                     try:
                         # Konuşma dinle
@@ -103,15 +580,21 @@ class SpeechRecognizer:
                             phrase_time_limit=self.phrase_time_limit
                         )
                         
-                        # Ses işleme thread'ini başlat
-                        processing_thread = threading.Thread(
-                            target=self._process_audio, 
-                            args=(audio,)
-                        )
-                        processing_thread.daemon = True
-                        processing_thread.start()
+                        if audio.frame_data:
+                            # listen() konuşmadan önceki sessiz parçaları da döndürür
+                            self.learn_noise(audio, self.recognizer.non_speaking_duration)
+                            self._enqueue_audio(audio)
+                        
+                        # Dinleme sırasında uyarlanan eşiği profile yaz
+                        self._save_noise_profile()
+                        
+                        # Dosya/üreteç kaynağı bittiyse dinlemeyi sonlandır
+                        if self.audio_source.exhausted:
+                            print("Ses kaynağı sona erdi")
+                            break
                         
                     except sr.WaitTimeoutError:
+                        self._save_noise_profile()
                         continue
                     except Exception as e:
                         print(f"Dinleme hatası: {e}")
@@ -119,74 +602,348 @@ class SpeechRecognizer:
                         continue
                         
         except Exception as e:
-            print(f"Mikrofon başlatma hatası: {e}")
+            print(f"Ses kaynağı başlatma hatası ({self.audio_source}): {e}")
+        finally:
+            self._save_noise_profile(force=True)
     
-    def _process_audio(self, audio):
-        """Ses verisini işle ve metne çevir"""
-        try:
-            text = ""
+    def _apply_noise_profile(self, source):
+        """Kayıtlı gürültü profilini uygula; yoksa kısa bir kalibrasyon yap"""
+        self.recognizer.energy_threshold = self.energy_threshold
+        if not self.audio_source.live:
+            return
+        
+        profile = self.noise_store.load(self.audio_source.device_key) if self.noise_store else None
+        if profile:
+            self.recognizer.energy_threshold = profile['energy_threshold']
+            self.noise_estimator.noise_floor = profile.get('noise_floor') or \
+                profile['energy_threshold'] / self.noise_estimator.ratio
+            print(f"Kayıtlı gürültü profili kullanılıyor (eşik: {self.recognizer.energy_threshold:.0f})")
+            return
+        
+        print("Ortam gürültüsü kalibre ediliyor...")
+        self.recognizer.adjust_for_ambient_noise(source, duration=self.calibration_duration)
+        self.noise_estimator.noise_floor = self.recognizer.energy_threshold / self.noise_estimator.ratio
+        self._save_noise_profile(force=True)
+    
+    def _save_noise_profile(self, force=False):
+        """Güncel enerji eşiğini cihaz profiline yaz (belirli aralıklarla)"""
+        if not self.noise_store or not self.audio_source.live:
+            return
+        now = time.time()
+        if not force and now - self._last_profile_save < self.profile_save_interval:
+            return
+        self._last_profile_save = now
+        
+        # Akış modu dışında eşiği speech_recognition uyarlar, taban ondan türetilir
+        if not self.streaming:
+            self.noise_estimator.noise_floor = self.recognizer.energy_threshold / self.noise_estimator.ratio
+        self.noise_store.save(
+            self.audio_source.device_key,
+            self.recognizer.energy_threshold,
+            self.noise_estimator.noise_floor
+        )
+    
+    def _listen_streaming(self, source):
+        """Sesi parça parça oku, konuşma sürerken büyüyen pencereyi çözümle"""
+        self._partial_thread = threading.Thread(target=self._partial_worker, name="speech-partial")
+        self._partial_thread.daemon = True
+        self._partial_thread.start()
+        
+        seconds_per_chunk = source.CHUNK / source.SAMPLE_RATE
+        pause_chunks = max(1, int(np.ceil(self.pause_threshold / seconds_per_chunk)))
+        max_chunks = int(np.ceil(self.phrase_time_limit / seconds_per_chunk))
+        pre_roll_chunks = max(1, int(np.ceil(self.pre_roll_duration / seconds_per_chunk)))
+        
+        noise_chunks = max(1, int(np.ceil(0.5 / seconds_per_chunk)))
+        
+        pre_roll = []
+        frames = []
+        noise = []
+        silent_chunks = 0
+        last_partial_time = 0
+        
+        while self.is_listening:
+            try:
+                buffer = source.stream.read(source.CHUNK)
+            except Exception as e:
+                print(f"Dinleme hatası: {e}")
+                time.sleep(0.1)
+                continue
+            if not buffer:
+                break
+            
+            samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32)
+            energy = np.sqrt(np.mean(samples * samples)) if samples.size else 0.0
+            speaking = energy > self.recognizer.energy_threshold
+            
+            if not frames and not speaking:
+                # Konuşma olmayan parçalarla gürültü tabanını güncelle
+                self.noise_estimator.update(energy)
+                if self.recognizer.dynamic_energy_threshold:
+                    self.recognizer.energy_threshold = self.noise_estimator.energy_threshold
+                self._save_noise_profile()
+                
+                # Gürültü bastırma profili de yalnızca bu parçalardan öğrenilir
+                noise.append(buffer)
+                if len(noise) >= noise_chunks:
+                    self.learn_noise(sr.AudioData(b''.join(noise), source.SAMPLE_RATE, source.SAMPLE_WIDTH))
+                    noise = []
+            
+            if not frames:
+                # Konuşma başlangıcını bekle, kısa bir ön kayıt tut
+                pre_roll.append(buffer)
+                if len(pre_roll) > pre_roll_chunks:
+                    pre_roll.pop(0)
+                if speaking:
+                    frames = pre_roll
+                    pre_roll = []
+                    silent_chunks = 0
+                    last_partial_time = time.time()
+                continue
+            
+            frames.append(buffer)
+            silent_chunks = 0 if speaking else silent_chunks + 1
+            
+            if silent_chunks >= pause_chunks or len(frames) >= max_chunks:
+                # Segment bitti: tam çözümleme geçici metnin yerini alır
+                audio = sr.AudioData(b''.join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+                frames = []
+                self._segment_id += 1
+                self._enqueue_audio(audio)
+                continue
             
-            if self.use_whisper:
-                # Whisper ile tanıma
-                text = self._whisper_recognize(audio)
-            else:
-                # Google Speech Recognition ile tanıma
-                text = self._google_recognize(audio)
+            now = time.time()
+            if now - last_partial_time >= self.partial_interval:
+                last_partial_time = now
+                audio = sr.AudioData(b''.join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+                try:
+                    # Çözücü meşgulse bu pencere atlanır, bir sonraki daha uzun olur
+                    self._partial_queue.put_nowait((self._segment_id, audio))
+                except queue.Full:
+                    pass
+        
+        # Kaynak bittiğinde yarım kalan segmenti de çözümle
+        if frames:
+            self._segment_id += 1
+            self._enqueue_audio(sr.AudioData(b''.join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH))
+    
+    def _partial_worker(self):
+        """Ara hipotezleri çözümle ve kararlı öneki kesinleştir"""
+        current_segment = None
+        
+        while self.is_listening:
+            try:
+                segment_id, audio = self._partial_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            
+            # Eski segmentlere ait istekleri at
+            if segment_id != self._segment_id:
+                continue
+            if segment_id != current_segment:
+                current_segment = segment_id
+                self._agreement.reset()
+                set_trace_args(segment=segment_id)
             
-            if text:
-                # Metni temizle ve filtrele
-                cleaned_text = self._clean_text(text)
+            try:
+                with stage("speech.partial_decode"):
+                    text = self._whisper_transcribe(self._audio_to_array(audio))
+                with stage("speech.text_postprocess"):
+                    text = self.text_processor.process(text)
+                if not text:
+                    continue
                 
-                # Türkçe tanıma iyileştirmeleri uygula
-                improved_text = self.improve_turkish_recognition(cleaned_text)
+                committed, full = self._agreement.update(text)
                 
-                if improved_text and len(improved_text.strip()) > 1:
-                    print(f"Tanınan metin: '{improved_text}'")
-                    
-                    # Komut kontrolü
-                    if self._process_commands(improved_text):
-                        return
+                # Çözümleme sürerken segment bittiyse sonucu gösterme
+                if segment_id != self._segment_id:
+                    continue
+                
+                if self.callback:
+                    self.callback(full, is_partial=True, stable_text=committed)
                     
-                    # Callback'i çağır
-                    if self.callback:
-                        self.callback(improved_text)
-                        
+            except Exception as e:
+                print(f"Ara tanıma hatası: {e}")
+    
+    def learn_noise(self, audio, duration=None):
+        """Konuşma içermeyen sesle gürültü bastırma profilini güncelle
+        
+        duration verilirse AudioData'nın yalnızca baştaki (konuşma öncesi)
+        bu kadar saniyesi kullanılır.
+        """
+        noise_suppressor = self.noise_suppressor
+        if noise_suppressor is None:
+            return
+        raw = audio.frame_data
+        if duration is not None:
+            raw = raw[:int(duration * audio.sample_rate) * audio.sample_width]
+        if not raw:
+            return
+        noise = sr.AudioData(raw, audio.sample_rate, audio.sample_width)
+        pcm = noise.get_raw_data(convert_rate=WHISPER_SAMPLE_RATE, convert_width=2)
+        noise_suppressor.learn_noise(np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0)
+    
+    def _audio_to_array(self, audio):
+        """AudioData'yı Whisper için 16 kHz float32 diziye çevir"""
+        raw = audio.get_raw_data(convert_rate=WHISPER_SAMPLE_RATE, convert_width=2)
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        # Ayar canlı değişebilir; bastırıcı bir kez okunur
+        noise_suppressor = self.noise_suppressor
+        if noise_suppressor is not None:
+            samples = self._denoise(noise_suppressor, samples)
+        return samples
+    
+    def _denoise(self, noise_suppressor, samples):
+        """Gürültü bastırma uygula ve (bu iş parçacığının) CPU maliyetini say"""
+        start = time.thread_time()
+        try:
+            return noise_suppressor.process(samples)
+        except Exception as e:
+            print(f"Gürültü bastırma hatası: {e}")
+            return samples
+        finally:
+            elapsed = time.thread_time() - start
+            with self._stats_lock:
+                self.denoise_cpu_seconds += elapsed
+    
+    def _process_audio(self, audio):
+        """Ses verisini işle ve metne çevir"""
+        self._process_batch([audio])
+    
+    def _process_batch(self, audios):
+        """Segment grubunu çözümle ve sonuçları sırayla ilet"""
+        try:
+            results = self.recognize_batch(audios)
         except Exception as e:
             print(f"Ses işleme hatası: {e}")
+            results = [None] * len(audios)
+        
+        for result in results:
+            self._deliver_result(result)
     
-    def _whisper_recognize(self, audio):
-        """Whisper ile ses tanıma"""
+    def _deliver_result(self, result):
+        """Tanıma sonucunu komut veya metin olarak callback'e ilet"""
+        delivered = False
         try:
-            # Geçici dosya oluştur
-            temp_file = os.path.join(self.temp_dir, f"audio_{time.time()}.wav")
+            if result is None:
+                return
             
-            with open(temp_file, "wb") as f:
-                f.write(audio.get_wav_data())
+            # Komut kontrolü
+            if result['command']:
+                self._dispatch_command(result['text'], result['command'])
+                return
             
-            # Whisper ile tanıma - Türkçe optimize edilmiş parametreler
-            result = self.whisper_model.transcribe(
-                temp_file, 
-                language=self.language,
-                fp16=False,  # macOS uyumluluğu için
-                temperature=0.0,  # Daha tutarlı sonuçlar için
-                condition_on_previous_text=False,  # Her tanıma bağımsız
-                no_speech_threshold=0.4,  # Sessizlik algılama
-                logprob_threshold=-1.0,
-                compression_ratio_threshold=2.4
-            )
+            if result['text']:
+                print(f"Tanınan metin: '{result['text']}'")
+                
+                # Callback'i çağır
+                if self.callback:
+                    self.callback(result['text'])
+                    delivered = True
+                        
+        except Exception as e:
+            print(f"Ses işleme hatası: {e}")
+        finally:
+            # Akış modunda metin üretilmediyse geçici metni kaldır
+            if self.streaming and not delivered and self.callback:
+                self.callback("", is_partial=True, stable_text="")
+    
+    def recognize(self, audio):
+        """Ses verisini tüm işlem hattından geçir ve sonucu döndür
+
+        Callback çağrılmaz; çevrimdışı değerlendirme araçları da bu yolu kullanır.
+        Dönen sözlük: raw_text (motor çıktısı), text (temizlenmiş metin),
+        command (CommandMatch veya None), fast_path (hızlı komut yolu kullanıldı mı)
+        """
+        return self.recognize_batch([audio])[0]
+    
+    def recognize_batch(self, audios):
+        """Segment listesini tanı; dikte segmentleri motorda toplu çözülür"""
+        results = [{'raw_text': "", 'text': "", 'command': None, 'fast_path': False}
+                   for _ in audios]
+        texts = [""] * len(audios)
+        
+        if self.use_whisper:
+            pending = []
+            for index, audio in enumerate(audios):
+                samples = self._audio_to_array(audio)
+                
+                # Önce hızlı komut yolu: kısa segment komutsa dikte modeli çalışmaz
+                if self.command_spotter:
+                    with stage("speech.command_spot"):
+                        spotted = self._spot_command(samples)
+                    if spotted:
+                        text, command_match = spotted
+                        results[index].update(raw_text=text, text=text,
+                                              command=command_match, fast_path=True)
+                        continue
+                pending.append((index, samples))
             
-            text = result["text"].strip()
+            # Whisper ile tanıma
+            if pending:
+                decode_start = time.perf_counter()
+                with stage("speech.whisper_decode"):
+                    decoded = self._whisper_recognize_batch([samples for _, samples in pending])
+                elapsed = time.perf_counter() - decode_start
+                audio_seconds = sum(len(samples) for _, samples in pending) / WHISPER_SAMPLE_RATE
+                with self._stats_lock:
+                    self.decode_seconds += elapsed
+                    self.decoded_audio_seconds += audio_seconds
+                for (index, _), text in zip(pending, decoded):
+                    texts[index] = text
+        else:
+            # Google Speech Recognition ile tanıma
+            texts = [self._google_recognize(audio) for audio in audios]
+        
+        # Metni temizle, filtrele ve Türkçe düzeltmeleri uygula (tek geçişte)
+        pending = [(result, text) for result, text in zip(results, texts)
+                   if not result['fast_path'] and text]
+        with stage("speech.text_postprocess"):
+            processed = self.text_processor.process_batch([text for _, text in pending])
+        
+        for (result, text), improved_text in zip(pending, processed):
+            result['raw_text'] = text
             
-            # Geçici dosyayı sil
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-                
-            return text
+            if improved_text and len(improved_text.strip()) > 1:
+                result['text'] = improved_text
+                result['command'] = self.command_matcher.match(improved_text)
+        return results
+    
+    def _spot_command(self, samples):
+        """Hızlı komut yolunu dene, (metin, CommandMatch) veya None döndür"""
+        try:
+            return self.command_spotter.spot(samples)
+        except Exception as e:
+            print(f"Hızlı komut yolu hatası: {e}")
+            return None
+    
+    def _whisper_recognize(self, samples):
+        """Whisper ile ses tanıma"""
+        try:
+            return self._whisper_transcribe(samples)
             
         except Exception as e:
             print(f"Whisper tanıma hatası: {e}")
             return ""
     
+    def _whisper_recognize_batch(self, samples_list):
+        """Whisper ile toplu ses tanıma"""
+        if len(samples_list) == 1:
+            return [self._whisper_recognize(samples_list[0])]
+        try:
+            with self.engine_lock:
+                decoded = self.engine.transcribe_batch(samples_list, self.language)
+            return [text for text, _ in decoded]
+        except Exception as e:
+            print(f"Whisper toplu tanıma hatası, tek tek çözülüyor: {e}")
+            return [self._whisper_recognize(samples) for samples in samples_list]
+    
+    def _whisper_transcribe(self, samples):
+        """16 kHz float32 ses dizisini Whisper motoruyla metne çevir"""
+        with self.engine_lock:
+            text, _ = self.engine.transcribe(samples, self.language)
+        return text
+    
     def _google_recognize(self, audio):
         """Google Speech Recognition ile ses tanıma"""
         try:
@@ -206,68 +963,59 @@ class SpeechRecognizer:
     
     def _clean_text(self, text):
         """Metni temizle ve filtrele"""
-        if not text:
-            return ""
-            
-        # Küçük harfe çevir
-        text = text.lower().strip()
-        
-        # Gereksiz karakterleri temizle
-        import re
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Çok uzun tekrarları kısalt
-        text = re.sub(r'(.)\1{10,}', r'\1\1\1', text)  # 10'dan fazla tekrar varsa 3'e düşür
-        
-        # Türkçe filtreleme kelimelerini kontrol et
-        words = text.split()
-        filtered_words = []
-        
-        for word in words:
-            # Çok kısa kelimeleri filtrele
-            if len(word) < self.min_word_length:
-                continue
-                
-            # Filtreleme listesindeki kelimeleri atla
-            if word in self.turkish_filter_words:
-                continue
-                
-            # Aynı karakterin çok tekrarını filtrele (örn: "hıhıhıhı...")
-            if len(set(word)) == 1 and len(word) > 3:
-                continue
-                
-            filtered_words.append(word)
-        
-        result = ' '.join(filtered_words)
-        
-        # Minimum cümle uzunluğu kontrolü
-        if len(result) < self.min_sentence_length:
-            return ""
-            
-        return result
+        return self.text_processor.clean(text)
+    
+    def _load_corrections(self, corrections_file):
+        """Düzeltme sözlüğünü yükle, yoksa boş sözlük"""
+        if corrections_file and os.path.exists(corrections_file):
+            try:
+                corrections = load_corrections(corrections_file)
+                print(f"{len(corrections)} düzeltme yüklendi: {corrections_file}")
+                return corrections
+            except Exception as e:
+                print(f"Düzeltme dosyası okunamadı ({corrections_file}): {e}")
+        return {}
+    
+    def _load_command_matcher(self, commands_file):
+        """Komut dosyasını derle"""
+        if commands_file and os.path.exists(commands_file):
+            try:
+                matcher = CommandMatcher.from_file(commands_file)
+                print(f"{len(matcher.commands)} komut yüklendi: {commands_file}")
+                return matcher
+            except Exception as e:
+                print(f"Komut dosyası yüklenemedi, yerleşik komutlar kullanılıyor: {e}")
+        return CommandMatcher(self.commands)
     
     def _process_commands(self, text):
         """Komutları işle"""
-        text_lower = text.lower()
+        command_match = self.command_matcher.match(text)
+        if command_match is None:
+            return False
         
-        for command_text, command_action in self.commands.items():
-            if command_text in text_lower:
-                print(f"Komut algılandı: {command_text} -> {command_action}")
-                
-                if self.callback:
-                    self.callback(text, is_command=True, command=command_action)
-                return True
-                
-        return False
+        self._dispatch_command(text, command_match)
+        return True
+    
+    def _dispatch_command(self, text, command_match):
+        """Algılanan komutu (makrolarda her eylemi sırayla) callback'e ilet"""
+        actions = ', '.join(command_match.actions)
+        if command_match.exact:
+            print(f"Komut algılandı: {command_match.phrase} -> {actions}")
+        else:
+            print(f"Komut algılandı (yaklaşık, mesafe {command_match.distance}): "
+                  f"{command_match.phrase} -> {actions}")
+        
+        if self.callback:
+            for command_action in command_match.actions:
+                self.callback(text, is_command=True, command=command_action)
     
     def test_microphone(self):
-        """Mikrofonu test et"""
+        """Mikrofonu (veya seçili ses kaynağını) test et"""
         print("Mikrofon testi başlatılıyor...")
         try:
-            with sr.Microphone() as source:
-                print("Mikrofon bulundu:", source)
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            with self.audio_source as source:
+                print("Ses kaynağı bulundu:", self.audio_source)
+                self._apply_noise_profile(source)
                 print(f"Ortam gürültü seviyesi: {self.recognizer.energy_threshold}")
                 
                 print("3 saniye konuşun...")
@@ -283,21 +1031,32 @@ class SpeechRecognizer:
                 
                 if self.use_whisper:
                     try:
-                        temp_file = os.path.join(self.temp_dir, f"test_audio_{time.time()}.wav")
-                        with open(temp_file, "wb") as f:
-                            f.write(audio.get_wav_data())
-                        
-                        result = self.whisper_model.transcribe(temp_file, language="tr")
-                        print(f"Whisper tanıma sonucu: '{result['text']}'")
-                        
-                        if os.path.exists(temp_file):
-                            os.remove(temp_file)
+                        text = self._whisper_transcribe(self._audio_to_array(audio))
+                        print(f"Whisper tanıma sonucu: '{text}'")
                     except Exception as e:
                         print(f"Whisper tanıma hatası: {e}")
                         
         except Exception as e:
             print(f"Mikrofon test hatası: {e}")
     
+    @property
+    def decode_rtf(self):
+        """Çözümleme süresi / ses süresi (1'in altı gerçek zamandan hızlı)"""
+        if not self.decoded_audio_seconds:
+            return 0.0
+        return self.decode_seconds / self.decoded_audio_seconds
+    
+    def memory_usage(self):
+        """Ses tanımanın bilinen bellek kullanımı (bayt): modeller ve kuyruktaki ses"""
+        engines = {id(engine): engine for engine in
+                   (self.engine, self.command_spotter.engine if self.command_spotter else None)
+                   if engine is not None}
+        # faster-whisper ve whisper.cpp ağırlıkları Python dışında tutulur, boyutları bilinmez
+        model_bytes = sum(engine.memory_bytes() or 0 for engine in engines.values())
+        with self.audio_queue.mutex:
+            queued = list(self.audio_queue.queue)
+        return model_bytes + sum(len(item[1].frame_data) for item in queued if item is not None)
+    
     def get_available_microphones(self):
         """Mevcut mikrofonları listele"""
         print("Mevcut ses cihazları:")
@@ -307,56 +1066,14 @@ class SpeechRecognizer:
     
     def improve_turkish_recognition(self, text):
         """Türkçe tanıma sonuçlarını iyileştir"""
-        if not text:
-            return text
-            
-        # Türkçe karakter düzeltmeleri
-        corrections = {
-            'i': 'ı', 'I': 'İ',
-            'g': 'ğ', 'G': 'Ğ',
-            'u': 'ü', 'U': 'Ü',
-            'o': 'ö', 'O': 'Ö',
-            's': 'ş', 'S': 'Ş',
-            'c': 'ç', 'C': 'Ç'
-        }
-        
-        # Yaygın Türkçe kelime düzeltmeleri
-        word_corrections = {
-            'ben': 'ben',
-            'sen': 'sen',
-            'o': 'o',
-            'biz': 'biz',
-            'siz': 'siz',
-            'onlar': 'onlar',
-            've': 've',
-            'ile': 'ile',
-            'bir': 'bir',
-            'bu': 'bu',
-            'şu': 'şu',
-            'merhaba': 'merhaba',
-            'selam': 'selam',
-            'tamam': 'tamam',
-            'evet': 'evet',
-            'hayır': 'hayır',
-            'başlat': 'başlat',
-            'durdur': 'durdur',
-            'temizle': 'temizle'
-        }
-        
-        words = text.split()
-        corrected_words = []
-        
-        for word in words:
-            # Kelime düzeltmelerini uygula
-            corrected_word = word_corrections.get(word.lower(), word)
-            corrected_words.append(corrected_word)
-        
-        return ' '.join(corrected_words)
+        return self.text_processor.correct(text)
     
     def set_microphone_by_index(self, mic_index):
         """Belirli bir mikrofonu seç"""
         try:
-            self.microphone = sr.Microphone(device_index=mic_index)
+            # Geçersiz indeks burada hata verir
+            sr.Microphone(device_index=mic_index)
+            self.audio_source = MicrophoneSource(device_index=mic_index)
             print(f"Mikrofon {mic_index} seçildi")
             return True
         except Exception as e:
@@ -0,0 +1,116 @@
+"""
+VisionCursor Metin Son İşleme
+
+Tanınan metni bir kez derlenen aşamalardan geçirir:
+1. Türkçe kurallarına uygun küçük harfe çevirme
+2. Noktalama temizliği ve boşluk sadeleştirme
+3. Tekrar kısaltma (uzun karakter tekrarları, art arda aynı kelimeler)
+4. Dolgu kelimesi ve çok kısa kelime filtreleme
+5. Düzeltme sözlüğü
+
+Düzenli ifadeler ve kümeler oluşturulurken bir kez derlenir. Tek metin ya da
+metin listesi (çevrimdışı/toplu kullanım) işlenebilir.
+"""
+
+import configparser
+import re
+
+# Türkçe büyük/küçük harf dönüşümünde özel durumlar
+_TURKISH_LOWER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+# Whisper'ın sık ürettiği dolgu ve anlamsız kelimeler
+DEFAULT_FILTER_WORDS = frozenset([
+    'ne', 'nah', 'ah', 'eh', 'mm', 'hmm', 'uh', 'oh', 'hı', 'hım',
+    'aaa', 'eee', 'iii', 'ooo', 'uuu', 'şşş', 'tss', 'pff'
+])
+
+
+def turkish_lower(text):
+    """Türkçe kurallarına uygun küçük harfe çevir"""
+    return text.translate(_TURKISH_LOWER).lower()
+
+
+def normalize_words(text):
+    """Metni noktalama işaretlerinden arındırılmış kelime listesine çevir"""
+    text = turkish_lower(text)
+    return ''.join(ch if ch.isalnum() or ch.isspace() else ' ' for ch in text).split()
+
+
+def load_corrections(path):
+    """INI dosyasının [corrections] bölümünden 'hatalı = doğru' sözlüğünü oku"""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = turkish_lower
+    with open(path, encoding='utf-8') as f:
+        parser.read_file(f)
+    if not parser.has_section('corrections'):
+        return {}
+    return {wrong: turkish_lower(right.strip()) for wrong, right in parser.items('corrections')}
+
+
+class TextPostProcessor:
+    """Derlenmiş metin son işleme hattı"""
+
+    # Satır sonu toplu işlemede metin ayırıcı olarak korunur
+    _PUNCTUATION = re.compile(r'[^\w\s]')
+    _WHITESPACE = re.compile(r'[^\S\n]+')
+    _CHAR_REPEAT = re.compile(r'(.)\1{10,}')          # 10'dan fazla tekrar varsa 3'e düşür
+    _WORD_REPEAT = re.compile(r'\b(\w+)(?: \1\b){2,}')  # 3+ kez art arda aynı kelime
+
+    def __init__(self, filter_words=DEFAULT_FILTER_WORDS, min_word_length=2,
+                 min_sentence_length=3, corrections=None):
+        self.filter_words = frozenset(turkish_lower(word) for word in filter_words)
+        self.min_word_length = min_word_length
+        self.min_sentence_length = min_sentence_length
+        self.corrections = dict(corrections or {})
+
+    def _normalize(self, text):
+        """Küçük harf, noktalama, boşluk ve tekrar aşamaları"""
+        text = turkish_lower(text)
+        text = self._PUNCTUATION.sub('', text)
+        text = self._WHITESPACE.sub(' ', text)
+        text = self._CHAR_REPEAT.sub(r'\1\1\1', text)
+        return self._WORD_REPEAT.sub(r'\1', text)
+
+    def _filter(self, text):
+        """Kelime filtresi ve minimum uzunluk kontrolü"""
+        min_word_length = self.min_word_length
+        filter_words = self.filter_words
+        result = ' '.join(
+            word for word in text.split()
+            if len(word) >= min_word_length
+            and word not in filter_words
+            # Aynı karakterin çok tekrarını filtrele (örn: "hıhıhıhı...")
+            and not (len(word) > 3 and len(set(word)) == 1)
+        )
+        if len(result) < self.min_sentence_length:
+            return ""
+        return result
+
+    def clean(self, text):
+        """Metni temizle ve filtrele"""
+        if not text:
+            return ""
+        return self._filter(self._normalize(text.strip()))
+
+    def correct(self, text):
+        """Düzeltme sözlüğünü uygula"""
+        if not text or not self.corrections:
+            return text
+        corrections = self.corrections
+        return ' '.join(corrections.get(word, word) for word in text.split())
+
+    def process(self, text):
+        """Tüm aşamaları tek metne uygula"""
+        return self.correct(self.clean(text))
+
+    def process_batch(self, texts):
+        """Metin listesini işle
+
+        Düzenli ifadeler tüm metinlerin satır sonuyla birleştirildiği tek bir
+        dizgeye uygulanır; böylece metin başına çağrı maliyeti ödenmez.
+        """
+        if not texts:
+            return []
+        joined = '\n'.join((text or '').replace('\n', ' ').strip() for text in texts)
+        lines = self._normalize(joined).split('\n')
+        return [self.correct(self._filter(line)) for line in lines]
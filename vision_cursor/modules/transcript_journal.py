@@ -0,0 +1,177 @@
+"""
+VisionCursor Metin Günlüğü
+
+Tanınan her segment geldiği anda, sıra numarası ve zaman damgasıyla oturum
+günlüğüne (JSON satırları) eklenir. append() yalnızca bellekteki kuyruğa
+ekler; kayıtlar günlüğün kendi arka plan iş parçacığında belirli
+aralıklarla dosyaya yazılıp fsync ile diske indirilir. Böylece yavaş
+disklerde arayüz iş parçacığı bloklanmaz ve çökme durumunda en fazla son
+birkaç saniye kaybolur. Dışa aktarma belgeyi bellekte yeniden oluşturmak
+yerine günlükten akış halinde okur. Yeni oturum açılırken en eski
+günlükler silinerek klasördeki oturum sayısı sınırlanır.
+"""
+
+import json
+import os
+import threading
+import time
+
+# Varsayılan günlük klasörü
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".vision_cursor", "transcripts")
+
+
+def read_segments(path, offset=0):
+    """Günlük dosyasındaki kayıtları sırayla döndür (yarım son satır atlanır)"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Çökme sırasında yarım yazılmış satır
+                continue
+
+
+def session_files(directory=DEFAULT_JOURNAL_DIR):
+    """Klasördeki oturum günlükleri, eskiden yeniye"""
+    try:
+        names = sorted(name for name in os.listdir(directory)
+                       if name.startswith('session-') and name.endswith('.jsonl'))
+    except OSError:
+        return []
+    return [os.path.join(directory, name) for name in names]
+
+
+def latest_session(directory=DEFAULT_JOURNAL_DIR):
+    """En son oturum günlüğünün yolu, yoksa None"""
+    sessions = session_files(directory)
+    return sessions[-1] if sessions else None
+
+
+def prune_sessions(directory=DEFAULT_JOURNAL_DIR, keep=50):
+    """En yeni keep oturum dışındaki günlükleri sil, silinen sayısını döndür"""
+    sessions = session_files(directory)
+    removed = 0
+    for path in sessions[:max(len(sessions) - keep, 0)]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError as e:
+            print(f"Eski metin günlüğü silinemedi: {e}")
+    return removed
+
+
+class TranscriptJournal:
+    """Oturum başına yalnızca ekleme yapılan metin günlüğü"""
+
+    def __init__(self, directory=DEFAULT_JOURNAL_DIR, fsync_interval=2.0, buffer_size=64 * 1024,
+                 max_sessions=50):
+        self.directory = directory
+        self.fsync_interval = fsync_interval    # Diske indirme aralığı (saniye)
+        os.makedirs(directory, exist_ok=True)
+        # Yeni oturumla birlikte en fazla max_sessions günlük kalır
+        prune_sessions(directory, keep=max_sessions - 1)
+
+        name = time.strftime("session-%Y%m%d-%H%M%S") + f"-{os.getpid()}.jsonl"
+        self.path = os.path.join(directory, name)
+        self._file = open(self.path, 'ab', buffering=buffer_size)
+        self._lock = threading.Lock()       # Sıra, kuyruk ve konumlar
+        self._io_lock = threading.Lock()    # Dosyaya yazma ve fsync
+
+        self.sequence = 0
+        self._pending = []          # Henüz dosyaya yazılmamış satırlar
+        self._document_offset = 0   # Son "temizle" kaydından sonraki bayt konumu
+        self._offset = 0
+        self._dirty = False
+
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._sync_loop, name="transcript-journal")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+        self._pending.append(line)
+        self._offset += len(line)
+
+    def _append_locked(self, text, kind, action=None):
+        if self._file is None:
+            return None
+        self.sequence += 1
+        record = {'seq': self.sequence, 'time': round(time.time(), 3), 'type': kind, 'text': text}
+        if action is not None:
+            record['action'] = action
+        self._write(record)
+        return self.sequence
+
+    def append(self, text, kind="text", action=None):
+        """Bir segment ekle, sıra numarasını döndür"""
+        with self._lock:
+            return self._append_locked(text, kind, action)
+
+    def mark_clear(self):
+        """Metin temizlendi: dışa aktarma bundan sonraki segmentlerle başlar"""
+        with self._lock:
+            self._append_locked("", "clear")
+            self._document_offset = self._offset
+
+    def _sync_loop(self):
+        while not self._stop_event.wait(self.fsync_interval):
+            try:
+                self.sync()
+            except OSError as e:
+                print(f"Metin günlüğü yazma hatası: {e}")
+
+    def _drain(self):
+        """Kuyruktaki satırları dosyaya yaz (_io_lock tutulurken çağrılır)"""
+        with self._lock:
+            lines, self._pending = self._pending, []
+        if self._file is None or not lines:
+            return
+        self._file.write(b''.join(lines))
+        self._dirty = True
+
+    def sync(self):
+        """Kuyruğu dosyaya yaz ve diske indir (arka plan iş parçacığında çağrılır)"""
+        with self._io_lock:
+            self._drain()
+            if self._file is None or not self._dirty:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._dirty = False
+
+    def segments(self):
+        """Geçerli belgenin (son temizlemeden sonraki) metin segmentleri"""
+        with self._io_lock:
+            self._drain()
+            if self._file is not None:
+                self._file.flush()
+            with self._lock:
+                offset = self._document_offset
+        for record in read_segments(self.path, offset):
+            if record.get('type') == "text":
+                yield record
+
+    def export(self, path, chunk_size=64 * 1024):
+        """Geçerli belgeyi günlükten akış halinde düz metin dosyasına yaz"""
+        count = 0
+        with open(path, 'w', encoding='utf-8', buffering=chunk_size) as out:
+            for record in self.segments():
+                out.write(f"{record['text']} ")
+                count += 1
+        return count
+
+    def close(self):
+        self._stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        with self._io_lock:
+            if self._file is None:
+                return
+            self._drain()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            with self._lock:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VisionCursor Bakış Parametre Taraması
+
+Yumuşatma, sabit bakış ve tıklama ayarlarını etiketli kayıtlar üzerinde
+tarar. FaceMesh çıktısı nokta önbelleğinden okunur (önbellekte olmayan
+videolar önce bir kez işlenir); her yapılandırma süreç havuzunda yalnızca
+yumuşatma, eşleme ve tıklama aşamalarından geçirilir. Yapılandırmalar
+gecikme, titreme ve yanlış/kaçan tıklama oranına göre sıralanır, en iyisi
+config.ini [eye_tracking] bölümüne yazılır (yorumlar korunur).
+
+Etiket dosyası video ile aynı adda .csv'dir: frame,x,y[,t][,click]
+(bkz. modules/gaze_metrics.py).
+
+Kullanım:
+    python sweep_gaze.py kayitlar/*.mp4 --space smooth_factor=2,4,8 --space frame_skip=1,2
+    python sweep_gaze.py kayit.mp4 --space gaze_threshold=1.0:3.0 --random 200 --dry-run
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modules.config_file import update_config
+from modules.gaze_metrics import load_labels
+from modules.gaze_sweep import DEFAULT_WEIGHTS, PARAMETERS, grid_configs, parse_space, random_configs, sweep
+from modules.landmark_cache import DEFAULT_CACHE_DIR, LandmarkCache
+from modules.offline_gaze import cache_settings, make_tracker, process_files
+from modules.settings import load_settings
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.ini")
+
+
+def read_base(config_path):
+    """config.ini [eye_tracking] bölümündeki taranabilir ayarlar"""
+    settings, errors = load_settings(config_path)
+    for error in errors:
+        print(f"Yapılandırma hatası: {error}")
+    return {name: settings['eye_tracking'][name] for name in PARAMETERS}
+
+
+def format_metric(value, digits=1):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Etiketli kayıtlarda bakış parametre taraması")
+    parser.add_argument('videos', nargs='+', help="Video dosyaları")
+    parser.add_argument('--labels', nargs='+', help="Etiket dosyaları (varsayılan: <video>.csv)")
+    parser.add_argument('--space', action='append', default=[],
+                        help="ad=1,2,3 (ızgara) ya da ad=alt:üst (rastgele); birden çok verilebilir")
+    parser.add_argument('--random', type=int, default=0,
+                        help="Izgara yerine bu kadar rastgele yapılandırma dene")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--screen', default="1920x1080", help="İmleç koordinatları için ekran boyutu")
+    parser.add_argument('--tolerance', type=float, default=50.0, help="Yerleşme toleransı (piksel)")
+    parser.add_argument('--hold', type=int, default=3, help="Yerleşmiş sayılmak için gereken kare")
+    parser.add_argument('--click-window', type=float, default=1.0,
+                        help="Etiketli tıklamadan sonra doğru sayılan süre (saniye)")
+    parser.add_argument('--latency-weight', type=float, default=DEFAULT_WEIGHTS['latency'])
+    parser.add_argument('--jitter-weight', type=float, default=DEFAULT_WEIGHTS['jitter'])
+    parser.add_argument('--false-click-weight', type=float, default=DEFAULT_WEIGHTS['false_clicks'])
+    parser.add_argument('--missed-click-weight', type=float, default=DEFAULT_WEIGHTS['missed_clicks'])
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Yüz noktası önbelleği klasörü")
+    parser.add_argument('--chunk-frames', type=int, default=900)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--no-flip', action='store_true', help="Kayıt zaten ayna görüntüsüyse")
+    parser.add_argument('--top', type=int, default=10, help="Gösterilecek sonuç sayısı")
+    parser.add_argument('--output', help="Tüm sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--config', default=CONFIG_PATH, help="En iyi ayarların yazılacağı config.ini")
+    parser.add_argument('--dry-run', action='store_true', help="config.ini dosyasını değiştirme")
+    args = parser.parse_args()
+
+    labels_paths = args.labels or [f"{os.path.splitext(path)[0]}.csv" for path in args.videos]
+    if len(labels_paths) != len(args.videos):
+        parser.error("--labels video sayısı kadar dosya içermeli")
+    if not args.space:
+        parser.error("En az bir --space gerekli")
+    try:
+        space = parse_space(args.space)
+        configs = random_configs(space, args.random, args.seed) if args.random else grid_configs(space)
+    except ValueError as e:
+        parser.error(str(e))
+
+    width, height = (int(value) for value in args.screen.lower().split('x'))
+    flip = not args.no_flip
+    cache = LandmarkCache(args.cache_dir)
+    settings = cache_settings(make_tracker((width, height)), flip, args.chunk_frames, args.warmup)
+
+    # Önbellekte olmayan videoları bir kez FaceMesh'ten geçir
+    missing = [path for path in args.videos if cache.load(path, settings) is None]
+    if missing:
+        print(f"{len(missing)} video için yüz noktaları çıkarılıyor...")
+        process_files(missing, workers=args.workers, chunk_frames=args.chunk_frames,
+                      warmup=args.warmup, screen_size=(width, height), flip=flip, cache=cache,
+                      progress=lambda done, total: print(f"\rBölüm {done}/{total}", end='', flush=True))
+        print()
+
+    recordings = [(cache.load(path, settings).directory, load_labels(labels))
+                  for path, labels in zip(args.videos, labels_paths)]
+    base = read_base(args.config)
+    weights = {
+        'latency': args.latency_weight,
+        'jitter': args.jitter_weight,
+        'false_clicks': args.false_click_weight,
+        'missed_clicks': args.missed_click_weight,
+    }
+
+    def progress(done, total):
+        print(f"\rYapılandırma {done}/{total}", end='', flush=True)
+
+    start = time.perf_counter()
+    results = sweep(recordings, configs, base=base, workers=args.workers, screen_size=(width, height),
+                    tolerance=args.tolerance, hold=args.hold, click_window=args.click_window,
+                    weights=weights, progress=progress)
+    elapsed = time.perf_counter() - start
+    print()
+    print(f"{len(results)} yapılandırma, {elapsed:.1f} s")
+
+    print(f"{'puan':>8} {'gecikme ms':>11} {'titreme px':>11} {'yanlış/dk':>10} {'kaçan':>6}  ayarlar")
+    for result in results[:args.top]:
+        settings_text = ", ".join(f"{name}={value:g}" if isinstance(value, float) else f"{name}={value}"
+                                  for name, value in result['config'].items())
+        print(f"{format_metric(result['score'], 2):>8} {format_metric(result['latency_ms']):>11} "
+              f"{format_metric(result['jitter_px'], 2):>11} "
+              f"{format_metric(result['false_clicks_per_min'], 2):>10} "
+              f"{result['missed_click_rate']:>6.2f}  {settings_text}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'base': base, 'weights': weights, 'results': results}, f,
+                      ensure_ascii=False, indent=2, default=str)
+        print(f"Sonuçlar yazıldı: {args.output}")
+
+    best = results[0] if results else None
+    if best is None or best['score'] == float('inf'):
+        print("Ölçülebilir yapılandırma bulunamadı; config.ini değiştirilmedi")
+        return
+    if args.dry_run:
+        print(f"En iyi ayarlar (yazılmadı): {best['config']}")
+        return
+    update_config(args.config, 'eye_tracking', best['config'])
+    print(f"En iyi ayarlar {args.config} dosyasına yazıldı: {best['config']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -74,7 +74,9 @@ def test_speech_recognition():
     
     recognized_texts = []
     
-    def speech_callback(text, is_command=False, command=None):
+    def speech_callback(text, is_command=False, command=None, is_partial=False, stable_text=""):
+        if is_partial:
+            return
         if is_command:
             print(f"Komut algılandı: {command}")
         else: